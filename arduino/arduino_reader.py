@@ -6,12 +6,19 @@ import socket
 from PySide6.QtCore import QThread, Signal
 from typing import Optional, Dict, List
 
+from arduino.stream_framer import StreamFramer
+from arduino.telemetry import Telemetry
+from arduino.binary_protocol import (
+    BinaryFrameDecoder, PROTOCOL_BINARY, detect_protocol
+)
+
 
 class ConnectionType:
     """Bağlantı tipi enum"""
     USB = "usb"
     WIFI = "wifi"
     BLUETOOTH = "bluetooth"
+    REPLAY = "replay"  # Kayıt oynatma (TelemetryReplay)
 
 
 class ArduinoReader(QThread):
@@ -21,9 +28,10 @@ class ArduinoReader(QThread):
     - USB Serial bağlantı
     - WiFi TCP/IP bağlantı
     - Bluetooth bağlantı
+    - Metin / ikili protokol otomatik algılama (bağlantı başına)
     """
     
-    data_received = Signal(dict)
+    data_received = Signal(object)  # Telemetry (kopyalanmadan iletilir)
     connection_status = Signal(str)  # "connected", "disconnected", "error"
     error_message = Signal(str)
     
@@ -45,6 +53,28 @@ class ArduinoReader(QThread):
         self.bt_address = kwargs.get('bt_address', None)
         self.bt_port = kwargs.get('bt_port', 1)
         
+        # Metin protokolü için satır ayırıcı
+        self.framer = StreamFramer()
+        
+        # İkili protokol çözücü
+        self.binary_decoder = BinaryFrameDecoder()
+        
+        # Protokol: None = ilk byte'lardan otomatik algıla,
+        # PROTOCOL_TEXT / PROTOCOL_BINARY = zorla
+        self.forced_protocol = kwargs.get('protocol', None)
+        self.protocol = self.forced_protocol
+        self._detect_buffer = bytearray()
+        
+        # Posta kutusu modu: verilirse her frame sinyal yerine buraya yazılır
+        # (arayüz ekran yenileme hızında en güncel değeri çeker)
+        self.mailbox = kwargs.get('mailbox', None)
+        
+        # Geçmiş: verilirse her frame halka tampona da eklenir (TelemetryHistory)
+        self.history = kwargs.get('history', None)
+        
+        # Disk kaydı: verilirse her frame kayıt kuyruğuna eklenir (TelemetryRecorder)
+        self.recorder = kwargs.get('recorder', None)
+        
         # Otomatik port algılama
         if self.connection_type == ConnectionType.USB and not self.port:
             self.port = self.auto_detect_port()
@@ -164,26 +194,61 @@ class ArduinoReader(QThread):
             #self.connection_status.emit("error")
             #return False
     
-    def read_line(self) -> str:
-        """Bağlantı tipine göre veri okuma"""
+    def read_chunk(self):
+        """
+        Bağlantı tipine göre ham veri okuma
+        Bir okuma birden fazla (veya yarım) frame içerebilir
+        """
         try:
             if self.connection_type == ConnectionType.USB:
-                return self.connection.readline().decode('utf-8', errors='ignore').strip()
+                # Bekleyen tüm byte'ları al (yoksa ilk byte için timeout kadar bekle)
+                return self.connection.read(self.connection.in_waiting or 1)
             
-            elif self.connection_type == ConnectionType.WIFI:
-                data = self.connection.recv(1024).decode('utf-8', errors='ignore')
-                return data.strip()
-            
-            elif self.connection_type == ConnectionType.BLUETOOTH:
-                data = self.connection.recv(1024).decode('utf-8', errors='ignore')
-                return data.strip()
+            elif self.connection_type in [ConnectionType.WIFI, ConnectionType.BLUETOOTH]:
+                return self.framer.read_chunk(self.connection)
             
+        except socket.timeout:
+            return b''
+        except ConnectionError:
+            # Karşı taraf kapattı - run döngüsü bağlantıyı kapatsın
+            raise
         except Exception as e:
-            return ""
+            return b''
         
-        return ""
+        return b''
     
-    def parse_arduino_data(self, line: str) -> Optional[Dict]:
+    def decode_frames(self, data) -> List[Telemetry]:
+        """
+        Ham veriyi bağlantının protokolüne göre çöz
+        Protokol belirlenene kadar gelen byte'lar biriktirilir, karar
+        verilince seçilen çözücüye aktarılır.
+        """
+        if not data:
+            return []
+        
+        if self.protocol is None:
+            buffer = self._detect_buffer
+            buffer += data
+            protocol = detect_protocol(buffer)
+            if protocol is None:
+                return []
+            
+            self.protocol = protocol
+            data = bytes(buffer)
+            buffer.clear()
+            print(f"Arduino protokolü: {protocol}")
+        
+        if self.protocol == PROTOCOL_BINARY:
+            return self.binary_decoder.feed(data)
+        
+        frames = []
+        for line in self.framer.feed(data):
+            frame = self.parse_arduino_data(line)
+            if frame:
+                frames.append(frame)
+        return frames
+    
+    def parse_arduino_data(self, line: str) -> Optional[Telemetry]:
         """
         Arduino'dan gelen yeni serial formatı parse eder
         Format: mode/far/durum/far2/vites/sinyallambasi/dortlu/sinyalsol/sinyalsag/
@@ -198,28 +263,14 @@ class ArduinoReader(QThread):
             if len(parts) < 15:
                 return None
             
-            data = {
-                'mode': int(parts[0]),              # 0=Eco, 1=Normal, 2=Sport
-                'far': int(parts[1]),               # 0=Off, 1=Auto, 2=On
-                'durum': int(parts[2]),             # 0=Off, 1=On, 2=Acc
-                'far2': int(parts[3]),              # 0=Off, 1=Uzun, 2=Sis
-                'vites': int(parts[4]),             # 0=Neutral, 1=İleri, 2=Geri
-                'sinyallambasi': int(parts[5]),     # 0=Off, 1=On
-                'dortlu': int(parts[6]),            # 0=Off, 1=On
-                'sinyalsol': int(parts[7]),         # 0=Off, 1=On
-                'sinyalsag': int(parts[8]),         # 0=Off, 1=On
-                'speed_kmh_1': float(parts[9]),     # Sol motor hızı
-                'speed_kmh_2': float(parts[10]),    # Sağ motor hızı
-                'direksiyonaci': float(parts[11]),  # Direksiyon açısı
-                'solGazYuzdesi': int(parts[12]),    # Sol motor gaz %
-                'sagGazYuzdesi': int(parts[13]),    # Sağ motor gaz %
-                'EDS_AKTIF': int(parts[14])         # EDS aktif mi? 0/1
-            }
-            
-            # Ortalama hız hesapla
-            data['avg_speed'] = (data['speed_kmh_1'] + data['speed_kmh_2']) / 2.0
-            
-            return data
+            # Alan anlamları için bkz. Telemetry (ortalama hız orada hesaplanır)
+            return Telemetry.create(
+                int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3]),
+                int(parts[4]), int(parts[5]), int(parts[6]), int(parts[7]),
+                int(parts[8]),
+                float(parts[9]), float(parts[10]), float(parts[11]),
+                int(parts[12]), int(parts[13]), int(parts[14])
+            )
             
         except (ValueError, IndexError) as e:
             self.error_message.emit(f"Veri parse hatası: {str(e)} - Line: {line}")
@@ -242,14 +293,18 @@ class ArduinoReader(QThread):
             return
         
         # Veri okuma döngüsü
+        self.reset_decoders()
         while self.running:
             try:
-                line = self.read_line()
-                
-                if line:
-                    data = self.parse_arduino_data(line)
+                for data in self.decode_frames(self.read_chunk()):
+                    if self.history is not None:
+                        self.history.append(data)
+                    if self.recorder is not None:
+                        self.recorder.record(data)
                     
-                    if data:
+                    if self.mailbox is not None:
+                        self.mailbox.put(data)
+                    else:
                         self.data_received.emit(data)
                 
             except Exception as e:
@@ -258,6 +313,13 @@ class ArduinoReader(QThread):
         
         self.close_connection()
     
+    def reset_decoders(self):
+        """Yeni bağlantı için tamponları ve protokol kararını sıfırla"""
+        self.framer.reset()
+        self.binary_decoder.reset()
+        self._detect_buffer.clear()
+        self.protocol = self.forced_protocol
+    
     def close_connection(self):
         """Bağlantıyı kapat"""
         try:
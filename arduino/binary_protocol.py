@@ -0,0 +1,192 @@
+"""
+İkili (binary) telemetri protokolü
+Metin formatındaki 15 alanlı '/' ayrılmış satır (~45-60 byte) yerine sabit
+düzenli 22 byte'lık frame kullanır. Frame tek bir önceden derlenmiş
+struct.Struct ile çözülür, satır bölme ve 15 ayrı int()/float() dönüşümü yoktur.
+
+Frame düzeni (little-endian):
+    0   2   SYNC            0xAA 0x55
+    2   9   uint8 x 9       mode, far, durum, far2, vites, sinyallambasi,
+                            dortlu, sinyalsol, sinyalsag
+    11  6   int16 x 3       speed_kmh_1, speed_kmh_2, direksiyonaci (x100)
+    17  3   uint8 x 3       solGazYuzdesi, sagGazYuzdesi, EDS_AKTIF
+    20  2   uint16          CRC-16/CCITT (0xFFFF başlangıç) - byte 2..19
+
+Metin satırları 0xAA byte'ı içeremeyeceği için bağlantının ilk byte'larına
+bakarak protokol otomatik seçilir (detect_protocol); yalnızca metin gönderen
+eski firmware değişiklik gerektirmeden çalışmaya devam eder.
+"""
+
+import struct
+from binascii import crc_hqx
+from typing import Dict, List, Optional
+
+from arduino.telemetry import Telemetry
+
+
+PROTOCOL_TEXT = "text"
+PROTOCOL_BINARY = "binary"
+
+SYNC = b'\xAA\x55'
+
+# Frame'deki alanlar (Telemetry sırası, avg_speed hariç)
+FIELDS = Telemetry._fields[:15]
+
+# Ondalıklı alanların ölçeği (int16 / 100)
+SCALE = 100.0
+
+# Frame içeriği (SYNC ve CRC hariç) - kayıt dosyaları da aynı düzeni kullanır
+PAYLOAD = struct.Struct('<9B3h3B')
+
+FRAME = struct.Struct('<2s' + PAYLOAD.format[1:] + 'H')
+FRAME_SIZE = FRAME.size               # 22
+CRC_START = len(SYNC)
+CRC_END = FRAME_SIZE - 2
+
+# Bu kadar veri gelip karar verilemezse metin varsayılır
+DETECT_LIMIT = 512
+
+
+def frame_crc(payload) -> int:
+    """Payload'ın CRC-16/CCITT değeri"""
+    return crc_hqx(payload, 0xFFFF)
+
+
+def payload_values(data: Dict) -> tuple:
+    """Telemetri alanlarını PAYLOAD değerlerine çevir (ondalıklılar x100)"""
+    return (
+        data['mode'], data['far'], data['durum'], data['far2'], data['vites'],
+        data['sinyallambasi'], data['dortlu'], data['sinyalsol'], data['sinyalsag'],
+        round(data['speed_kmh_1'] * SCALE),
+        round(data['speed_kmh_2'] * SCALE),
+        round(data['direksiyonaci'] * SCALE),
+        data['solGazYuzdesi'], data['sagGazYuzdesi'], data['EDS_AKTIF']
+    )
+
+
+def telemetry_from_payload(values) -> Telemetry:
+    """PAYLOAD değerlerinden Telemetry oluştur"""
+    speed_1 = values[9] / SCALE
+    speed_2 = values[10] / SCALE
+    return Telemetry._make((
+        *values[:9],
+        speed_1, speed_2, values[11] / SCALE,
+        *values[12:15],
+        (speed_1 + speed_2) / 2.0
+    ))
+
+
+def encode_frame(data: Dict) -> bytes:
+    """
+    Referans kodlayıcı (firmware ile aynı düzen)
+    Test ve benchmark için sahte Arduino akışı üretmekte kullanılır.
+    """
+    frame = bytearray(FRAME.pack(SYNC, *payload_values(data), 0))
+    struct.pack_into('<H', frame, CRC_END, frame_crc(frame[CRC_START:CRC_END]))
+    return bytes(frame)
+
+
+def find_valid_frame(buffer) -> bool:
+    """Tamponda CRC'si doğru en az bir ikili frame var mı"""
+    index = buffer.find(SYNC)
+    while 0 <= index <= len(buffer) - FRAME_SIZE:
+        if frame_crc(buffer[index + CRC_START:index + CRC_END]) == \
+                FRAME.unpack_from(buffer, index)[-1]:
+            return True
+        index = buffer.find(SYNC, index + 1)
+    return False
+
+
+def is_text_line(buffer, start, end) -> bool:
+    """buffer[start:end] tam bir metin telemetri satırı gibi görünüyor mu"""
+    return (buffer.find(SYNC[:1], start, end) < 0
+            and buffer.count(b'/', start, end) >= len(FIELDS) - 1)
+
+
+def detect_protocol(buffer) -> Optional[str]:
+    """
+    Bağlantının ilk byte'larından protokolü belirle
+    Karar için yeterli veri yoksa None döner.
+    """
+    if find_valid_frame(buffer):
+        return PROTOCOL_BINARY
+
+    # Tam bir metin satırı (sync byte'ı olmadan) geldiyse metin. Bağlantı satır
+    # ortasında açıldıysa ilk parça eksiktir; ilk '\n'den sonraki tam satıra bakılır
+    start = 0
+    for _ in range(2):
+        end = buffer.find(b'\n', start)
+        if end < 0:
+            break
+        if is_text_line(buffer, start, end):
+            return PROTOCOL_TEXT
+        start = end + 1
+
+    if len(buffer) >= DETECT_LIMIT:
+        return PROTOCOL_TEXT
+
+    return None
+
+
+class BinaryFrameDecoder:
+    """
+    Artımlı ikili frame çözücü
+    - Akışta SYNC arar, CRC'yi doğrular ve frame'i tek unpack ile çözer
+    - Bozuk frame atlanır, bir sonraki SYNC'ten devam edilir
+    - Yarım frame bir sonraki feed() çağrısında tamamlanır
+    """
+
+    def __init__(self):
+        self._pending = bytearray()
+
+        # İstatistikler
+        self.frames_total = 0
+        self.bytes_total = 0
+        self.crc_errors = 0
+
+    def feed(self, data) -> List[Telemetry]:
+        """Gelen byte'ları tampona ekle ve çözülen frame'leri döndür"""
+        self.bytes_total += len(data)
+        pending = self._pending
+        pending += data
+
+        frames = []
+        make = Telemetry._make
+        unpack_from = FRAME.unpack_from
+        find = pending.find
+        last = len(pending) - FRAME_SIZE
+        position = 0
+
+        while True:
+            index = find(SYNC, position)
+            if index < 0:
+                # Son byte bir sonraki SYNC'in başı olabilir
+                position = max(position, len(pending) - 1)
+                break
+            if index > last:
+                position = index
+                break
+
+            values = unpack_from(pending, index)
+            if frame_crc(pending[index + CRC_START:index + CRC_END]) != values[-1]:
+                self.crc_errors += 1
+                position = index + 1
+                continue
+
+            speed_1 = values[10] / SCALE
+            speed_2 = values[11] / SCALE
+            frames.append(make((
+                *values[1:10],
+                speed_1, speed_2, values[12] / SCALE,
+                *values[13:16],
+                (speed_1 + speed_2) / 2.0
+            )))
+            position = index + FRAME_SIZE
+
+        del pending[:position]
+        self.frames_total += len(frames)
+        return frames
+
+    def reset(self):
+        """Tamponu temizle (yeni bağlantı için)"""
+        self._pending.clear()
@@ -0,0 +1,90 @@
+"""
+Akış tabanlı çerçeve (frame) ayırıcı
+WiFi/Bluetooth soketlerinden gelen byte akışını satırlara böler.
+Bir recv() çağrısı birden fazla frame ya da yarım frame içerebilir,
+bu yüzden tamamlanmamış veri bir sonraki okumaya kadar saklanır.
+"""
+
+from typing import List
+
+
+class StreamFramer:
+    """
+    Kalıcı alım tamponlu, artımlı satır ayırıcı
+    - recv_into ile önceden ayrılmış bytearray'e okuma (okuma başına ayırma yok)
+    - Her okumada tamamlanan tüm satırları döndürür
+    - Yarım kalan frame bir sonraki okumada tamamlanır
+    """
+
+    def __init__(self, buffer_size: int = 4096, delimiter: bytes = b'\n',
+                 max_frame_size: int = 1024):
+        self.delimiter = delimiter
+        self.max_frame_size = max_frame_size
+
+        # recv_into için sabit tampon
+        self._recv_buffer = bytearray(buffer_size)
+        self._recv_view = memoryview(self._recv_buffer)
+
+        # Tamamlanmamış (yarım) frame verisi
+        self._pending = bytearray()
+
+        # İstatistikler
+        self.frames_total = 0
+        self.bytes_total = 0
+        self.overflow_count = 0
+
+    def read_from(self, sock) -> List[str]:
+        """
+        Soketten bir kez oku ve tamamlanan satırları döndür
+        Karşı taraf bağlantıyı kapattıysa ConnectionError fırlatır
+        """
+        return self.feed(self.read_chunk(sock))
+
+    def read_chunk(self, sock):
+        """
+        Soketten bir kez ham veri oku (sabit tampon üzerinde görünüm döner,
+        bir sonraki okumaya kadar geçerlidir)
+        Karşı taraf bağlantıyı kapattıysa ConnectionError fırlatır
+        """
+        if hasattr(sock, 'recv_into'):
+            count = sock.recv_into(self._recv_buffer)
+            data = self._recv_view[:count]
+        else:
+            # recv_into desteklemeyen soketler (ör. PyBluez)
+            data = sock.recv(len(self._recv_buffer))
+            count = len(data)
+
+        if count == 0:
+            raise ConnectionError("Bağlantı karşı taraf tarafından kapatıldı")
+
+        return data
+
+    def feed(self, data) -> List[str]:
+        """Gelen byte'ları tampona ekle ve tamamlanan satırları döndür"""
+        self.bytes_total += len(data)
+        pending = self._pending
+        pending += data
+
+        end = pending.rfind(self.delimiter)
+        if end < 0:
+            # Ayırıcı yok - taşma kontrolü (bozuk akışta sınırsız büyümesin)
+            if len(pending) > self.max_frame_size:
+                self.overflow_count += 1
+                pending.clear()
+            return []
+
+        complete = pending[:end]
+        del pending[:end + len(self.delimiter)]
+
+        lines = []
+        for raw in complete.split(self.delimiter):
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if line:
+                lines.append(line)
+
+        self.frames_total += len(lines)
+        return lines
+
+    def reset(self):
+        """Tamponu temizle (yeni bağlantı için)"""
+        self._pending.clear()
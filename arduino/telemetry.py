@@ -0,0 +1,80 @@
+"""
+Telemetri kaydı
+Her frame için 16 anahtarlı sözlük yerine değiştirilemez, slotlu bir kayıt
+(NamedTuple) kullanılır. Alanlara öznitelik olarak erişilir (data.vites),
+ortalama hız oluşturulurken bir kez hesaplanır.
+
+Eski tüketiciler için sözlük uyumlu erişim korunur:
+data['vites'], data.get('vites'), 'vites' in data, keys(), items().
+Sözlükten farklı olarak üzerinde dolaşmak (for x in data) değerleri verir.
+"""
+
+from typing import NamedTuple
+
+
+class Telemetry(NamedTuple):
+    """Tek telemetri frame'i"""
+    mode: int               # 0=Eco, 1=Normal, 2=Sport
+    far: int                # 0=Off, 1=Auto, 2=On
+    durum: int              # 0=Off, 1=On, 2=Acc
+    far2: int               # 0=Off, 1=Uzun, 2=Sis
+    vites: int              # 0=Neutral, 1=İleri, 2=Geri
+    sinyallambasi: int      # 0=Off, 1=On
+    dortlu: int             # 0=Off, 1=On
+    sinyalsol: int          # 0=Off, 1=On
+    sinyalsag: int          # 0=Off, 1=On
+    speed_kmh_1: float      # Sol motor hızı
+    speed_kmh_2: float      # Sağ motor hızı
+    direksiyonaci: float    # Direksiyon açısı
+    solGazYuzdesi: int      # Sol motor gaz %
+    sagGazYuzdesi: int      # Sağ motor gaz %
+    EDS_AKTIF: int          # EDS aktif mi? 0/1
+    avg_speed: float        # (speed_kmh_1 + speed_kmh_2) / 2
+
+    @classmethod
+    def create(cls, mode, far, durum, far2, vites, sinyallambasi, dortlu,
+               sinyalsol, sinyalsag, speed_kmh_1, speed_kmh_2, direksiyonaci,
+               solGazYuzdesi, sagGazYuzdesi, EDS_AKTIF) -> 'Telemetry':
+        """Ham alanlardan kayıt oluştur (ortalama hız burada hesaplanır)"""
+        return cls(mode, far, durum, far2, vites, sinyallambasi, dortlu,
+                   sinyalsol, sinyalsag, speed_kmh_1, speed_kmh_2, direksiyonaci,
+                   solGazYuzdesi, sagGazYuzdesi, EDS_AKTIF,
+                   (speed_kmh_1 + speed_kmh_2) / 2.0)
+
+    # --- Sözlük uyumlu erişim (eski tüketiciler için) ---
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            try:
+                key = _FIELD_INDEX[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return key in _FIELD_INDEX
+
+    def get(self, key, default=None):
+        """dict.get karşılığı"""
+        index = _FIELD_INDEX.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self):
+        """Alan adları"""
+        return self._fields
+
+    def values(self):
+        """Alan değerleri"""
+        return tuple(self)
+
+    def items(self):
+        """(alan, değer) çiftleri"""
+        return zip(self._fields, self)
+
+    def to_dict(self) -> dict:
+        """Düz sözlük kopyası"""
+        return dict(zip(self._fields, self))
+
+
+# Alan adı -> tuple indeksi (sözlük uyumlu erişim için)
+_FIELD_INDEX = {name: index for index, name in enumerate(Telemetry._fields)}
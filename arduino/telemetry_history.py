@@ -0,0 +1,176 @@
+"""
+Telemetri geçmişi (halka tampon)
+Son N dakikanın tüm alanlarını sabit kapasiteli bir NumPy yapılandırılmış
+dizisinde tutar. Ekleme O(1)'dir ve örnek başına Python nesnesi saklanmaz;
+bellek kullanımı kapasite ile sınırlıdır (örnek başına HISTORY_DTYPE.itemsize).
+
+Tüketiciler (grafik, analiz, kayıt) veriyi kopyalamadan, tamponun üzerinde
+görünüm (view) olarak okur. Halka sarıldığında bir pencere en fazla iki
+parçadan oluşur; parçalar her zaman eskiden yeniye sıralıdır.
+"""
+
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from arduino.telemetry import Telemetry
+
+
+# Alan tipleri Telemetry sırasıyla aynıdır, başa zaman damgası eklenir.
+# Tamsayı alanlar metin parser'ının kabul ettiği değerleri (ör. gaz 300
+# ya da -1) taşmadan tutabilmek için işaretli 32 bittir.
+HISTORY_DTYPE = np.dtype([
+    ('timestamp', 'f8'),        # time.time()
+    ('mode', 'i4'),
+    ('far', 'i4'),
+    ('durum', 'i4'),
+    ('far2', 'i4'),
+    ('vites', 'i4'),
+    ('sinyallambasi', 'i4'),
+    ('dortlu', 'i4'),
+    ('sinyalsol', 'i4'),
+    ('sinyalsag', 'i4'),
+    ('speed_kmh_1', 'f4'),
+    ('speed_kmh_2', 'f4'),
+    ('direksiyonaci', 'f4'),
+    ('solGazYuzdesi', 'i4'),
+    ('sagGazYuzdesi', 'i4'),
+    ('EDS_AKTIF', 'i4'),
+    ('avg_speed', 'f4'),
+])
+
+# Varsayılan: 100 Hz akışta 5 dakika (~2 MB)
+DEFAULT_RATE_HZ = 100
+DEFAULT_MINUTES = 5.0
+
+
+class TelemetryHistory:
+    """
+    Sabit kapasiteli, sütun erişimli telemetri halka tamponu
+    - append(): okuma thread'inden her frame için çağrılır
+    - segments() / since() / field(): kopyasız görünümler (en fazla 2 parça)
+    - latest(): tek parça dizi (yalnızca halka sarılmışsa kopyalar)
+
+    Görünümler tamponun kendisini gösterir; kapasite kadar yeni örnek
+    eklendiğinde üzerine yazılır. Uzun süre saklanacak veri kopyalanmalıdır.
+    """
+
+    def __init__(self, capacity: int = int(DEFAULT_MINUTES * 60 * DEFAULT_RATE_HZ)):
+        if capacity <= 0:
+            raise ValueError("Kapasite pozitif olmalı")
+
+        self.capacity = int(capacity)
+        self._data = np.zeros(self.capacity, dtype=HISTORY_DTYPE)
+        self._lock = threading.Lock()
+
+        # Bir sonraki yazma konumu ve toplam eklenen örnek sayısı
+        self._index = 0
+        self.total = 0
+        # Alan tiplerine sığmadığı için eklenemeyen frame sayısı
+        self.rejected = 0
+
+    @classmethod
+    def for_duration(cls, minutes: float = DEFAULT_MINUTES,
+                     rate_hz: float = DEFAULT_RATE_HZ) -> 'TelemetryHistory':
+        """Belirtilen süre ve frame hızına yetecek kapasiteyle oluştur"""
+        return cls(max(1, int(minutes * 60 * rate_hz)))
+
+    @property
+    def nbytes(self) -> int:
+        """Tamponun bellek kullanımı (byte)"""
+        return self._data.nbytes
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, record: Telemetry, timestamp: Optional[float] = None) -> bool:
+        """
+        Bir frame ekle (doluysa en eski örneğin üzerine yazılır)
+        Alan tiplerine sığmayan frame atlanır ve sayılır; okuma döngüsüne
+        hiçbir zaman hata fırlatmaz.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            index = self._index
+            try:
+                self._data[index] = (timestamp,) + tuple(record)
+            except (OverflowError, ValueError, TypeError):
+                self.rejected += 1
+                return False
+            index += 1
+            self._index = 0 if index == self.capacity else index
+            self.total += 1
+        return True
+
+    def clear(self):
+        """Geçmişi boşalt (bellek yeniden ayrılmaz)"""
+        with self._lock:
+            self._index = 0
+            self.total = 0
+
+    def segments(self, count: Optional[int] = None) -> List[np.ndarray]:
+        """
+        Son count örneğin (None: tümü) kopyasız görünümleri
+        Eskiden yeniye sıralı 0, 1 veya 2 parça döner.
+        """
+        with self._lock:
+            size = min(self.total, self.capacity)
+            end = self._index
+
+        if count is not None:
+            size = min(size, max(0, int(count)))
+        if size == 0:
+            return []
+
+        start = end - size
+        if start >= 0:
+            return [self._data[start:end]]
+
+        # Halka sarılmış: kuyruk + baş
+        segments = [self._data[start:]]
+        if end > 0:
+            segments.append(self._data[:end])
+        return segments
+
+    def since(self, timestamp: float) -> List[np.ndarray]:
+        """Zaman damgası timestamp ve sonrası olan örneklerin görünümleri"""
+        result = []
+        for segment in self.segments():
+            first = int(np.searchsorted(segment['timestamp'], timestamp, side='left'))
+            if first < len(segment):
+                result.append(segment[first:])
+        return result
+
+    def window(self, seconds: float) -> List[np.ndarray]:
+        """En yeni örnekten geriye seconds saniyelik pencere"""
+        newest = self.last()
+        if newest is None:
+            return []
+        return self.since(float(newest['timestamp']) - seconds)
+
+    def field(self, name: str, count: Optional[int] = None) -> List[np.ndarray]:
+        """Tek alanın (ör. 'avg_speed') kopyasız görünümleri"""
+        return [segment[name] for segment in self.segments(count)]
+
+    def latest(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Son count örnek tek parça dizi olarak
+        Halka sarılmamışsa görünüm, sarılmışsa birleştirilmiş kopya döner.
+        """
+        segments = self.segments(count)
+        if not segments:
+            return self._data[:0]
+        if len(segments) == 1:
+            return segments[0]
+        return np.concatenate(segments)
+
+    def last(self) -> Optional[np.void]:
+        """En yeni örnek (yoksa None)"""
+        with self._lock:
+            if self.total == 0:
+                return None
+            return self._data[self._index - 1]
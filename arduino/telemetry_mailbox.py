@@ -0,0 +1,64 @@
+"""
+Son-değer posta kutusu (latest-value mailbox)
+Okuma thread'i her frame'de anlık görüntüyü üzerine yazar,
+arayüz ekran yenileme hızında yalnızca en güncel değeri çeker.
+Böylece yüksek frekanslı veri Qt olay kuyruğunu şişirmez.
+"""
+
+import threading
+from typing import Optional
+
+from arduino.telemetry import Telemetry
+
+
+class TelemetryMailbox:
+    """
+    Thread-safe tek slotlu veri kutusu
+    - put(): okuma thread'inden çağrılır, önceki değerin üzerine yazar
+    - take(): arayüz thread'inden çağrılır, yeni veri yoksa None döner
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = None
+        self._has_new = False
+
+        # Sayaçlar
+        self.frames_received = 0
+        self.frames_rendered = 0
+
+    def put(self, data):
+        """Yeni veriyi yaz (eski okunmamış veri atılır)"""
+        with self._lock:
+            self._data = data
+            self._has_new = True
+            self.frames_received += 1
+
+    def take(self) -> Optional[Telemetry]:
+        """Okunmamış en güncel veriyi al"""
+        with self._lock:
+            if not self._has_new:
+                return None
+            self._has_new = False
+            self.frames_rendered += 1
+            return self._data
+
+    @property
+    def frames_dropped(self) -> int:
+        """Ekrana hiç yansımadan üzerine yazılan frame sayısı"""
+        return self.frames_received - self.frames_rendered
+
+    def stats(self) -> dict:
+        """Sayaç özetini döndür"""
+        with self._lock:
+            return {
+                'received': self.frames_received,
+                'rendered': self.frames_rendered,
+                'dropped': self.frames_received - self.frames_rendered
+            }
+
+    def reset_stats(self):
+        """Sayaçları sıfırla"""
+        with self._lock:
+            self.frames_received = 0
+            self.frames_rendered = 0
@@ -0,0 +1,388 @@
+"""
+Disk üzerinde telemetri kaydı
+Her oturumun telemetrisi yarış sonrası analiz için sabit genişlikli ikili
+kayıtlar olarak saklanır. Kayıt arka plan thread'inde, önceden ayrılmış ve
+belleğe eşlenmiş (mmap) segment dosyalarına yazılır; okuma thread'i ve
+arayüz disk işlemi için hiç beklemez.
+
+Segment dosyası düzeni (little-endian):
+    0   HEADER_SIZE         başlık: sihirli değer, sürüm, kayıt boyu,
+                            kapasite, kalıcı kayıt sayısı, başlangıç zamanı
+    64  RECORD x kapasite   zaman damgası (f8) + ikili protokol payload'ı
+
+Başlıktaki kayıt sayısı yalnızca veri diske yazıldıktan (msync) sonra
+güncellenir. Çökme durumunda en fazla son flush aralığı kaybolur, dosyada
+sayının ötesinde kalan yarım kayıtlar okunmaz.
+"""
+
+import bisect
+import glob
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from arduino.binary_protocol import PAYLOAD, payload_values, telemetry_from_payload
+from arduino.telemetry import Telemetry
+
+
+DEFAULT_DIRECTORY = os.path.expanduser('~/.goatogo/telemetry')
+
+MAGIC = b'GTGTLM01'
+VERSION = 1
+
+HEADER = struct.Struct('<8sHHQQd')  # magic, sürüm, kayıt boyu, kapasite, sayı, başlangıç
+HEADER_SIZE = 64
+COUNT_OFFSET = struct.calcsize('<8sHHQ')
+
+RECORD = struct.Struct('<d' + PAYLOAD.format[1:])
+
+# Kayıtların NumPy karşılığı (analiz için kopyasız sütun erişimi)
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('mode', 'u1'),
+    ('far', 'u1'),
+    ('durum', 'u1'),
+    ('far2', 'u1'),
+    ('vites', 'u1'),
+    ('sinyallambasi', 'u1'),
+    ('dortlu', 'u1'),
+    ('sinyalsol', 'u1'),
+    ('sinyalsag', 'u1'),
+    ('speed_kmh_1', '<i2'),     # x100
+    ('speed_kmh_2', '<i2'),     # x100
+    ('direksiyonaci', '<i2'),   # x100
+    ('solGazYuzdesi', 'u1'),
+    ('sagGazYuzdesi', 'u1'),
+    ('EDS_AKTIF', 'u1'),
+])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+SEGMENT_SUFFIX = '.gtl'
+
+
+def segment_path(directory: str, session: str, number: int) -> str:
+    """Oturumun number. segment dosyasının yolu"""
+    return os.path.join(directory, f"{session}-{number:03d}{SEGMENT_SUFFIX}")
+
+
+class TelemetrySegmentWriter:
+    """
+    Tek segment dosyası (önceden ayrılmış, mmap ile yazılır)
+    Yalnızca kayıt thread'inden kullanılır.
+    """
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.capacity = max(1, (size - HEADER_SIZE) // RECORD.size)
+        self.count = 0
+        self.flushed = 0
+
+        length = HEADER_SIZE + self.capacity * RECORD.size
+        self._file = open(path, 'w+b')
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(self._file.fileno(), 0, length)
+            else:
+                self._file.truncate(length)
+            self._map = mmap.mmap(self._file.fileno(), length)
+        except OSError:
+            self._file.close()
+            raise
+
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, RECORD.size,
+                         self.capacity, 0, time.time())
+        self._map.flush()
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def append(self, timestamp: float, record: Telemetry):
+        """Kaydı belleğe eşlenmiş alana yaz (diske flush ile iner)"""
+        RECORD.pack_into(self._map, HEADER_SIZE + self.count * RECORD.size,
+                         timestamp, *payload_values(record))
+        self.count += 1
+
+    def flush(self):
+        """Veriyi diske yaz, ardından başlıktaki kayıt sayısını güncelle"""
+        if self.count == self.flushed:
+            return
+        self._map.flush()
+        struct.pack_into('<Q', self._map, COUNT_OFFSET, self.count)
+        self._map.flush(0, mmap.PAGESIZE)
+        self.flushed = self.count
+
+    def close(self):
+        """Son flush, kullanılmayan önayrılmış alanı bırak"""
+        self.flush()
+        self._map.close()
+        self._file.truncate(HEADER_SIZE + self.count * RECORD.size)
+        self._file.close()
+
+
+class TelemetryRecorder:
+    """
+    Arka plan telemetri kaydedici
+    - record(): okuma thread'inden çağrılır, yalnızca kuyruğa ekler
+      (kilitsiz deque; kuyruk doluysa kayıt atılır ve sayılır)
+    - Kayıt thread'i kuyruğu WRITE_INTERVAL'da bir segment dosyasına yazar,
+      flush_interval'da bir diske indirir
+    - Segment dolunca (segment_size byte) aynı oturumun yeni segmentine geçer
+    - İlk kayıt gelene kadar dosya oluşturulmaz
+    """
+
+    WRITE_INTERVAL = 0.05
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY,
+                 segment_size: int = 16 * 1024 * 1024,
+                 flush_interval: float = 1.0, queue_size: int = 10000):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.session = time.strftime('%Y%m%d-%H%M%S')
+
+        self._pending = deque()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._segment = None
+        self._segment_number = 0
+        self._failed = False
+
+        # İstatistikler
+        self.records_written = 0
+        self.records_dropped = 0
+        self.segments = []
+
+    def start(self):
+        """Kayıt thread'ini başlat"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='telemetry-recorder',
+                                            daemon=True)
+            self._thread.start()
+
+    def record(self, data: Telemetry, timestamp: Optional[float] = None):
+        """Frame'i kayıt kuyruğuna ekle (bloklamaz)"""
+        if len(self._pending) >= self.queue_size:
+            self.records_dropped += 1
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        self._pending.append((timestamp, data))
+
+    def stop(self):
+        """Kuyruktakileri yaz, segmenti kapat ve thread'i durdur"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._stop_event.clear()
+
+    def _run(self):
+        pending = self._pending
+        next_flush = time.monotonic() + self.flush_interval
+
+        while True:
+            stopping = self._stop_event.wait(self.WRITE_INTERVAL)
+
+            while pending:
+                self._write(*pending.popleft())
+
+            if stopping:
+                break
+
+            if time.monotonic() >= next_flush:
+                if self._segment:
+                    self._segment.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+        self._close_segment()
+
+    def _write(self, timestamp, data):
+        if self._failed:
+            self.records_dropped += 1
+            return
+
+        if self._segment is None or self._segment.full:
+            try:
+                self._open_segment()
+            except OSError as e:
+                # Dizin yazılamıyor / disk dolu - oturum boyunca kayıt kapalı
+                print(f"Telemetri kaydı başlatılamadı: {e}")
+                self._failed = True
+                self.records_dropped += 1
+                return
+
+        try:
+            self._segment.append(timestamp, data)
+            self.records_written += 1
+        except struct.error:
+            # Kayıt düzenine sığmayan değer (ör. int16 taşması)
+            self.records_dropped += 1
+
+    def _open_segment(self):
+        self._close_segment()
+        os.makedirs(self.directory, exist_ok=True)
+        self._segment_number += 1
+        path = segment_path(self.directory, self.session, self._segment_number)
+        self._segment = TelemetrySegmentWriter(path, self.segment_size)
+        self.segments.append(path)
+
+    def _close_segment(self):
+        if self._segment:
+            try:
+                self._segment.close()
+            except OSError as e:
+                print(f"Telemetri segmenti kapatılamadı: {e}")
+            self._segment = None
+
+
+class TelemetryLog:
+    """
+    Kayıtlı oturumu okuma
+    - Segmentler salt okunur mmap edilir, kayıtlar NumPy görünümü olarak okunur
+    - Her INDEX_INTERVAL kayıtta bir zaman damgası tutan seyrek indeks ile
+      seek() O(log n)'dir (segment -> indeks bloğu -> blok içi arama)
+    """
+
+    INDEX_INTERVAL = 256
+
+    def __init__(self, paths: List[str]):
+        self.paths = list(paths)
+        self._files = []
+        self._maps = []
+        self.records = []       # segment başına RECORD_DTYPE görünümü
+        self._offsets = []      # segmentin ilk kaydının genel sırası
+        self._first_times = []  # segmentin ilk zaman damgası
+        self._sparse = []       # segment başına seyrek zaman indeksi
+
+        total = 0
+        for path in self.paths:
+            records = self._open(path)
+            if records is None or len(records) == 0:
+                continue
+            self.records.append(records)
+            self._offsets.append(total)
+            self._first_times.append(float(records['timestamp'][0]))
+            self._sparse.append(records['timestamp'][::self.INDEX_INTERVAL].copy())
+            total += len(records)
+        self._total = total
+
+    @staticmethod
+    def list_sessions(directory: str = DEFAULT_DIRECTORY) -> List[str]:
+        """Dizindeki oturum adları (eskiden yeniye)"""
+        sessions = set()
+        for path in glob.glob(os.path.join(directory, '*' + SEGMENT_SUFFIX)):
+            sessions.add(os.path.basename(path).rsplit('-', 1)[0])
+        return sorted(sessions)
+
+    @classmethod
+    def open_session(cls, directory: str = DEFAULT_DIRECTORY,
+                     session: Optional[str] = None) -> 'TelemetryLog':
+        """Oturumu aç (None: en son oturum)"""
+        if session is None:
+            sessions = cls.list_sessions(directory)
+            if not sessions:
+                raise FileNotFoundError(f"Kayıtlı oturum yok: {directory}")
+            session = sessions[-1]
+        paths = sorted(glob.glob(os.path.join(directory, f"{session}-*{SEGMENT_SUFFIX}")))
+        if not paths:
+            raise FileNotFoundError(f"Oturum bulunamadı: {session}")
+        return cls(paths)
+
+    def _open(self, path):
+        """Segmenti eşle, başlığı doğrula ve kalıcı kayıtların görünümünü döndür"""
+        file = open(path, 'rb')
+        size = os.fstat(file.fileno()).st_size
+        if size < HEADER_SIZE:
+            file.close()
+            return None
+
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, capacity, count, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or record_size != RECORD.size:
+            data.close()
+            file.close()
+            raise ValueError(f"Geçersiz telemetri segmenti: {path}")
+
+        # Kapatılmamış segmentte sayı başlıktaki kalıcı değerdir
+        count = min(count, (size - HEADER_SIZE) // RECORD.size)
+        self._files.append(file)
+        self._maps.append(data)
+        return np.frombuffer(data, dtype=RECORD_DTYPE, count=count, offset=HEADER_SIZE)
+
+    def __len__(self):
+        return self._total
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Genel sırayı (segment, segment içi sıra) çiftine çevir"""
+        if not 0 <= index < self._total:
+            raise IndexError(index)
+        segment = bisect.bisect_right(self._offsets, index) - 1
+        return segment, index - self._offsets[segment]
+
+    def seek(self, timestamp: float) -> int:
+        """Zaman damgası timestamp veya sonrası olan ilk kaydın sırası"""
+        segment = bisect.bisect_right(self._first_times, timestamp) - 1
+        if segment < 0:
+            return 0
+
+        times = self.records[segment]['timestamp']
+        interval = self.INDEX_INTERVAL
+        block = int(np.searchsorted(self._sparse[segment], timestamp, side='left'))
+        if block == 0:
+            position = 0
+        else:
+            start = (block - 1) * interval
+            end = min(block * interval, len(times))
+            position = start + int(np.searchsorted(times[start:end], timestamp, side='left'))
+        return self._offsets[segment] + position
+
+    def timestamp_at(self, index: int) -> float:
+        """index. kaydın zaman damgası"""
+        segment, position = self._locate(index)
+        return float(self.records[segment]['timestamp'][position])
+
+    def record_at(self, index: int) -> Tuple[float, Telemetry]:
+        """index. kayıt: (zaman damgası, Telemetry)"""
+        segment, position = self._locate(index)
+        values = RECORD.unpack_from(self._maps[segment], HEADER_SIZE + position * RECORD.size)
+        return values[0], telemetry_from_payload(values[1:])
+
+    def iter_records(self, start: int = 0) -> Iterator[Tuple[float, Telemetry]]:
+        """start. kayıttan itibaren (zaman damgası, Telemetry) çiftleri"""
+        if start >= self._total:
+            return
+        segment, position = self._locate(max(0, start))
+        for data, records in zip(self._maps[segment:], self.records[segment:]):
+            with memoryview(data) as view:
+                for values in RECORD.iter_unpack(
+                        view[HEADER_SIZE + position * RECORD.size:
+                             HEADER_SIZE + len(records) * RECORD.size]):
+                    yield values[0], telemetry_from_payload(values[1:])
+            position = 0
+
+    def column(self, name: str) -> List[np.ndarray]:
+        """Tek alanın segment başına kopyasız görünümleri (ham değerler)"""
+        return [records[name] for records in self.records]
+
+    def close(self):
+        """Eşlemeleri ve dosyaları kapat"""
+        self.records = []
+        for data in self._maps:
+            try:
+                data.close()
+            except BufferError:
+                # Dışarıda tutulan görünüm var - GC kapatacak
+                pass
+        for file in self._files:
+            file.close()
+        self._maps = []
+        self._files = []
@@ -0,0 +1,189 @@
+"""
+Telemetri kaydı oynatma
+Kaydedilmiş bir oturumu ArduinoReader ile aynı sinyaller üzerinden arayüze
+besler; yavaşlamalar gerçek veri yolu (posta kutusu / sinyal -> update_data)
+üzerinden yeniden üretilebilir.
+
+Desteklenen kaynaklar:
+- TelemetryRecorder segmentleri (.gtl dosyası ya da dizin): özgün zamanlama
+- Ham akış kaydı (metin satırları ya da ikili protokol): sabit rate_hz ile
+"""
+
+import os
+import threading
+import time
+
+from PySide6.QtCore import Qt, Signal, Slot
+
+from arduino.arduino_reader import ArduinoReader, ConnectionType
+from arduino.telemetry_recorder import SEGMENT_SUFFIX, TelemetryLog
+
+
+class TelemetryReplay(ArduinoReader):
+    """
+    Kayıt oynatıcı (ArduinoReader yerine geçer)
+    - speed: 1x-100x özgün zamanlamayla, 0 = azami hız
+    - Azami hızda arayüz yolunun saniyede kaç frame işleyebildiği ölçülür
+    - Sinyal modunda en fazla max_pending frame arayüzde bekleyebilir;
+      arayüz yetişemezse oynatma yavaşlar (olay kuyruğu şişmez)
+    - Posta kutusu / geçmiş parametreleri ArduinoReader ile aynıdır
+    """
+
+    replay_finished = Signal(dict)  # oynatma özeti
+
+    MAX_SPEED = 100.0
+    READ_SIZE = 65536
+
+    def __init__(self, path=None, speed=1.0, rate_hz=50.0, loop=False,
+                 max_pending=4, **kwargs):
+        # Kayıt tekrar diske yazılmasın
+        kwargs.pop('recorder', None)
+        super().__init__(connection_type=ConnectionType.REPLAY, **kwargs)
+
+        self.path = path
+        self.speed = min(max(0.0, float(speed or 0)), self.MAX_SPEED)
+        self.rate_hz = rate_hz
+        self.loop = loop
+
+        self._wake = threading.Event()
+        self._credits = threading.Semaphore(max_pending)
+        self.max_pending = max_pending
+
+        # İstatistikler
+        self.frames_sent = 0
+        self.max_lag = 0.0
+
+    # --- Kaynaklar ---
+
+    def open_source(self):
+        """Kaydı aç: TelemetryLog ya da ham akış dosyası"""
+        path = self.path
+        if not path:
+            return TelemetryLog.open_session()
+        if os.path.isdir(path):
+            return TelemetryLog.open_session(path)
+        if path.endswith(SEGMENT_SUFFIX):
+            session = os.path.basename(path).rsplit('-', 1)[0]
+            return TelemetryLog.open_session(os.path.dirname(path) or '.', session)
+        return open(path, 'rb')
+
+    def iter_frames(self, source):
+        """(zaman damgası, Telemetry) çiftleri"""
+        if isinstance(source, TelemetryLog):
+            yield from source.iter_records()
+            return
+
+        # Ham akış: bağlantıdaki gibi protokol algılanıp çözülür
+        source.seek(0)
+        self.reset_decoders()
+        interval = 1.0 / self.rate_hz
+        index = 0
+        while True:
+            chunk = source.read(self.READ_SIZE)
+            if not chunk:
+                break
+            for data in self.decode_frames(chunk):
+                yield index * interval, data
+                index += 1
+
+    # --- Oynatma ---
+
+    def run(self):
+        """Kaydı seçilen hızda oynat"""
+        try:
+            self.connection = self.open_source()
+        except (OSError, ValueError) as e:
+            self.error_message.emit(f"Kayıt açılamadı: {str(e)}")
+            self.connection_status.emit("error")
+            self.running = False
+            return
+
+        self.connection_status.emit("connected")
+
+        # Sinyal modunda geri bildirim: arayüz frame'i işleyince kredi iade edilir
+        # (update_data'dan sonra bağlandığı için arayüz thread'inde ondan sonra çalışır)
+        if self.mailbox is None:
+            self.data_received.connect(self.frame_consumed, Qt.QueuedConnection)
+
+        start = time.perf_counter()
+        while self.running:
+            self.replay_once(self.connection)
+            if not self.loop or self.frames_sent == 0:
+                break
+        elapsed = time.perf_counter() - start
+
+        if self.mailbox is None:
+            self.data_received.disconnect(self.frame_consumed)
+
+        self.report(elapsed)
+        self.close_connection()
+
+    def replay_once(self, source):
+        """Kaydı baştan sona bir kez oynat"""
+        speed = self.speed
+        origin = None
+
+        for timestamp, data in self.iter_frames(source):
+            if not self.running:
+                break
+
+            if speed:
+                now = time.perf_counter()
+                if origin is None:
+                    origin = now - timestamp / speed
+                delay = origin + timestamp / speed - now
+                if delay > 0:
+                    # Kayıttaki uzun boşluklarda da stop() hemen uyandırır
+                    if self._wake.wait(delay):
+                        break
+                elif -delay > self.max_lag:
+                    self.max_lag = -delay
+
+            if self.history is not None:
+                self.history.append(data)
+
+            if self.mailbox is not None:
+                self.mailbox.put(data)
+            else:
+                while not self._credits.acquire(timeout=0.1):
+                    if not self.running:
+                        return
+                self.data_received.emit(data)
+
+            self.frames_sent += 1
+
+    @Slot(object)
+    def frame_consumed(self, data=None):
+        """Arayüz bir frame'i işledi (arayüz thread'inde çağrılır)"""
+        self._credits.release()
+
+    def report(self, elapsed: float):
+        """Oynatma özetini yayınla"""
+        stats = {
+            'frames': self.frames_sent,
+            'elapsed': elapsed,
+            'fps': self.frames_sent / elapsed if elapsed > 0 else 0.0,
+            'speed': self.speed,
+            'max_lag_ms': self.max_lag * 1000.0
+        }
+        if self.mailbox is not None:
+            stats.update(self.mailbox.stats())
+
+        speed_text = f"{self.speed:g}x" if self.speed else "azami hız"
+        print(f"Oynatma ({speed_text}): {stats['frames']} frame, {elapsed:.2f} s, "
+              f"{stats['fps']:.0f} frame/s, en fazla {stats['max_lag_ms']:.0f} ms gecikme")
+        self.replay_finished.emit(stats)
+
+    def close_connection(self):
+        """Kaydı kapat"""
+        source = self.connection
+        self.connection = None
+        if source is not None:
+            source.close()
+            self.connection_status.emit("disconnected")
+
+    def stop(self):
+        """Oynatmayı durdur (kaynak run() sonunda kapatılır)"""
+        self.running = False
+        self._wake.set()
+        self.wait()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+GoToGo Dashboard - Performans Ölçümleri
+Kullanım: python benchmark.py [ölçüm_adı ...]
+Ölçüm adı verilmezse tümü çalıştırılır.
+"""
+
+import sys
+import socket
+import threading
+import time
+import tracemalloc
+
+from arduino.arduino_reader import ArduinoReader, ConnectionType
+from arduino.stream_framer import StreamFramer
+from arduino.binary_protocol import BinaryFrameDecoder, encode_frame
+from arduino.telemetry import Telemetry
+
+
+SAMPLE_LINE = "1/1/1/0/1/0/0/1/0/42.50/43.10/-12.5/55/57/1"
+
+
+def bench_framer_throughput(frames_per_second=10000, duration=3.0):
+    """Yerel socketpair üzerinden saniyede 10k frame gönderip okuma"""
+    print("=" * 60)
+    print("FRAME AYIRICI VERİM TESTİ")
+    print("=" * 60)
+    print(f"\nHedef: {frames_per_second} frame/s, {duration:.1f} saniye\n")
+
+    reader = ArduinoReader(connection_type=ConnectionType.WIFI)
+    framer = StreamFramer()
+    writer_sock, reader_sock = socket.socketpair()
+    reader_sock.settimeout(1)
+
+    frame = (SAMPLE_LINE + "\n").encode()
+    total_frames = int(frames_per_second * duration)
+    # 1 ms'lik dilimler halinde gönder
+    batch = max(1, frames_per_second // 1000)
+
+    def writer():
+        sent = 0
+        start = time.perf_counter()
+        while sent < total_frames:
+            count = min(batch, total_frames - sent)
+            writer_sock.sendall(frame * count)
+            sent += count
+            # Hedef hıza göre bekle
+            delay = start + sent / frames_per_second - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        writer_sock.close()
+
+    thread = threading.Thread(target=writer, daemon=True)
+    start = time.perf_counter()
+    thread.start()
+
+    parsed = 0
+    try:
+        while True:
+            for line in framer.read_from(reader_sock):
+                if reader.parse_arduino_data(line):
+                    parsed += 1
+    except ConnectionError:
+        pass
+
+    elapsed = time.perf_counter() - start
+    thread.join()
+    reader_sock.close()
+
+    print(f"Gönderilen frame : {total_frames}")
+    print(f"Parse edilen     : {parsed}")
+    print(f"Kayıp            : {total_frames - parsed}")
+    print(f"Süre             : {elapsed:.2f} s")
+    print(f"Verim            : {parsed / elapsed:.0f} frame/s")
+    print(f"Taşma sayısı     : {framer.overflow_count}")
+    print()
+
+
+def bench_camera_pipeline(frames=300, target_size=(900, 506)):
+    """720p kamera frame'inin gösterime hazırlanma süresi ve bellek ayırması"""
+    import cv2
+    import numpy as np
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage, QPixmap
+    from PySide6.QtWidgets import QApplication
+    from ui.camera_view import CameraCaptureThread, LatestFrameSlot
+
+    print("=" * 60)
+    print("KAMERA GÖSTERİM YOLU TESTİ (720p)")
+    print("=" * 60)
+
+    # QApplication: aynı süreçte sonraki widget ölçümleri (replay) de çalışabilsin
+    app = QApplication.instance() or QApplication(sys.argv)
+    frame = np.random.randint(0, 255, (720, 1280, 3), dtype=np.uint8)
+    width, height = target_size
+
+    def add_parking_guides(target):
+        # Eski CameraView.add_parking_guides (frame başına 7 çizgi)
+        h, w = target.shape[:2]
+        cv2.line(target, (int(w * 0.3), h), (int(w * 0.4), int(h * 0.6)), (0, 255, 0), 3)
+        cv2.line(target, (int(w * 0.7), h), (int(w * 0.6), int(h * 0.6)), (0, 255, 0), 3)
+        cv2.line(target, (int(w * 0.25), h), (int(w * 0.35), int(h * 0.5)), (0, 255, 255), 3)
+        cv2.line(target, (int(w * 0.75), h), (int(w * 0.65), int(h * 0.5)), (0, 255, 255), 3)
+        cv2.line(target, (int(w * 0.2), h), (int(w * 0.3), int(h * 0.4)), (0, 0, 255), 3)
+        cv2.line(target, (int(w * 0.8), h), (int(w * 0.7), int(h * 0.4)), (0, 0, 255), 3)
+        cv2.line(target, (int(w * 0.5), h), (int(w * 0.5), int(h * 0.3)), (255, 255, 255), 2)
+        return target
+
+    def legacy_path():
+        # Eski yol: flip + 7 çizgi + cvtColor + QImage + QPixmap + SmoothTransformation
+        flipped = cv2.flip(frame, 1)
+        add_parking_guides(flipped)
+        rgb = cv2.cvtColor(flipped, cv2.COLOR_BGR2RGB)
+        image = QImage(rgb.data, 1280, 720, 1280 * 3, QImage.Format_RGB888)
+        QPixmap.fromImage(image).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    slot = LatestFrameSlot()
+    worker = CameraCaptureThread(0, slot)
+    worker.set_target_size(width, height)
+
+    def current_path():
+        # Yeni yol: önceden ayrılmış tamponlar + BGR888 + tek ölçekleme
+        index, image = worker.process_frame(frame)
+        slot.put(index, image, 0.0)
+        slot.take()
+        QPixmap.fromImage(image)
+        slot.release()
+
+    for name, path in [("Eski yol", legacy_path), ("Yeni yol", current_path)]:
+        path()  # ısınma (önbellek / tampon ayırma)
+        tracemalloc.start()
+        peak_total = 0
+        start = time.perf_counter()
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            path()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+        elapsed = time.perf_counter() - start
+        tracemalloc.stop()
+
+        print(f"{name:10s}: {elapsed / frames * 1000:6.2f} ms/frame, "
+              f"{peak_total / frames / 1024:8.1f} KB NumPy ayırma/frame")
+    print()
+
+
+def bench_protocol_decoders(frames=50000, baud=115200):
+    """Metin ve ikili protokol çözücülerinin frame başına maliyeti"""
+    print("=" * 60)
+    print("METİN / İKİLİ PROTOKOL KARŞILAŞTIRMASI")
+    print("=" * 60)
+    print(f"\n{frames} frame, 64 byte'lık okumalar halinde\n")
+
+    reader = ArduinoReader(connection_type=ConnectionType.WIFI)
+    sample = reader.parse_arduino_data(SAMPLE_LINE)
+    # 8N1: byte başına 10 bit
+    bytes_per_second = baud / 10
+
+    def chunks(stream, size=64):
+        return [stream[i:i + size] for i in range(0, len(stream), size)]
+
+    def text_decoder():
+        framer = StreamFramer()
+        parse = reader.parse_arduino_data
+        def decode(chunk):
+            return [parse(line) for line in framer.feed(chunk)]
+        return decode
+
+    def binary_decoder():
+        return BinaryFrameDecoder().feed
+
+    cases = [
+        ("Metin", (SAMPLE_LINE + "\n").encode(), text_decoder),
+        ("İkili", encode_frame(sample), binary_decoder),
+    ]
+
+    for name, frame, make_decoder in cases:
+        data = chunks(frame * frames)
+        decode = make_decoder()
+        decoded = 0
+        start = time.perf_counter()
+        for chunk in data:
+            decoded += len(decode(chunk))
+        elapsed = time.perf_counter() - start
+
+        print(f"{name:6s}: {len(frame):3d} byte/frame, "
+              f"{elapsed / decoded * 1e6:5.2f} µs/frame, "
+              f"{baud} baud'da en fazla {bytes_per_second / len(frame):5.0f} frame/s")
+    print()
+
+
+def bench_telemetry_record(frames=100000, rate_hz=1000):
+    """Frame başına sözlük ile Telemetry kaydının ayırma ve erişim maliyeti"""
+    print("=" * 60)
+    print("TELEMETRİ KAYDI: SÖZLÜK / TELEMETRY")
+    print("=" * 60)
+    print(f"\n{frames} frame, maliyetler {rate_hz} Hz akışa göre\n")
+
+    values = Telemetry.create(1, 1, 1, 0, 1, 0, 0, 1, 0, 42.5, 43.1, -12.5, 55, 57, 1)[:15]
+    names = Telemetry._fields
+
+    def make_dict():
+        data = dict(zip(names[:15], values))
+        data['avg_speed'] = (data['speed_kmh_1'] + data['speed_kmh_2']) / 2.0
+        return data
+
+    def make_record():
+        return Telemetry.create(*values)
+
+    def read_keys(data):
+        # LeftPanel / MainWindow.update_data'daki eski erişim deseni
+        return (data['avg_speed'], data['mode'], data['vites'], data['EDS_AKTIF'],
+                data['solGazYuzdesi'], data['sagGazYuzdesi'], data['direksiyonaci'],
+                data.get('sinyalsol', 0), data.get('sinyalsag', 0), data.get('dortlu', 0),
+                data.get('far', 0), data.get('far2', 0), data.get('vites'))
+
+    def read_attributes(data):
+        return (data.avg_speed, data.mode, data.vites, data.EDS_AKTIF,
+                data.solGazYuzdesi, data.sagGazYuzdesi, data.direksiyonaci,
+                data.sinyalsol, data.sinyalsag, data.dortlu,
+                data.far, data.far2, data.vites)
+
+    cases = [
+        ("dict", make_dict, read_keys),
+        ("Telemetry['..']", make_record, read_keys),
+        ("Telemetry.alan", make_record, read_attributes),
+    ]
+
+    for name, make, read in cases:
+        start = time.perf_counter()
+        for _ in range(frames):
+            make()
+        alloc = (time.perf_counter() - start) / frames
+
+        record = make()
+        start = time.perf_counter()
+        for _ in range(frames):
+            read(record)
+        access = (time.perf_counter() - start) / frames
+
+        # Bellekte tutulan 1000 frame'in boyutu
+        tracemalloc.start()
+        kept = [make() for _ in range(1000)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del kept
+
+        per_second = (alloc + access) * rate_hz
+        print(f"{name:16s}: oluşturma {alloc * 1e6:5.2f} µs, erişim {access * 1e6:5.2f} µs, "
+              f"{size / 1000:4.0f} byte/frame, {rate_hz} Hz'de {per_second * 1000:5.2f} ms/s CPU")
+    print()
+
+
+def bench_replay_ui(frames=20000):
+    """Kayıt oynatmayı azami hızda sol panele besleyip arayüz verimini ölçme"""
+    import tempfile
+    from PySide6.QtWidgets import QApplication
+    from arduino.telemetry_recorder import TelemetryRecorder
+    from arduino.telemetry_replay import TelemetryReplay
+    from ui.left_panel import LeftPanel
+
+    print("=" * 60)
+    print("KAYIT OYNATMA - ARAYÜZ VERİMİ (azami hız)")
+    print("=" * 60)
+    print(f"\n{frames} frame, sinyal modu (arayüz onayı ile)\n")
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    panel = LeftPanel()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Değişen hız / direksiyon / sinyal içeren sahte oturum
+        recorder = TelemetryRecorder(directory, queue_size=frames)
+        recorder.start()
+        for i in range(frames):
+            recorder.record(Telemetry.create(
+                1, 1, 1, 0, 1, 0, 0, (i // 50) % 2, 0,
+                (i % 1200) / 10.0, (i % 1200) / 10.0, (i % 900) / 10.0 - 45.0,
+                i % 101, (i + 7) % 101, 1
+            ), timestamp=i * 0.01)
+        recorder.stop()
+
+        replay = TelemetryReplay(directory, speed=0)
+        replay.data_received.connect(panel.update_data)
+        replay.replay_finished.connect(lambda stats: app.quit())
+        replay.start()
+        app.exec()
+        replay.wait()
+    print()
+
+
+BENCHMARKS = {
+    'framer': bench_framer_throughput,
+    'camera': bench_camera_pipeline,
+    'protocol': bench_protocol_decoders,
+    'telemetry': bench_telemetry_record,
+    'replay': bench_replay_ui,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+
+    for name in names:
+        bench = BENCHMARKS.get(name)
+        if not bench:
+            print(f"Bilinmeyen ölçüm: {name} (seçenekler: {', '.join(BENCHMARKS)})")
+            continue
+        bench()
+
+
+if __name__ == "__main__":
+    main()
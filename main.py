@@ -7,15 +7,22 @@ from PySide6.QtWebEngineCore import QWebEngineProfile
 from PySide6.QtCore import QTimer
 
 from arduino.arduino_reader import ArduinoReader, ConnectionType
+from arduino.telemetry import Telemetry
+from arduino.telemetry_mailbox import TelemetryMailbox
+from arduino.telemetry_history import TelemetryHistory
+from arduino.telemetry_recorder import TelemetryRecorder
+from arduino.telemetry_replay import TelemetryReplay
 from ui.connection_dialog import ConnectionSettingsDialog
 from ui.wifi_manager import WiFiManagerDialog
 from ui.phone_mirror import PhoneMirrorDialog
 from ui.left_panel import LeftPanel
 from ui.map_view import MapView
+from ui.adb_client import AdbClient
 from ui.bottom_bar import BottomBar
 from ui.media_overlay import MediaOverlay
 from ui.clock_widget import ClockWidget
 from ui.camera_view import CameraView
+from ui.view_state import ViewState, ViewStateMachine
 
 
 class MainWindow(QMainWindow):
@@ -27,6 +34,23 @@ class MainWindow(QMainWindow):
         self.connection_type = ConnectionType.USB
         self.connection_params = {}
         
+        # -------- Telemetri Dağıtımı --------
+        # Okuma thread'i posta kutusuna yazar, arayüz ekran yenileme
+        # hızında (30/60 Hz) yalnızca en güncel veriyi çizer
+        self.telemetry_mailbox = TelemetryMailbox()
+        self.display_refresh_hz = 60
+        self.display_timer = QTimer(self)
+        self.display_timer.timeout.connect(self.render_telemetry)
+        
+        # Son 5 dakikanın tüm alanları (100 Hz için ~2 MB, sabit bellek)
+        # Grafik / analiz / kayıt bileşenleri buradan kopyasız okur
+        self.telemetry_history = TelemetryHistory.for_duration(minutes=5, rate_hz=100)
+        
+        # Oturum kaydı (~/.goatogo/telemetry) - yarış sonrası analiz için
+        # Disk işlemleri kendi thread'inde, okuma thread'i yalnızca kuyruğa ekler
+        self.telemetry_recorder = TelemetryRecorder()
+        self.telemetry_recorder.start()
+        
         # -------- Window --------
         self.setWindowTitle("GoToGo Dashboard - Tesla Style")
         self.showFullScreen()
@@ -57,6 +81,11 @@ class MainWindow(QMainWindow):
         self.camera_view = CameraView(camera_index=0)
         self.camera_view.hide()  # Başlangıçta gizli
         
+        # Vites -> görünüm durum makinesi (yalnızca geçişlerde işlem yapar,
+        # kısa vites titreşimlerini bekleme süresiyle filtreler)
+        self.view_state = ViewStateMachine(hold_ms=150, parent=self)
+        self.view_state.state_changed.connect(self.apply_view_state)
+        
         top_h.addWidget(self.left_panel)
         top_h.addWidget(self.map_view)
         top_h.addWidget(self.camera_view)
@@ -105,6 +134,9 @@ class MainWindow(QMainWindow):
         main_v.setStretch(0, 9)
         main_v.setStretch(1, 1)
         
+        # -------- Ekran Yenileme --------
+        self.set_display_refresh_rate(self.display_refresh_hz)
+        
         # -------- Otomatik Bağlantı Denemesi --------
         QTimer.singleShot(1000, self.auto_connect)
     
@@ -190,20 +222,36 @@ class MainWindow(QMainWindow):
     
     def start_arduino_connection(self, connection_type: str, params: dict):
         """Arduino bağlantısını başlat"""
-        # Eski bağlantıyı kapat
+        # Eski bağlantıyı kapat (önce ayır: durdururken yayınladığı
+        # 'disconnected' yeniden bağlanmayı tetiklemesin)
         if self.arduino_reader:
-            self.arduino_reader.stop()
+            reader = self.arduino_reader
             self.arduino_reader = None
+            reader.stop()
         
         # Yeni bağlantı
         self.connection_type = connection_type
         self.connection_params = params
         
         try:
-            self.arduino_reader = ArduinoReader(
-                connection_type=connection_type,
-                **params
-            )
+            if connection_type == ConnectionType.REPLAY:
+                # Kayıt oynatma: aynı arayüz yolu, kayıt tekrar diske yazılmaz.
+                # Azami hızda posta kutusu atlanır, her frame update_data'ya
+                # iletilir; böylece arayüzün işleyebildiği frame hızı ölçülür
+                max_speed = not params.get('speed', 1.0)
+                self.arduino_reader = TelemetryReplay(
+                    mailbox=None if max_speed else self.telemetry_mailbox,
+                    history=self.telemetry_history,
+                    **params
+                )
+            else:
+                self.arduino_reader = ArduinoReader(
+                    connection_type=connection_type,
+                    mailbox=self.telemetry_mailbox,
+                    history=self.telemetry_history,
+                    recorder=self.telemetry_recorder,
+                    **params
+                )
             
             # Signal bağlantıları
             self.arduino_reader.data_received.connect(self.update_data)
@@ -226,14 +274,30 @@ class MainWindow(QMainWindow):
     
     def on_connection_status(self, status: str):
         """Bağlantı durumu değiştiğinde"""
+        if self.sender() is not self.arduino_reader:
+            # Durdurulmuş eski okuyucudan gelen (gecikmiş) durum
+            return
+        
         self.bottom_bar.update_connection_status(status, self.connection_type)
         
+        if status == 'disconnected':
+            stats = self.telemetry_mailbox.stats()
+            print(f"Telemetri: {stats['received']} frame alındı, "
+                  f"{stats['rendered']} frame çizildi, {stats['dropped']} atlandı")
+        
+        if self.connection_type == ConnectionType.REPLAY:
+            # Oynatma bittiğinde yeniden başlatılmaz
+            return
+        
         if status == 'error' or status == 'disconnected':
             # Yeniden bağlanma denemesi (5 saniye sonra)
             QTimer.singleShot(5000, self.reconnect_arduino)
     
     def reconnect_arduino(self):
         """Arduino'ya yeniden bağlanmayı dene"""
+        if self.connection_type == ConnectionType.REPLAY:
+            # Bu arada oynatmaya geçildiyse kayıt baştan başlatılmaz
+            return
         if self.connection_params:
             print("Yeniden bağlanma denemesi...")
             self.start_arduino_connection(
@@ -247,32 +311,62 @@ class MainWindow(QMainWindow):
         # Kullanıcıya gösterme (çok fazla popup olmasın)
         # İsterseniz status bar'da gösterebilirsiniz
     
-    def update_data(self, data: dict):
+    def set_display_refresh_rate(self, hz: int):
+        """Telemetri ekran yenileme hızını ayarla (ör. 30 veya 60 Hz)"""
+        self.display_refresh_hz = max(1, int(hz))
+        self.display_timer.start(int(1000 / self.display_refresh_hz))
+    
+    def render_telemetry(self):
+        """Posta kutusundaki en güncel veriyi çiz (ekran yenileme başına bir kez)"""
+        data = self.telemetry_mailbox.take()
+        if data is not None:
+            self.update_data(data)
+    
+    def update_data(self, data: Telemetry):
         """Arduino'dan gelen veriyi güncelle"""
         # Sol panel güncelle
         self.left_panel.update_data(data)
         
-        # Geri viteste farklı görünüm
-        if data.get('vites') == 2:  # 2 = Geri vites
+        # Park çizgileri direksiyon açısını takip etsin
+        self.camera_view.set_steering_angle(data.direksiyonaci)
+        
+        # Geri viteste farklı görünüm (durum makinesi yalnızca geçişte uygular)
+        vites = data.vites
+        if vites == 2:  # 2 = Geri vites
+            self.view_state.request(ViewState.REVERSE)
+        elif vites == 0:  # Boş vites - kamera arka planda hazır beklesin
+            self.view_state.request(ViewState.STANDBY)
+        else:
+            self.view_state.request(ViewState.NORMAL)
+    
+    def apply_view_state(self, old_state: str, new_state: str):
+        """Görünüm durumu değiştiğinde ilgili görünümü uygula"""
+        if new_state == ViewState.REVERSE:
             # Harita yerine geri görüş kamerası göster
-            # Veya haritayı arka görünüme çevir
             self.show_reverse_view()
         else:
-            self.show_normal_view()
+            self.show_normal_view(camera_standby=(new_state == ViewState.STANDBY))
     
     def show_reverse_view(self):
         """Geri vites görünümü - Kamerayı göster"""
         # Haritayı gizle, kamerayı göster
         self.map_view.hide()
         self.camera_view.show()
-        self.camera_view.start_camera()
+        # İlk frame süresi vites değişiminin algılandığı andan ölçülür
+        self.camera_view.start_camera(engaged_at=self.view_state.requested_at)
         print("🎥 Geri görüş kamerası aktif")
     
-    def show_normal_view(self):
+    def show_normal_view(self, camera_standby=False):
         """Normal görünüm - Haritayı göster"""
+        # Boş viteste cihaz açık kalır (geri vitese anında geçiş),
+        # ileri viteste serbest bırakılır
+        if camera_standby:
+            self.camera_view.standby_camera()
+        else:
+            self.camera_view.stop_camera()
+        
         # Kamerayı gizle, haritayı göster
         if not self.camera_view.isHidden():
-            self.camera_view.stop_camera()
             self.camera_view.hide()
             self.map_view.show()
             print("🗺️ Harita görünümüne dönüldü")
@@ -280,7 +374,12 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Pencere kapatılırken temizlik"""
         if self.arduino_reader:
-            self.arduino_reader.stop()
+            reader = self.arduino_reader
+            self.arduino_reader = None
+            reader.stop()
+        
+        # Telemetri kaydını diske indir ve segmenti kapat
+        self.telemetry_recorder.stop()
         
         # Kamerayı durdur
         if self.camera_view:
@@ -290,6 +389,9 @@ class MainWindow(QMainWindow):
         if self.map_view.scrcpy_process:
             self.map_view.stop_screen_mirror()
         
+        # Ortak adb istemcisini kapat (cihaz takibi + komut kuyruğu)
+        AdbClient.shared().shutdown()
+        
         event.accept()
 
 
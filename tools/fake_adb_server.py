@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Sahte adb sunucusu (telefon olmadan AdbClient / AdbDeviceMonitor denemek için)
+
+Yerel adb sunucusunun soket protokolünü konuşur: istek "<4 haneli hex
+uzunluk><servis>", yanıt "OKAY" ya da "FAIL" + uzunluk önekli mesaj.
+Desteklenen servisler:
+    host:version
+    host:devices
+    host:track-devices      bağlantı açık kalır; liste her değiştiğinde
+                            uzunluk önekli yeni liste gönderilir
+    host:transport:<seri> / host:transport-any, ardından shell:<komut>
+
+Cihazlar standart girişten yazılan komutlarla değiştirilir:
+    connect SERİ            cihazı 'device' durumunda ekle
+    state SERİ DURUM        ör. unauthorized, offline
+    disconnect SERİ         cihazı kaldır
+    list                    mevcut listeyi yaz
+
+Kullanım:
+    python tools/fake_adb_server.py [--port 5037] [--cycle SANİYE] [SERİ ...]
+    --cycle verilirse ilk cihaz bu aralıkla takılıp çıkarılır.
+
+Betiklerden de kullanılabilir:
+    server = FakeAdbServer(port=0)
+    server.start()
+    AdbDeviceMonitor(port=server.port) ...
+    server.set_device('emulator-5554', 'device')
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+
+
+def encode(payload: str) -> bytes:
+    """Uzunluk önekli mesaj"""
+    data = payload.encode('utf-8')
+    return b"%04x" % len(data) + data
+
+
+def read_exact(sock, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("istemci bağlantıyı kapattı")
+        data += chunk
+    return bytes(data)
+
+
+def read_request(sock) -> str:
+    length = int(read_exact(sock, 4), 16)
+    return read_exact(sock, length).decode('utf-8', errors='replace')
+
+
+def client_gone(sock) -> bool:
+    """İstemci bağlantıyı kapattı mı (veri tüketmeden, beklemeden)"""
+    try:
+        return sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) == b''
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
+
+
+class FakeAdbServer:
+    """Thread'li sahte adb sunucusu"""
+
+    VERSION = 41
+
+    # shell:<komut> için hazır yanıtlar (bilinmeyen komutlar boş çıktı verir)
+    SHELL_OUTPUT = {
+        'wm size': "Physical size: 1080x2400\n",
+        'getprop ro.product.model': "Fake Phone\n",
+    }
+
+    def __init__(self, host='127.0.0.1', port=5037, devices=()):
+        self.host = host
+        self.port = port
+        self.devices = {serial: 'device' for serial in devices}
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._version = 0
+        self._running = False
+        self._listener = None
+
+    # --- Cihaz listesi ---
+
+    def set_device(self, serial, state='device'):
+        """Cihazı ekle ya da durumunu değiştir"""
+        with self._changed:
+            self.devices[serial] = state
+            self._version += 1
+            self._changed.notify_all()
+
+    def remove_device(self, serial):
+        """Cihazı kaldır (takip edenlere yeni liste gider)"""
+        with self._changed:
+            if self.devices.pop(serial, None) is not None:
+                self._version += 1
+                self._changed.notify_all()
+
+    def device_list(self) -> str:
+        """'seri\\tdurum' satırları"""
+        return ''.join(f"{serial}\t{state}\n" for serial, state in self.devices.items())
+
+    # --- Sunucu ---
+
+    def start(self):
+        """Dinlemeye başla (port=0 verildiyse seçilen port self.port'a yazılır)"""
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((self.host, self.port))
+        listener.listen()
+        self.port = listener.getsockname()[1]
+        self._listener = listener
+        self._running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def close(self):
+        """Sunucuyu kapat (takip bağlantıları da kapanır)"""
+        with self._changed:
+            self._running = False
+            self._changed.notify_all()
+        if self._listener:
+            self._listener.close()
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _handle(self, client):
+        with client:
+            try:
+                self._serve(client, read_request(client))
+            except (OSError, ConnectionError, ValueError):
+                pass
+
+    def _serve(self, client, request):
+        if request == 'host:version':
+            client.sendall(b"OKAY" + encode("%04x" % self.VERSION))
+
+        elif request == 'host:devices':
+            with self._lock:
+                payload = self.device_list()
+            client.sendall(b"OKAY" + encode(payload))
+
+        elif request == 'host:track-devices':
+            self._track(client)
+
+        elif request.startswith('host:transport'):
+            serial = request.partition('host:transport:')[2] or None
+            if not self._transport_ready(serial):
+                client.sendall(b"FAIL" + encode(
+                    f"device '{serial}' not found" if serial else "no devices/emulators found"))
+                return
+            client.sendall(b"OKAY")
+
+            service = read_request(client)
+            if not service.startswith('shell:'):
+                client.sendall(b"FAIL" + encode(f"unsupported service: {service}"))
+                return
+            command = service[len('shell:'):]
+            client.sendall(b"OKAY")
+            # Gerçek adb gibi CRLF satır sonları, çıktı sonunda bağlantı kapanır
+            output = self.SHELL_OUTPUT.get(command, '')
+            client.sendall(output.replace('\n', '\r\n').encode('utf-8'))
+
+        else:
+            client.sendall(b"FAIL" + encode(f"unknown host service: {request}"))
+
+    def _transport_ready(self, serial) -> bool:
+        with self._lock:
+            if serial:
+                return self.devices.get(serial) == 'device'
+            return list(self.devices.values()).count('device') == 1
+
+    def _track(self, client):
+        """İlk listeyi ve sonraki her değişikliği gönder"""
+        client.sendall(b"OKAY")
+        with self._changed:
+            version = self._version
+            payload = self.device_list()
+        client.sendall(encode(payload))
+
+        while True:
+            with self._changed:
+                # Arada bir uyanıp istemcinin bağlantıyı kapatıp kapatmadığına bak
+                self._changed.wait_for(
+                    lambda: self._version != version or not self._running, timeout=1.0)
+                if not self._running:
+                    return
+                if self._version == version:
+                    if client_gone(client):
+                        return
+                    continue
+                version = self._version
+                payload = self.device_list()
+            client.sendall(encode(payload))
+
+
+def command_loop(server):
+    """Standart girişten cihaz komutları"""
+    for line in sys.stdin:
+        words = line.split()
+        if not words:
+            continue
+        command, args = words[0], words[1:]
+        if command == 'connect' and args:
+            server.set_device(args[0], 'device')
+        elif command == 'state' and len(args) == 2:
+            server.set_device(args[0], args[1])
+        elif command == 'disconnect' and args:
+            server.remove_device(args[0])
+        elif command == 'list':
+            print(server.device_list() or "(cihaz yok)", end='' if server.devices else '\n')
+        else:
+            print("Komutlar: connect SERİ | state SERİ DURUM | disconnect SERİ | list")
+
+
+def cycle_loop(server, serial, interval):
+    """Cihazı belirli aralıkla tak / çıkar"""
+    while True:
+        time.sleep(interval)
+        if serial in server.devices:
+            server.remove_device(serial)
+            print(f"{serial} çıkarıldı")
+        else:
+            server.set_device(serial)
+            print(f"{serial} takıldı")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sahte adb sunucusu")
+    parser.add_argument('serials', nargs='*', help="başlangıçta bağlı cihazlar")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5037)
+    parser.add_argument('--cycle', type=float, default=0,
+                        help="ilk cihazı bu aralıkla (saniye) tak / çıkar")
+    args = parser.parse_args()
+
+    server = FakeAdbServer(args.host, args.port, args.serials)
+    server.start()
+    print(f"Sahte adb sunucusu {args.host}:{server.port} üzerinde "
+          f"({', '.join(args.serials) or 'cihaz yok'})")
+
+    if args.cycle:
+        threading.Thread(target=cycle_loop,
+                         args=(server, (args.serials or ['emulator-5554'])[0], args.cycle),
+                         daemon=True).start()
+    try:
+        command_loop(server)
+        if args.cycle:
+            # Girdi yoksa (ör. arka planda) döngü sürsün
+            while True:
+                time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Sahte nmcli (WiFi arka ucunu NetworkManager olmadan denemek için)
+
+NmcliBackend'in kullandığı komutları taklit eder:
+    nmcli -t -f ALANLAR device show
+    nmcli -t -f ALANLAR device wifi list [ifname CİHAZ] [--rescan yes|no]
+    nmcli device wifi connect SSID password PAROLA
+
+Çıktı gerçek nmcli'nin -t (terse) biçimindedir: alanlar ':' ile ayrılır,
+değer içindeki ':' ve '\\' kaçırılır (ör. BSSID AA\\:BB\\:...).
+Bağlanılan ağ durum dosyasında tutulur, sonraki sorgular onu gösterir.
+
+Kullanım:
+    NmcliBackend(nmcli_path='tools/fake_nmcli.py')
+
+Ortam değişkenleri:
+    FAKE_NMCLI_STATE   durum dosyası (varsayılan: geçici dizinde fake_nmcli.json)
+    FAKE_NMCLI_DELAY   her çağrıda bekleme (saniye, yavaş nmcli taklidi)
+    FAKE_NMCLI_LOG     verilirse her çağrının argümanları bu dosyaya eklenir
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+
+DEVICE = 'wlan0'
+IP_ADDRESS = '192.168.1.42/24'
+
+# SSID, BSSID, sinyal, güvenlik, hız, parola
+NETWORKS = [
+    ('EvAgi', 'AA:BB:CC:00:00:01', 78, 'WPA2', '130 Mbit/s', 'parola123'),
+    ('Komsu:5G', 'AA:BB:CC:00:00:02', 40, '', '270 Mbit/s', ''),
+    ('EvAgi', 'AA:BB:CC:00:00:03', 60, 'WPA2', '65 Mbit/s', 'parola123'),
+    ('Kafe WiFi', 'AA:BB:CC:00:00:04', 25, 'WPA1 WPA2', '54 Mbit/s', 'kahve'),
+]
+
+
+def state_path():
+    return os.environ.get('FAKE_NMCLI_STATE') or \
+        os.path.join(tempfile.gettempdir(), 'fake_nmcli.json')
+
+
+def load_state():
+    try:
+        with open(state_path()) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {'connected': None}
+
+
+def save_state(state):
+    with open(state_path(), 'w') as file:
+        json.dump(state, file)
+
+
+def escape(value) -> str:
+    """nmcli -t kaçışı"""
+    return str(value).replace('\\', '\\\\').replace(':', '\\:')
+
+
+def terse(fields, row) -> str:
+    return ':'.join(escape(row.get(field, '')) for field in fields)
+
+
+def parse(args):
+    """Genel seçenekleri (-t, -f) ayır; (alanlar, komut) döndür"""
+    fields = None
+    command = []
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg in ('-t', '--terse'):
+            pass
+        elif arg in ('-f', '--fields'):
+            index += 1
+            fields = args[index].split(',')
+        else:
+            command.append(arg)
+        index += 1
+    return fields, command
+
+
+def option(command, name, default=None):
+    """'ifname wlan0' / '--rescan no' gibi ad-değer çiftleri"""
+    if name in command:
+        position = command.index(name)
+        if position + 1 < len(command):
+            return command[position + 1]
+    return default
+
+
+def in_use_bssid(state):
+    """Bağlı ağın en güçlü erişim noktası"""
+    ssid = state.get('connected')
+    candidates = [n for n in NETWORKS if n[0] == ssid]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda n: n[2])[1]
+
+
+def device_show(fields, state):
+    connected = state.get('connected')
+    rows = [
+        {
+            'GENERAL.DEVICE': DEVICE,
+            'GENERAL.TYPE': 'wifi',
+            'GENERAL.STATE': '100 (connected)' if connected else '30 (disconnected)',
+            'GENERAL.CONNECTION': connected or '',
+            'IP4.ADDRESS[1]': IP_ADDRESS if connected else '',
+        },
+        {
+            'GENERAL.DEVICE': 'lo',
+            'GENERAL.TYPE': 'loopback',
+            'GENERAL.STATE': '100 (connected (externally))',
+            'GENERAL.CONNECTION': 'lo',
+            'IP4.ADDRESS[1]': '127.0.0.1/8',
+        },
+    ]
+
+    blocks = []
+    for row in rows:
+        lines = []
+        for key, value in row.items():
+            if fields and key.split('[')[0] not in fields:
+                continue
+            if value:
+                # device show anahtar:değer yazar, değerdeki ':' kaçırılır
+                lines.append(f"{key}:{escape(value)}")
+        blocks.append('\n'.join(lines))
+    print('\n\n'.join(blocks))
+
+
+def wifi_list(fields, command, state):
+    fields = fields or ['IN-USE', 'BSSID', 'SSID', 'SIGNAL', 'RATE', 'SECURITY']
+    ifname = option(command, 'ifname')
+    if ifname not in (None, DEVICE):
+        print(f"Error: Device '{ifname}' not found.", file=sys.stderr)
+        return 10
+
+    if option(command, '--rescan') == 'yes':
+        # Gerçek tarama birkaç saniye sürer
+        time.sleep(0.5)
+
+    active = in_use_bssid(state)
+    for ssid, bssid, signal, security, rate, _ in NETWORKS:
+        print(terse(fields, {
+            'IN-USE': '*' if bssid == active else ' ',
+            'DEVICE': DEVICE,
+            'SSID': ssid,
+            'BSSID': bssid,
+            'SIGNAL': signal,
+            'RATE': rate,
+            'SECURITY': security or '--',
+        }))
+    return 0
+
+
+def wifi_connect(command, state):
+    ssid = command[3] if len(command) > 3 else ''
+    password = option(command, 'password', '')
+
+    network = next((n for n in NETWORKS if n[0] == ssid), None)
+    if network is None:
+        print(f"Error: No network with SSID '{ssid}' found.", file=sys.stderr)
+        return 10
+    if network[5] and password != network[5]:
+        print("Error: Connection activation failed: Secrets were required, but not provided.",
+              file=sys.stderr)
+        return 4
+
+    state['connected'] = ssid
+    save_state(state)
+    print(f"Device '{DEVICE}' successfully activated with 'fake-{ssid}'.")
+    return 0
+
+
+def main(args) -> int:
+    log = os.environ.get('FAKE_NMCLI_LOG')
+    if log:
+        with open(log, 'a') as file:
+            file.write(' '.join(args) + '\n')
+
+    delay = float(os.environ.get('FAKE_NMCLI_DELAY') or 0)
+    if delay:
+        time.sleep(delay)
+
+    fields, command = parse(args)
+    state = load_state()
+
+    if command[:2] == ['device', 'show']:
+        device_show(fields, state)
+        return 0
+    if command[:3] == ['device', 'wifi', 'list']:
+        return wifi_list(fields, command, state)
+    if command[:3] == ['device', 'wifi', 'connect']:
+        return wifi_connect(command, state)
+
+    print(f"Error: unsupported arguments: {' '.join(args)}", file=sys.stderr)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Sahte NetworkManager (oturum veri yolunda, QtDBus ile)
+
+DbusNetworkManagerBackend'i gerçek NetworkManager olmadan denemek için
+org.freedesktop.NetworkManager adını oturum veri yolunda alır ve arka ucun
+kullandığı nesneleri sunar:
+    /org/freedesktop/NetworkManager/Devices/1            Device, Device.Wireless
+    /org/freedesktop/NetworkManager/AccessPoint/N        AccessPoint
+    /org/freedesktop/NetworkManager/ActiveConnection/1   Connection.Active
+Desteklenenler: Properties.Get / GetAll, Introspect (alt nesne listesi),
+Device.Wireless.RequestScan ve özellik değişince PropertiesChanged sinyali.
+
+Bağlı erişim noktasının sinyal gücü ve bit hızı --interval saniyede bir
+değişir. Standart girişten komutlar:
+    strength N          bağlı erişim noktasının gücü (0-100)
+    bitrate KBIT        bağlantı hızı (kbit/s)
+    connect SSID        ağa bağlan (State, ActiveAccessPoint, ActiveConnection)
+    disconnect          bağlantıyı kes
+    add SSID GÜÇ        yeni erişim noktası (sonraki taramada görünür)
+    remove SSID         erişim noktasını kaldır
+
+Kullanım (yalnızca bu komut için açılan bir oturum veri yolunda):
+    dbus-run-session -- sh -c 'python tools/mock_networkmanager.py & sleep 1; python betik.py'
+
+    # betik.py
+    bus = QDBusConnection.sessionBus()
+    backend = create_wifi_backend(bus=bus)   # -> DbusNetworkManagerBackend
+
+PySide'da işaretsiz tamsayı tipi seçilemediği için 'u' / 'y' özellikleri
+'i' olarak gönderilir; arka uç değerleri int() ile okuduğundan fark etmez.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import threading
+
+from PySide6.QtCore import QByteArray, QCoreApplication, QObject, QTimer, Signal
+from PySide6.QtDBus import (QDBusConnection, QDBusMessage, QDBusObjectPath,
+                            QDBusVariant, QDBusVirtualObject)
+
+
+NM_SERVICE = 'org.freedesktop.NetworkManager'
+NM_PATH = '/org/freedesktop/NetworkManager'
+NM_DEVICE = NM_SERVICE + '.Device'
+NM_WIRELESS = NM_DEVICE + '.Wireless'
+NM_ACCESS_POINT = NM_SERVICE + '.AccessPoint'
+NM_ACTIVE_CONNECTION = NM_SERVICE + '.Connection.Active'
+DBUS_PROPERTIES = 'org.freedesktop.DBus.Properties'
+DBUS_INTROSPECTABLE = 'org.freedesktop.DBus.Introspectable'
+
+DEVICE_PATH = NM_PATH + '/Devices/1'
+CONNECTION_PATH = NM_PATH + '/ActiveConnection/1'
+NO_OBJECT = '/'
+
+STATE_DISCONNECTED = 30
+STATE_ACTIVATED = 100
+
+# SSID, BSSID, güç, Flags, WpaFlags, RsnFlags
+ACCESS_POINTS = [
+    ('EvAgi', 'AA:BB:CC:00:00:01', 78, 0x1, 0x0, 0x188),
+    ('Komsu:5G', 'AA:BB:CC:00:00:02', 40, 0x0, 0x0, 0x0),
+    ('Kafe WiFi', 'AA:BB:CC:00:00:03', 25, 0x1, 0x188, 0x188),
+    ('Yeni Nesil', 'AA:BB:CC:00:00:04', 55, 0x1, 0x0, 0x588),
+]
+
+
+class MockNetworkManager(QDBusVirtualObject):
+    """
+    NetworkManager nesne ağacı
+    Özellikler {yol: {arayüz: {ad: değer}}} sözlüğünde tutulur; set() değeri
+    değiştirir ve PropertiesChanged yayınlar.
+    """
+
+    SCAN_DURATION_MS = 500
+
+    def __init__(self, bus, connected='EvAgi'):
+        super().__init__()
+        self.bus = bus
+        self.properties = {
+            DEVICE_PATH: {
+                NM_DEVICE: {
+                    'DeviceType': 2,
+                    'Interface': 'wlan0',
+                    'State': STATE_DISCONNECTED,
+                    'ActiveConnection': NO_OBJECT,
+                },
+                NM_WIRELESS: {
+                    'ActiveAccessPoint': NO_OBJECT,
+                    'Bitrate': 0,
+                    'LastScan': 0,
+                },
+            },
+        }
+        self._numbers = itertools.count(1)
+        for ssid, bssid, strength, flags, wpa, rsn in ACCESS_POINTS:
+            self.add_access_point(ssid, strength, bssid, flags, wpa, rsn)
+        if connected:
+            self.connect_to(connected)
+
+    # --- Durum değişiklikleri ---
+
+    def set(self, path, interface, name, value):
+        """Özelliği değiştir ve PropertiesChanged yayınla"""
+        self.properties[path][interface][name] = value
+        signal = QDBusMessage.createSignal(path, DBUS_PROPERTIES, 'PropertiesChanged')
+        signal.setArguments([interface, {name: to_dbus(value)}, []])
+        self.bus.send(signal)
+
+    def access_points(self):
+        """(yol, özellikler) çiftleri"""
+        return [(path, interfaces[NM_ACCESS_POINT])
+                for path, interfaces in self.properties.items()
+                if NM_ACCESS_POINT in interfaces]
+
+    def find_access_point(self, ssid):
+        """SSID'nin en güçlü erişim noktasının yolu"""
+        matches = [(info['Strength'], path) for path, info in self.access_points()
+                   if info['Ssid'] == ssid.encode()]
+        return max(matches)[1] if matches else None
+
+    def add_access_point(self, ssid, strength, bssid=None, flags=0x1, wpa=0x0, rsn=0x188):
+        number = next(self._numbers)
+        path = f"{NM_PATH}/AccessPoint/{number}"
+        self.properties[path] = {NM_ACCESS_POINT: {
+            'Ssid': ssid.encode(),
+            'HwAddress': bssid or f"AA:BB:CC:00:01:{number:02X}",
+            'Strength': strength,
+            'Flags': flags,
+            'WpaFlags': wpa,
+            'RsnFlags': rsn,
+        }}
+        return path
+
+    def remove_access_point(self, ssid):
+        path = self.find_access_point(ssid)
+        if path is None:
+            return False
+        if self.active_access_point() == path:
+            self.disconnect()
+        del self.properties[path]
+        return True
+
+    def active_access_point(self):
+        return self.properties[DEVICE_PATH][NM_WIRELESS]['ActiveAccessPoint']
+
+    def connect_to(self, ssid):
+        path = self.find_access_point(ssid)
+        if path is None:
+            return False
+        self.properties[CONNECTION_PATH] = {NM_ACTIVE_CONNECTION: {'Id': ssid}}
+        self.set(DEVICE_PATH, NM_WIRELESS, 'ActiveAccessPoint', path)
+        self.set(DEVICE_PATH, NM_WIRELESS, 'Bitrate', 130000)
+        self.set(DEVICE_PATH, NM_DEVICE, 'ActiveConnection', CONNECTION_PATH)
+        self.set(DEVICE_PATH, NM_DEVICE, 'State', STATE_ACTIVATED)
+        return True
+
+    def disconnect(self):
+        self.properties.pop(CONNECTION_PATH, None)
+        self.set(DEVICE_PATH, NM_DEVICE, 'State', STATE_DISCONNECTED)
+        self.set(DEVICE_PATH, NM_DEVICE, 'ActiveConnection', NO_OBJECT)
+        self.set(DEVICE_PATH, NM_WIRELESS, 'ActiveAccessPoint', NO_OBJECT)
+        self.set(DEVICE_PATH, NM_WIRELESS, 'Bitrate', 0)
+
+    def finish_scan(self):
+        """Tarama bitti: güçler biraz değişir, LastScan güncellenir"""
+        for path, info in self.access_points():
+            info['Strength'] = max(1, min(100, info['Strength'] + random.randint(-5, 5)))
+        last_scan = self.properties[DEVICE_PATH][NM_WIRELESS]['LastScan']
+        self.set(DEVICE_PATH, NM_WIRELESS, 'LastScan', last_scan + 1)
+
+    # --- D-Bus ---
+
+    def introspect(self, path):
+        # Alt nesneler handleMessage'daki Introspect yanıtında listelenir
+        return ''
+
+    def handleMessage(self, message, connection):
+        path = message.path()
+        interface = message.interface()
+        member = message.member()
+        arguments = message.arguments()
+
+        if interface == DBUS_INTROSPECTABLE and member == 'Introspect':
+            reply = message.createReply()
+            reply.setArguments([self.introspection(path)])
+
+        elif interface == DBUS_PROPERTIES and member == 'Get':
+            value = self.properties.get(path, {}).get(arguments[0], {}).get(arguments[1])
+            if value is None:
+                reply = message.createErrorReply(
+                    'org.freedesktop.DBus.Error.InvalidArgs',
+                    f"No such property '{arguments[1]}'")
+            else:
+                reply = message.createReply()
+                reply.setArguments([QDBusVariant(to_dbus(value))])
+
+        elif interface == DBUS_PROPERTIES and member == 'GetAll':
+            values = self.properties.get(path, {}).get(arguments[0], {})
+            reply = message.createReply()
+            reply.setArguments([{name: to_dbus(value) for name, value in values.items()}])
+
+        elif interface == NM_WIRELESS and member == 'RequestScan' and path == DEVICE_PATH:
+            reply = message.createReply()
+            QTimer.singleShot(self.SCAN_DURATION_MS, self.finish_scan)
+
+        else:
+            reply = message.createErrorReply(
+                'org.freedesktop.DBus.Error.UnknownMethod',
+                f"{interface}.{member} desteklenmiyor ({path})")
+
+        connection.send(reply)
+        return True
+
+    def introspection(self, path) -> str:
+        """Yolun doğrudan altındaki nesneler ve yolun arayüzleri"""
+        prefix = path.rstrip('/') + '/'
+        children = sorted({
+            child[len(prefix):].split('/')[0]
+            for child in self.properties if child.startswith(prefix)
+        }, key=lambda name: (len(name), name))
+
+        nodes = ''.join(f'<node name="{name}"/>' for name in children)
+        interfaces = ''.join(f'<interface name="{name}"/>'
+                             for name in self.properties.get(path, {}))
+        return f'<node>{interfaces}{nodes}</node>'
+
+
+def to_dbus(value):
+    """Python değerini QtDBus tipine çevir (nesne yolu / byte dizisi)"""
+    if isinstance(value, bytes):
+        return QByteArray(value)
+    if isinstance(value, str) and value.startswith('/'):
+        return QDBusObjectPath(value)
+    return value
+
+
+class CommandReader(QObject):
+    """Standart girişi ayrı thread'de okur, satırları ana thread'e iletir"""
+
+    line_read = Signal(str)
+
+    def start(self):
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in sys.stdin:
+            self.line_read.emit(line)
+
+
+def run_command(manager, line):
+    words = line.split()
+    if not words:
+        return
+    command, args = words[0], words[1:]
+    active = manager.active_access_point()
+
+    if command == 'strength' and args and active != NO_OBJECT:
+        manager.set(active, NM_ACCESS_POINT, 'Strength', int(args[0]))
+    elif command == 'bitrate' and args:
+        manager.set(DEVICE_PATH, NM_WIRELESS, 'Bitrate', int(args[0]))
+    elif command == 'connect' and args:
+        if not manager.connect_to(' '.join(args)):
+            print("Erişim noktası bulunamadı")
+    elif command == 'disconnect':
+        manager.disconnect()
+    elif command == 'add' and len(args) >= 2:
+        manager.add_access_point(' '.join(args[:-1]), int(args[-1]))
+    elif command == 'remove' and args:
+        if not manager.remove_access_point(' '.join(args)):
+            print("Erişim noktası bulunamadı")
+    else:
+        print("Komutlar: strength N | bitrate KBIT | connect SSID | disconnect | "
+              "add SSID GÜÇ | remove SSID")
+
+
+def fluctuate(manager):
+    """Bağlı erişim noktasının gücü ve bit hızı kendiliğinden değişir"""
+    active = manager.active_access_point()
+    if active == NO_OBJECT:
+        return
+    strength = manager.properties[active][NM_ACCESS_POINT]['Strength']
+    manager.set(active, NM_ACCESS_POINT, 'Strength',
+                max(1, min(100, strength + random.randint(-8, 8))))
+    manager.set(DEVICE_PATH, NM_WIRELESS, 'Bitrate', random.choice((65000, 130000, 270000)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oturum veri yolunda sahte NetworkManager")
+    parser.add_argument('--connected', default='EvAgi',
+                        help="başlangıçta bağlı ağ (boş: bağlı değil)")
+    parser.add_argument('--interval', type=float, default=2.0,
+                        help="sinyal gücü / bit hızı değişim aralığı (saniye, 0: kapalı)")
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+
+    bus = QDBusConnection.sessionBus()
+    if not bus.isConnected():
+        print("Oturum veri yoluna bağlanılamadı (dbus-run-session ile çalıştırın)")
+        return 1
+    if not bus.registerService(NM_SERVICE):
+        print(f"{NM_SERVICE} adı alınamadı: {bus.lastError().message()}")
+        return 1
+
+    manager = MockNetworkManager(bus, connected=args.connected)
+    bus.registerVirtualObject(NM_PATH, manager, QDBusConnection.SubPath)
+
+    if args.interval:
+        timer = QTimer()
+        timer.timeout.connect(lambda: fluctuate(manager))
+        timer.start(int(args.interval * 1000))
+
+    reader = CommandReader()
+    reader.line_read.connect(lambda line: run_command(manager, line))
+    reader.start()
+
+    print(f"Sahte NetworkManager hazır ({len(manager.access_points())} erişim noktası)",
+          flush=True)
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
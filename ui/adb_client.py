@@ -0,0 +1,318 @@
+"""
+ADB sunucu istemcisi
+adb komut satırı aracını tekrar tekrar çalıştırmak yerine yerel adb
+sunucusunun soket protokolünü (varsayılan localhost:5037) kullanır.
+
+Protokol: istek "<4 haneli hex uzunluk><servis>" olarak gönderilir,
+sunucu "OKAY" ya da "FAIL" + uzunluk önekli hata mesajı ile yanıt verir.
+"""
+
+import functools
+import os
+import platform as sys_platform
+import socket
+import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+
+ADB_HOST = "127.0.0.1"
+ADB_PORT = 5037
+
+
+@functools.lru_cache(maxsize=None)
+def get_adb_path():
+    """ADB yolunu bul (bir kez aranır, sonuç önbellekte tutulur)"""
+    # Yaygın konumları dene
+    if sys_platform.system() == 'Windows':
+        possible_paths = [
+            r"C:\platform-tools\adb.exe",
+            r"C:\Android\sdk\platform-tools\adb.exe",
+            os.path.expanduser(r"~\AppData\Local\Android\Sdk\platform-tools\adb.exe"),
+            "adb"  # PATH'te ara
+        ]
+    else:  # Linux/macOS
+        possible_paths = [
+            "/usr/bin/adb",
+            "/usr/local/bin/adb",
+            os.path.expanduser("~/Android/Sdk/platform-tools/adb"),
+            os.path.expanduser("~/android-sdk/platform-tools/adb"),
+            "/opt/android-sdk/platform-tools/adb",
+            "adb"  # PATH'te ara
+        ]
+
+    for path in possible_paths:
+        if os.path.exists(path) or path == "adb":
+            return path
+
+    return None
+
+
+class AdbError(Exception):
+    """adb sunucusu FAIL yanıtı döndürdü"""
+
+
+def encode_request(service: str) -> bytes:
+    """Servis isteğini uzunluk önekli olarak kodla"""
+    payload = service.encode('utf-8')
+    return b"%04x" % len(payload) + payload
+
+
+def read_exact(sock, size: int) -> bytes:
+    """Soketten tam olarak size byte oku"""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("adb sunucusu bağlantıyı kapattı")
+        data += chunk
+    return bytes(data)
+
+
+def read_message(sock) -> str:
+    """Uzunluk önekli mesajı oku"""
+    length = int(read_exact(sock, 4), 16)
+    return read_exact(sock, length).decode('utf-8', errors='replace')
+
+
+def read_status(sock):
+    """OKAY/FAIL yanıtını oku, FAIL ise AdbError fırlat"""
+    status = read_exact(sock, 4)
+    if status == b"OKAY":
+        return
+    if status == b"FAIL":
+        raise AdbError(read_message(sock))
+    raise AdbError(f"Beklenmeyen yanıt: {status!r}")
+
+
+def parse_devices(payload: str) -> dict:
+    """'seri\\tdurum' satırlarını {seri: durum} sözlüğüne çevir"""
+    devices = {}
+    for line in payload.splitlines():
+        serial, _, state = line.partition('\t')
+        if serial and state:
+            devices[serial] = state.strip()
+    return devices
+
+
+class AdbDeviceMonitor(QThread):
+    """
+    Olay tabanlı telefon bağlantı takibi
+    adb sunucusuna tek bir kalıcı bağlantı açıp 'host:track-devices'
+    servisine abone olur; sunucu cihaz listesi her değiştiğinde yeni listeyi
+    gönderir. Periyodik sorgu ya da alt süreç yoktur, arayüz thread'i
+    hiç bloklanmaz.
+    """
+
+    devices_changed = Signal(dict)     # {seri: durum}
+    device_connected = Signal(str)     # seri
+    device_disconnected = Signal(str)  # seri
+
+    RECONNECT_INTERVAL = 2.0
+
+    def __init__(self, host=ADB_HOST, port=ADB_PORT, adb_path=None, parent=None):
+        super().__init__(parent)
+        self.host = host
+        self.port = port
+        # Sunucu kapalıysa bir kez başlatmak için (None: başlatma)
+        self.adb_path = adb_path
+
+        self.running = True
+        self.devices = {}
+        self._sock = None
+        self._wake = threading.Event()
+
+    def run(self):
+        """Sunucuya bağlan ve cihaz listesi değişikliklerini dinle"""
+        server_started = False
+        reported = False
+
+        while self.running:
+            try:
+                sock = socket.create_connection((self.host, self.port), timeout=2)
+                self._sock = sock
+                sock.sendall(encode_request("host:track-devices"))
+                read_status(sock)
+
+                # Olay beklerken zaman aşımı yok; stop() soketi kapatır
+                sock.settimeout(None)
+                server_started = False
+                reported = False
+
+                while self.running:
+                    self._apply(parse_devices(read_message(sock)))
+
+            except (OSError, ConnectionError, AdbError, ValueError) as e:
+                if not self.running:
+                    break
+
+                # Sunucu gitti - bilinen cihazlar artık bağlı değil
+                self._apply({})
+
+                if self.adb_path and not server_started:
+                    server_started = True
+                    self._start_server()
+                    continue
+
+                if not reported:
+                    reported = True
+                    print(f"adb sunucusuna bağlanılamadı: {e}")
+                self._wake.wait(self.RECONNECT_INTERVAL)
+                self._wake.clear()
+
+            finally:
+                self._close_socket()
+
+    def _apply(self, devices: dict):
+        """Yeni listeyi öncekiyle karşılaştırıp olayları yayınla"""
+        if devices == self.devices:
+            return
+
+        old = self.devices
+        self.devices = devices
+
+        for serial, state in devices.items():
+            if state == 'device' and old.get(serial) != 'device':
+                self.device_connected.emit(serial)
+        for serial, state in old.items():
+            if state == 'device' and devices.get(serial) != 'device':
+                self.device_disconnected.emit(serial)
+
+        self.devices_changed.emit(dict(devices))
+
+    def _start_server(self):
+        """adb sunucusunu başlat (bu thread'de, arayüzü bloklamadan)"""
+        try:
+            subprocess.run([self.adb_path, 'start-server'],
+                           capture_output=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"adb sunucusu başlatılamadı: {e}")
+
+    def _close_socket(self):
+        sock = self._sock
+        self._sock = None
+        if sock:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def stop(self):
+        """Takibi durdur"""
+        self.running = False
+        self._wake.set()
+        sock = self._sock
+        if sock:
+            try:
+                # Bekleyen recv() hemen dönsün
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.wait()
+
+
+class AdbClient(QObject):
+    """
+    Paylaşılan asenkron adb istemcisi
+    - Komutlar tek bir arka plan thread'inde sırayla çalışır
+    - Her komut bir Future döndürür; callback verilirse sonuç arayüz
+      thread'inde callback(future) olarak iletilir
+    - adb süreci başlatılmaz, yerel adb sunucusunun soket protokolü kullanılır.
+      Sunucu her transport komutundan sonra bağlantıyı kapattığı için komut
+      başına yalnızca ucuz bir yerel soket bağlantısı açılır.
+    - Uygulama genelinde tek cihaz takipçisini (AdbDeviceMonitor) barındırır
+    """
+
+    _completed = Signal(object, object)  # callback, future
+
+    _shared = None
+
+    TIMEOUT = 5.0
+
+    @classmethod
+    def shared(cls) -> 'AdbClient':
+        """Uygulama genelindeki ortak istemci"""
+        if cls._shared is None:
+            cls._shared = cls(adb_path=get_adb_path())
+        return cls._shared
+
+    def __init__(self, host=ADB_HOST, port=ADB_PORT, adb_path=None, parent=None):
+        super().__init__(parent)
+        self.host = host
+        self.port = port
+        self.adb_path = adb_path
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='adb')
+        self._completed.connect(self._dispatch)
+
+        # Cihaz takibi (start_monitor ile başlatılır)
+        self.monitor = AdbDeviceMonitor(host, port, adb_path)
+
+    # --- Genel arayüz (arayüz thread'inden çağrılır, bloklamaz) ---
+
+    def devices(self, callback=None) -> Future:
+        """Cihaz listesi: {seri: durum}"""
+        return self.submit(self._devices, callback=callback)
+
+    def shell(self, command: str, serial=None, callback=None) -> Future:
+        """Cihazda kabuk komutu çalıştır, çıktıyı döndür"""
+        return self.submit(self._shell, command, serial, callback=callback)
+
+    def submit(self, func, *args, callback=None) -> Future:
+        """İşi kuyruğa ekle"""
+        future = self._executor.submit(func, *args)
+        if callback:
+            future.add_done_callback(lambda f: self._completed.emit(callback, f))
+        return future
+
+    def start_monitor(self):
+        """Cihaz takibini başlat (birden fazla çağrı güvenli)"""
+        if not self.monitor.isRunning():
+            self.monitor.start()
+
+    def shutdown(self):
+        """Takipçiyi durdur, bekleyen komutları iptal et"""
+        self.monitor.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(self, callback, future):
+        # Arayüz thread'inde çalışır
+        callback(future)
+
+    # --- Protokol (arka plan thread'inde çalışır) ---
+
+    def _connect(self):
+        """Sunucuya bağlan; kapalıysa bir kez başlat"""
+        try:
+            return socket.create_connection((self.host, self.port), timeout=self.TIMEOUT)
+        except ConnectionRefusedError:
+            if not self.adb_path:
+                raise
+            subprocess.run([self.adb_path, 'start-server'],
+                           capture_output=True, timeout=10)
+            return socket.create_connection((self.host, self.port), timeout=self.TIMEOUT)
+
+    def _devices(self) -> dict:
+        with self._connect() as sock:
+            sock.sendall(encode_request("host:devices"))
+            read_status(sock)
+            return parse_devices(read_message(sock))
+
+    def _shell(self, command, serial) -> str:
+        with self._connect() as sock:
+            transport = f"host:transport:{serial}" if serial else "host:transport-any"
+            sock.sendall(encode_request(transport))
+            read_status(sock)
+            sock.sendall(encode_request(f"shell:{command}"))
+            read_status(sock)
+
+            # Çıktı bağlantı kapanana kadar gelir
+            output = bytearray()
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                output += chunk
+            return output.decode('utf-8', errors='replace').replace('\r\n', '\n')
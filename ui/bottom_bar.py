@@ -95,7 +95,8 @@ class BottomBar(QWidget):
             type_names = {
                 'usb': 'USB',
                 'wifi': 'WiFi',
-                'bluetooth': 'Bluetooth'
+                'bluetooth': 'Bluetooth',
+                'replay': 'Kayıt'
             }
             conn_text = type_names.get(connection_type, connection_type.upper())
             text = f"{text} ({conn_text})"
@@ -3,27 +3,390 @@ Geri Görüş Kamerası Widget'ı
 Raspberry Pi'deki USB kameradan video akışı gösterir
 """
 
+import threading
+import time
+from collections import deque
+
 import cv2
 import numpy as np
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
+from PySide6.QtCore import QThread, Qt, Signal
 from PySide6.QtGui import QImage, QPixmap
 
 
+class LatestFrameSlot:
+    """
+    Tek slotlu en güncel frame tamponu
+    - Arayüz yetişemezse eski frame'ler kuyrukta beklemez, üzerine yazılır
+    - Gösterim tamponları (NumPy) önceden ayrılır ve frame'ler arasında
+      yeniden kullanılır: biri arayüzde bekler, biri gösterilir, biri yazılır
+    """
+    
+    BUFFER_COUNT = 3
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffers = [None] * self.BUFFER_COUNT
+        self._image = None
+        self._pending = None   # arayüzün alacağı tampon
+        self._showing = None   # arayüzün şu an kullandığı tampon
+        self._captured_at = 0.0
+        self.frames_dropped = 0
+    
+    def acquire(self, shape):
+        """Yazılabilir bir gösterim tamponu al: (indeks, ndarray)"""
+        with self._lock:
+            for index, buffer in enumerate(self._buffers):
+                if index == self._pending or index == self._showing:
+                    continue
+                if buffer is None or buffer.shape != shape:
+                    # Yalnızca ilk kullanımda / gösterim boyutu değişince ayrılır
+                    buffer = np.empty(shape, dtype=np.uint8)
+                    self._buffers[index] = buffer
+                return index, buffer
+        raise RuntimeError("Boş gösterim tamponu yok")
+    
+    def put(self, index, image, captured_at) -> bool:
+        """Frame'i yaz, slot boştuysa True döndür (arayüze haber verilmeli)"""
+        with self._lock:
+            was_empty = self._pending is None
+            if not was_empty:
+                self.frames_dropped += 1
+            self._pending = index
+            self._image = image
+            self._captured_at = captured_at
+            return was_empty
+    
+    def take(self):
+        """En güncel frame'i al: (QImage, yakalama zamanı) veya (None, 0)"""
+        with self._lock:
+            if self._pending is None:
+                return None, 0.0
+            image, captured_at = self._image, self._captured_at
+            self._showing = self._pending
+            self._pending = None
+            self._image = None
+            return image, captured_at
+    
+    def release(self):
+        """Arayüz gösterilen frame'le işini bitirdi (tampon yeniden yazılabilir)"""
+        with self._lock:
+            self._showing = None
+    
+    def clear(self):
+        """Slotu boşalt"""
+        with self._lock:
+            self._pending = None
+            self._showing = None
+            self._image = None
+
+
+class ParkingGuideOverlay:
+    """
+    Direksiyon açısına göre kıvrılan park yardım çizgisi katmanı
+    - Çizgi yolları (polyline) 1°'lik adımlarla, çözünürlükten bağımsız
+      oranlar olarak bir kez hesaplanır (açı tablosu)
+    - Çözünürlük değişince tüm açıların piksel koordinatları tek bir vektörel
+      işlemle hesaplanır (361 açı x 7 çizgi x 16 nokta x 2 int32, ~320 KB);
+      canlı yolda ilk kullanım gecikmesi ve açı başına piksel önbelleği yok
+    - Canlı yolda tablo araması ve renk grubu başına tek cv2.polylines çağrısı
+      yapılır, çizgiler çağıranın tamponuna yerinde çizilir
+    """
+    
+    # ((x1, y1), (x2, y2)) genişlik/yükseklik oranı, BGR renk, kalınlık
+    # (x1, y1) aracın arkası (frame altı), (x2, y2) çizginin uzak ucu
+    GUIDE_LINES = [
+        # Yeşil çizgiler (güvenli bölge)
+        (((0.3, 1.0), (0.4, 0.6)), (0, 255, 0), 3),
+        (((0.7, 1.0), (0.6, 0.6)), (0, 255, 0), 3),
+        # Sarı çizgiler (dikkat bölgesi)
+        (((0.25, 1.0), (0.35, 0.5)), (0, 255, 255), 3),
+        (((0.75, 1.0), (0.65, 0.5)), (0, 255, 255), 3),
+        # Kırmızı çizgiler (tehlike bölgesi)
+        (((0.2, 1.0), (0.3, 0.4)), (0, 0, 255), 3),
+        (((0.8, 1.0), (0.7, 0.4)), (0, 0, 255), 3),
+        # Orta çizgi
+        (((0.5, 1.0), (0.5, 0.3)), (255, 255, 255), 2),
+    ]
+    
+    # Direksiyon açısı aralığı (derece) ve tam kırımda uzak uçtaki yanal kayma
+    MAX_STEERING_ANGLE = 180
+    MAX_BEND = 0.25  # frame genişliği oranı
+    CURVE_POINTS = 16
+    
+    def __init__(self):
+        self._size = None
+        # (açı sayısı, çizgi sayısı, nokta, 2) oransal yollar
+        self._polylines = self._build_polyline_table()
+        # Geçerli çözünürlükteki piksel koordinatları (aynı şekil, int32)
+        self._pixels = None
+        # Aynı renk ve kalınlıktaki çizgiler tek çağrıda çizilir
+        self._groups = self._build_groups()
+    
+    def _build_polyline_table(self):
+        """Tüm açılar için kıvrık çizgi yollarını oransal olarak hesapla"""
+        t = np.linspace(0.0, 1.0, self.CURVE_POINTS, dtype=np.float32)
+        angles = np.arange(-self.MAX_STEERING_ANGLE, self.MAX_STEERING_ANGLE + 1,
+                           dtype=np.float32)
+        # Yanal kayma uzaklıkla karesel artar (yakında düz, uzakta kıvrık)
+        bend = self.MAX_BEND * (angles / self.MAX_STEERING_ANGLE)[:, None] * t * t
+        
+        table = np.empty((len(angles), len(self.GUIDE_LINES), self.CURVE_POINTS, 2),
+                         dtype=np.float32)
+        for number, (((x1, y1), (x2, y2)), _, _) in enumerate(self.GUIDE_LINES):
+            table[:, number, :, 0] = x1 + (x2 - x1) * t + bend
+            table[:, number, :, 1] = y1 + (y2 - y1) * t
+        return table
+    
+    def _build_groups(self):
+        """[(renk, kalınlık, [çizgi no, ...]), ...]"""
+        groups = {}
+        for number, (_, color, thickness) in enumerate(self.GUIDE_LINES):
+            groups.setdefault((color, thickness), []).append(number)
+        return [(color, thickness, numbers) for (color, thickness), numbers in groups.items()]
+    
+    def quantize(self, angle) -> int:
+        """Açıyı tablo adımına (1°) yuvarla ve sınırla"""
+        angle = int(round(angle))
+        return max(-self.MAX_STEERING_ANGLE, min(self.MAX_STEERING_ANGLE, angle))
+    
+    def prepare(self, width, height):
+        """Tüm açıların piksel koordinatlarını verilen çözünürlük için hesapla"""
+        if self._size == (width, height):
+            return
+        scale = np.array([width, height], dtype=np.float32)
+        self._pixels = np.round(self._polylines * scale).astype(np.int32)
+        self._size = (width, height)
+    
+    def apply(self, frame, steering_angle=0.0):
+        """Çizgileri frame üzerine yerinde uygula (frame'i döndürür)"""
+        h, w = frame.shape[:2]
+        self.prepare(w, h)
+        
+        lines = self._pixels[self.quantize(steering_angle) + self.MAX_STEERING_ANGLE]
+        
+        # OpenCV yalnızca bitişik tampona yazabilir; değilse çizip geri kopyala
+        target = frame if frame.flags.c_contiguous else np.ascontiguousarray(frame)
+        for color, thickness, numbers in self._groups:
+            cv2.polylines(target, [lines[number] for number in numbers], False,
+                          color, thickness)
+        if target is not frame:
+            frame[...] = target
+        return frame
+
+
+def fit_size(width, height, target_width, target_height):
+    """En-boy oranını koruyarak hedef alana sığan boyutu hesapla"""
+    scale = min(target_width / width, target_height / height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+class CameraCaptureThread(QThread):
+    """
+    Kamera yakalama thread'i
+    capture.read(), aynalama, park çizgileri ve ölçekleme bu thread'de
+    yapılır; arayüze yalnızca gösterime hazır QImage gider.
+    Frame'ler BGR olarak kalır (QImage.Format_BGR888, renk dönüşümü yok),
+    aynalama ve ölçekleme önceden ayrılmış tamponlara dst= ile yazılır.
+    
+    Bekleme (standby) modunda cihaz açık tutulur ve düşük aralıkla yalnızca
+    grab() yapılır (decode / işleme yok); aktif moda geçince ilk frame
+    bir frame aralığı içinde hazır olur.
+    """
+    frame_ready = Signal()
+    camera_error = Signal(str)
+    
+    # Bekleme modunda grab aralığı (saniye)
+    STANDBY_INTERVAL = 0.2
+    # Bu süre boyunca frame alınamazsa (kamera çıkarıldı) thread sonlanır;
+    # bir sonraki vites geçişinde cihaz yeniden açılır
+    FAILURE_TIMEOUT = 1.0
+    
+    def __init__(self, camera_index, frame_slot, guides_at_display_resolution=True, active=True):
+        super().__init__()
+        self.camera_index = camera_index
+        self.frame_slot = frame_slot
+        self.running = True
+        self.capture = None
+        # False: bekleme modu (cihaz açık, frame işlenmez)
+        self.active = active
+        self._wake = threading.Event()
+        # Park çizgileri önbelleğe alınmış katman olarak uygulanır
+        self.guide_overlay = ParkingGuideOverlay()
+        # True: önce ölçekle, çizgileri gösterim çözünürlüğünde uygula
+        # (tam çözünürlüklü frame'e hiç dokunulmaz)
+        self.guides_at_display_resolution = guides_at_display_resolution
+        # Arayüzden atomik olarak güncellenen hedef boyut (genişlik, yükseklik)
+        self.target_size = (0, 0)
+        # Arayüzden güncellenen direksiyon açısı (derece)
+        self.steering_angle = 0.0
+        # Yeniden kullanılan yakalama / aynalama tamponları
+        self._capture_buffer = None
+        self._flip_buffer = None
+    
+    def set_target_size(self, width, height):
+        """Gösterim boyutunu ayarla (arayüz thread'inden çağrılır)"""
+        self.target_size = (width, height)
+    
+    def set_active(self, active):
+        """Aktif / bekleme modu arasında geç (arayüz thread'inden çağrılır)"""
+        self.active = active
+        self._wake.set()
+    
+    def open_camera(self) -> bool:
+        """Kamerayı aç ve ayarla"""
+        # OpenCV ile kamerayı aç
+        self.capture = cv2.VideoCapture(self.camera_index)
+        
+        # Kamera ayarları
+        self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+        self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        self.capture.set(cv2.CAP_PROP_FPS, 30)
+        # Sürücüde tek tampon: bekleme sonrası ilk frame bayat olmasın
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        return self.capture.isOpened()
+    
+    def run(self):
+        """Yakalama döngüsü"""
+        try:
+            if not self.open_camera():
+                print(f"Kamera açılamadı: /dev/video{self.camera_index}")
+                self.camera_error.emit("Kamera bağlantısı kurulamadı!")
+                return
+            
+            print(f"Kamera başlatıldı: /dev/video{self.camera_index}")
+            failing_since = None
+            
+            while self.running:
+                if not self.active:
+                    # Bekleme modu: cihazı sıcak tut, decode / işleme yapma
+                    if self.capture.grab():
+                        failing_since = None
+                    elif failing_since is None:
+                        failing_since = time.perf_counter()
+                    elif time.perf_counter() - failing_since > self.FAILURE_TIMEOUT:
+                        print("Kamera yanıt vermiyor, bekleme modu sonlandırıldı")
+                        break
+                    self._wake.wait(self.STANDBY_INTERVAL)
+                    self._wake.clear()
+                    continue
+                
+                ret, frame = self.capture.read(self._capture_buffer)
+                captured_at = time.perf_counter()
+                
+                if not ret:
+                    # Hata mesajını her frame'de değil, bir kez bildir
+                    if failing_since is None:
+                        failing_since = captured_at
+                        print("Kameradan frame okunamadı")
+                        self.camera_error.emit("Kamera görüntüsü alınamıyor!")
+                    elif captured_at - failing_since > self.FAILURE_TIMEOUT:
+                        # Cihaz gitti - thread sonlansın, yeniden açılabilsin
+                        break
+                    self.msleep(33)
+                    continue
+                
+                failing_since = None
+                self._capture_buffer = frame
+                index, image = self.process_frame(frame)
+                
+                if self.frame_slot.put(index, image, captured_at):
+                    self.frame_ready.emit()
+        
+        except Exception as e:
+            print(f"Kamera başlatma hatası: {e}")
+            self.camera_error.emit(f"Kamera hatası: {str(e)}")
+        
+        finally:
+            if self.capture:
+                self.capture.release()
+                self.capture = None
+    
+    def process_frame(self, frame):
+        """
+        Ham BGR frame'i gösterime hazır QImage'e çevir
+        Döner: (tampon indeksi, QImage) - QImage tamponu kopyalamadan sarar
+        """
+        h, w = frame.shape[:2]
+        
+        # Tek seferde tam etiket boyutuna ölçekle
+        width, height = self.target_size
+        if width > 0 and height > 0:
+            out_w, out_h = fit_size(w, h, width, height)
+        else:
+            out_w, out_h = w, h
+        
+        index, display = self.frame_slot.acquire((out_h, out_w, 3))
+        
+        if self.guides_at_display_resolution:
+            # Önce küçült, aynalamayı ve çizgileri küçük tamponda yerinde yap
+            # (tam çözünürlüklü frame'e hiç dokunulmaz)
+            self.scale_into(frame, display)
+            cv2.flip(display, 1, dst=display)
+            self.guide_overlay.apply(display, self.steering_angle)
+        else:
+            # Tam çözünürlükte aynala ve çiz, sonra ölçekle
+            if self._flip_buffer is None or self._flip_buffer.shape != frame.shape:
+                self._flip_buffer = np.empty_like(frame)
+            cv2.flip(frame, 1, dst=self._flip_buffer)
+            self.guide_overlay.apply(self._flip_buffer, self.steering_angle)
+            self.scale_into(self._flip_buffer, display)
+        
+        image = QImage(display.data, out_w, out_h, display.strides[0], QImage.Format_BGR888)
+        return index, image
+    
+    @staticmethod
+    def scale_into(src, dst):
+        """src'yi dst boyutuna ölçekleyerek dst'ye yaz"""
+        if src.shape == dst.shape:
+            np.copyto(dst, src)
+        else:
+            # INTER_LINEAR: Qt SmoothTransformation ile aynı (bilinear), tam
+            # sayı olmayan oranlarda INTER_AREA'dan ~10 kat hızlı
+            h, w = dst.shape[:2]
+            cv2.resize(src, (w, h), dst=dst, interpolation=cv2.INTER_LINEAR)
+    
+    def stop(self):
+        """Thread'i durdur"""
+        self.running = False
+        self._wake.set()
+        self.wait()
+    
+    def set_steering_angle(self, angle):
+        """Park çizgilerinin takip edeceği direksiyon açısı (arayüz thread'inden)"""
+        self.steering_angle = angle
+
+
 class CameraView(QWidget):
     """USB Kamera görüntüsü widget'ı"""
     
+    # Her gösterilen frame için yakalama -> ekran gecikmesi (ms)
+    frame_latency = Signal(float)
+    
     def __init__(self, camera_index=0, parent=None):
         super().__init__(parent)
         
         self.camera_index = camera_index
-        self.capture = None
-        self.timer = QTimer()
+        self.capture_thread = None
+        self.frame_slot = LatestFrameSlot()
         self.is_active = False
+        # Park çizgileri ölçeklemeden sonra gösterim çözünürlüğünde uygulansın
+        self.guides_at_display_resolution = True
+        # Son bilinen direksiyon açısı (kamera başlarken worker'a aktarılır)
+        self.steering_angle = 0.0
+        
+        # Geri vites -> ilk frame süresi ölçümü
+        self._engaged_at = None
+        self.last_time_to_first_frame_ms = 0.0
+        
+        # Gecikme ölçümleri (son 120 frame)
+        self.latencies_ms = deque(maxlen=120)
+        self.last_latency_ms = 0.0
         
         # UI kurulumu
         self.setup_ui()
-        
+    
     def setup_ui(self):
         """UI elemanlarını oluştur"""
         layout = QVBoxLayout(self)
@@ -32,6 +395,8 @@ class CameraView(QWidget):
         # Video gösterimi için label
         self.video_label = QLabel()
         self.video_label.setAlignment(Qt.AlignCenter)
+        # Frame'ler etiket boyutunda üretilir, pixmap layout'u büyütmesin
+        self.video_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
         self.video_label.setStyleSheet("""
             QLabel {
                 background-color: #000000;
@@ -55,107 +420,141 @@ class CameraView(QWidget):
         
         layout.addWidget(self.indicator_label)
         layout.addWidget(self.video_label, stretch=1)
+    
+    def _ensure_capture_thread(self, active):
+        """
+        Yakalama thread'i yoksa ya da sonlanmışsa oluştur (cihaz arka planda açılır)
+        Kamera açılamadıysa / çıkarıldıysa her vites geçişinde yeniden denenir.
+        """
+        if self.capture_thread and not self.capture_thread.isFinished():
+            self.capture_thread.set_active(active)
+            return
+        
+        self._discard_capture_thread()
+        self.frame_slot.clear()
+        
+        self.capture_thread = CameraCaptureThread(
+            self.camera_index, self.frame_slot,
+            guides_at_display_resolution=self.guides_at_display_resolution,
+            active=active
+        )
+        self.capture_thread.frame_ready.connect(self.display_frame)
+        self.capture_thread.camera_error.connect(self.show_error_message)
+        self.capture_thread.finished.connect(self.on_capture_finished)
+        self.capture_thread.set_target_size(
+            self.video_label.width(), self.video_label.height()
+        )
+        self.capture_thread.set_steering_angle(self.steering_angle)
+        self.capture_thread.start()
+    
+    def _discard_capture_thread(self):
+        """Sonlanmış yakalama thread'ini bırak"""
+        thread = self.capture_thread
+        self.capture_thread = None
+        if thread:
+            thread.wait()
+            thread.deleteLater()
+    
+    def on_capture_finished(self):
+        """
+        Yakalama thread'i kendiliğinden sonlandı (kamera açılamadı / çıkarıldı)
+        Aktif / bekleme durumu sıfırlanır; bir sonraki start_camera() ya da
+        standby_camera() çağrısı cihazı yeniden açar.
+        """
+        if self.sender() is not self.capture_thread:
+            return
         
-        # Timer bağlantısı
-        self.timer.timeout.connect(self.update_frame)
+        self._discard_capture_thread()
+        self.is_active = False
+        self._engaged_at = None
     
-    def start_camera(self):
-        """Kamerayı başlat"""
+    def standby_camera(self):
+        """
+        Kamerayı bekleme moduna al
+        Cihaz açık kalır (gerekirse arka planda açılır), görüntü işlenmez.
+        Geri vitese geçişte ilk frame bir frame aralığı içinde gelir.
+        """
+        if self.capture_thread and not self.is_active:
+            return
+        
+        self.is_active = False
+        self._engaged_at = None
+        self._ensure_capture_thread(active=False)
+        self.video_label.clear()
+    
+    def start_camera(self, engaged_at=None):
+        """
+        Kamerayı başlat (açma işlemi arka planda yapılır)
+        engaged_at: geri vitesin istendiği an (perf_counter); ilk frame
+        süresi buradan ölçülür, verilmezse çağrı anı kullanılır
+        """
         if self.is_active:
             return
         
-        try:
-            # OpenCV ile kamerayı aç
-            self.capture = cv2.VideoCapture(self.camera_index)
-            
-            # Kamera ayarları
-            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-            self.capture.set(cv2.CAP_PROP_FPS, 30)
-            
-            if self.capture.isOpened():
-                self.is_active = True
-                # 30 FPS için ~33ms
-                self.timer.start(33)
-                print(f"Kamera başlatıldı: /dev/video{self.camera_index}")
-            else:
-                print(f"Kamera açılamadı: /dev/video{self.camera_index}")
-                self.show_error_message("Kamera bağlantısı kurulamadı!")
-                
-        except Exception as e:
-            print(f"Kamera başlatma hatası: {e}")
-            self.show_error_message(f"Kamera hatası: {str(e)}")
+        self.is_active = True
+        self._engaged_at = engaged_at if engaged_at is not None else time.perf_counter()
+        self._ensure_capture_thread(active=True)
     
     def stop_camera(self):
-        """Kamerayı durdur"""
-        if not self.is_active:
+        """Kamerayı durdur ve cihazı serbest bırak"""
+        if not self.capture_thread:
             return
         
         self.is_active = False
-        self.timer.stop()
+        self._engaged_at = None
         
-        if self.capture:
-            self.capture.release()
-            self.capture = None
+        thread = self.capture_thread
+        self.capture_thread = None
+        thread.stop()
+        thread.deleteLater()
+        
+        self.frame_slot.clear()
         
         # Ekranı temizle
         self.video_label.clear()
         print("Kamera durduruldu")
     
-    def update_frame(self):
-        """Kamera görüntüsünü güncelle"""
-        if not self.capture or not self.is_active:
-            return
-        
-        ret, frame = self.capture.read()
-        
-        if ret:
-            # Görüntüyü aynala (geri görüş için)
-            frame = cv2.flip(frame, 1)
-            
-            # Park yardım çizgileri ekle
-            frame = self.add_parking_guides(frame)
-            
-            # BGR'den RGB'ye çevir
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # QImage'e çevir
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            
-            # Widget boyutuna göre ölçekle
-            scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-                self.video_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            self.video_label.setPixmap(scaled_pixmap)
-        else:
-            print("Kameradan frame okunamadı")
-            self.show_error_message("Kamera görüntüsü alınamıyor!")
+    def set_steering_angle(self, angle):
+        """Direksiyon açısını güncelle (park çizgileri buna göre kıvrılır)"""
+        self.steering_angle = angle
+        if self.capture_thread:
+            self.capture_thread.set_steering_angle(angle)
     
-    def add_parking_guides(self, frame):
-        """Park yardım çizgilerini ekle"""
-        h, w = frame.shape[:2]
-        
-        # Yeşil çizgiler (güvenli bölge)
-        cv2.line(frame, (int(w * 0.3), h), (int(w * 0.4), int(h * 0.6)), (0, 255, 0), 3)
-        cv2.line(frame, (int(w * 0.7), h), (int(w * 0.6), int(h * 0.6)), (0, 255, 0), 3)
+    def display_frame(self):
+        """En güncel frame'i göster (yalnızca blit)"""
+        image, captured_at = self.frame_slot.take()
+        if image is None:
+            return
+        if not self.is_active:
+            self.frame_slot.release()
+            return
         
-        # Sarı çizgiler (dikkat bölgesi)
-        cv2.line(frame, (int(w * 0.25), h), (int(w * 0.35), int(h * 0.5)), (0, 255, 255), 3)
-        cv2.line(frame, (int(w * 0.75), h), (int(w * 0.65), int(h * 0.5)), (0, 255, 255), 3)
+        # fromImage kopyalar, ardından tampon worker'a geri verilir
+        self.video_label.setPixmap(QPixmap.fromImage(image))
+        self.frame_slot.release()
         
-        # Kırmızı çizgiler (tehlike bölgesi)
-        cv2.line(frame, (int(w * 0.2), h), (int(w * 0.3), int(h * 0.4)), (0, 0, 255), 3)
-        cv2.line(frame, (int(w * 0.8), h), (int(w * 0.7), int(h * 0.4)), (0, 0, 255), 3)
+        now = time.perf_counter()
         
-        # Orta çizgi
-        cv2.line(frame, (int(w * 0.5), h), (int(w * 0.5), int(h * 0.3)), (255, 255, 255), 2)
+        # Geri vitese geçişten ilk frame'e kadar geçen süre
+        if self._engaged_at is not None:
+            self.last_time_to_first_frame_ms = (now - self._engaged_at) * 1000.0
+            self._engaged_at = None
+            print(f"🎥 Geri görüş ilk frame: {self.last_time_to_first_frame_ms:.0f} ms")
         
-        return frame
+        # Yakalama -> ekran gecikmesi
+        self.last_latency_ms = (now - captured_at) * 1000.0
+        self.latencies_ms.append(self.last_latency_ms)
+        self.frame_latency.emit(self.last_latency_ms)
+    
+    def latency_stats(self) -> dict:
+        """Son frame'lerin gecikme özeti (ms)"""
+        if not self.latencies_ms:
+            return {'last': 0.0, 'avg': 0.0, 'max': 0.0}
+        return {
+            'last': self.last_latency_ms,
+            'avg': sum(self.latencies_ms) / len(self.latencies_ms),
+            'max': max(self.latencies_ms)
+        }
     
     def show_error_message(self, message):
         """Hata mesajı göster"""
@@ -173,6 +572,8 @@ class CameraView(QWidget):
     def resizeEvent(self, event):
         """Widget boyutu değiştiğinde"""
         super().resizeEvent(event)
-        # Mevcut frame'i yeniden ölçekle
-        if self.is_active and self.video_label.pixmap():
-            self.update_frame()
+        # Sonraki frame'ler yeni boyutta üretilsin
+        if self.capture_thread:
+            self.capture_thread.set_target_size(
+                self.video_label.width(), self.video_label.height()
+            )
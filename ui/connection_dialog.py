@@ -1,10 +1,11 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QComboBox, QLineEdit, QGroupBox,
-    QRadioButton, QButtonGroup, QListWidget, QMessageBox
+    QRadioButton, QButtonGroup, QListWidget, QMessageBox, QFileDialog
 )
 from PySide6.QtCore import Qt, Signal
 from arduino.arduino_reader import ArduinoReader, ConnectionType
+from arduino.telemetry_recorder import DEFAULT_DIRECTORY, TelemetryLog, segment_path
 
 
 class ConnectionSettingsDialog(QDialog):
@@ -84,16 +85,19 @@ class ConnectionSettingsDialog(QDialog):
         self.usb_radio = QRadioButton("USB Serial")
         self.wifi_radio = QRadioButton("WiFi (TCP/IP)")
         self.bluetooth_radio = QRadioButton("Bluetooth")
+        self.replay_radio = QRadioButton("Kayıt Oynatma")
         
         self.usb_radio.setChecked(True)
         
         self.connection_type_group.addButton(self.usb_radio, 0)
         self.connection_type_group.addButton(self.wifi_radio, 1)
         self.connection_type_group.addButton(self.bluetooth_radio, 2)
+        self.connection_type_group.addButton(self.replay_radio, 3)
         
         type_layout.addWidget(self.usb_radio)
         type_layout.addWidget(self.wifi_radio)
         type_layout.addWidget(self.bluetooth_radio)
+        type_layout.addWidget(self.replay_radio)
         type_group.setLayout(type_layout)
         
         # USB ayarları
@@ -157,10 +161,37 @@ class ConnectionSettingsDialog(QDialog):
         self.bluetooth_group.setLayout(bt_layout)
         self.bluetooth_group.setVisible(False)
         
+        # Kayıt oynatma ayarları
+        self.replay_group = QGroupBox("Kayıt Oynatma Ayarları")
+        replay_layout = QVBoxLayout()
+        
+        session_layout = QHBoxLayout()
+        session_layout.addWidget(QLabel("Kayıt:"))
+        self.session_combo = QComboBox()
+        self.replay_file_btn = QPushButton("📂")
+        self.replay_file_btn.setMaximumWidth(40)
+        self.replay_file_btn.clicked.connect(self.choose_replay_file)
+        session_layout.addWidget(self.session_combo, 1)
+        session_layout.addWidget(self.replay_file_btn)
+        
+        speed_layout = QHBoxLayout()
+        speed_layout.addWidget(QLabel("Hız:"))
+        self.speed_combo = QComboBox()
+        for speed in (1, 2, 5, 10, 50, 100):
+            self.speed_combo.addItem(f"{speed}x", float(speed))
+        self.speed_combo.addItem("Azami (arayüz verimi ölçümü)", 0.0)
+        speed_layout.addWidget(self.speed_combo, 1)
+        
+        replay_layout.addLayout(session_layout)
+        replay_layout.addLayout(speed_layout)
+        self.replay_group.setLayout(replay_layout)
+        self.replay_group.setVisible(False)
+        
         # Radio button değişikliklerini dinle
         self.usb_radio.toggled.connect(lambda: self.toggle_groups())
         self.wifi_radio.toggled.connect(lambda: self.toggle_groups())
         self.bluetooth_radio.toggled.connect(lambda: self.toggle_groups())
+        self.replay_radio.toggled.connect(lambda: self.toggle_groups())
         
         # Butonlar
         button_layout = QHBoxLayout()
@@ -179,17 +210,20 @@ class ConnectionSettingsDialog(QDialog):
         layout.addWidget(self.usb_group)
         layout.addWidget(self.wifi_group)
         layout.addWidget(self.bluetooth_group)
+        layout.addWidget(self.replay_group)
         layout.addStretch()
         layout.addLayout(button_layout)
         
         # İlk yükleme
         self.refresh_ports()
+        self.refresh_sessions()
     
     def toggle_groups(self):
         """Seçilen bağlantı tipine göre grupları göster/gizle"""
         self.usb_group.setVisible(self.usb_radio.isChecked())
         self.wifi_group.setVisible(self.wifi_radio.isChecked())
         self.bluetooth_group.setVisible(self.bluetooth_radio.isChecked())
+        self.replay_group.setVisible(self.replay_radio.isChecked())
     
     def refresh_ports(self):
         """Mevcut portları yenile"""
@@ -206,6 +240,27 @@ class ConnectionSettingsDialog(QDialog):
         else:
             self.port_combo.addItem("Port bulunamadı", None)
     
+    def refresh_sessions(self):
+        """Kayıtlı telemetri oturumlarını listele (en yeni başta)"""
+        self.session_combo.clear()
+        
+        sessions = TelemetryLog.list_sessions(DEFAULT_DIRECTORY)
+        for session in reversed(sessions):
+            self.session_combo.addItem(session, segment_path(DEFAULT_DIRECTORY, session, 1))
+        
+        if not sessions:
+            self.session_combo.addItem("Kayıt bulunamadı", None)
+    
+    def choose_replay_file(self):
+        """Oynatılacak kayıt dosyasını seç (segment ya da ham akış kaydı)"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Kayıt Seç", DEFAULT_DIRECTORY,
+            "Telemetri kayıtları (*.gtl);;Ham akış kayıtları (*.txt *.log *.bin);;Tüm dosyalar (*)"
+        )
+        if path:
+            self.session_combo.insertItem(0, path, path)
+            self.session_combo.setCurrentIndex(0)
+    
     def search_bluetooth(self):
         """Bluetooth cihazlarını ara"""
         self.bt_devices_list.clear()
@@ -263,4 +318,16 @@ class ConnectionSettingsDialog(QDialog):
             }
             self.connection_changed.emit(ConnectionType.BLUETOOTH, params)
         
+        elif self.replay_radio.isChecked():
+            path = self.session_combo.currentData()
+            if not path:
+                QMessageBox.warning(self, "Hata", "Oynatılacak bir kayıt seçin!")
+                return
+            
+            params = {
+                'path': path,
+                'speed': self.speed_combo.currentData()
+            }
+            self.connection_changed.emit(ConnectionType.REPLAY, params)
+        
         self.accept()
@@ -1,8 +1,119 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QFrame
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QSize
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtSvgWidgets import QSvgWidget
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen
+
+from arduino.telemetry import Telemetry
+
+
+# Görsel durumlar - başlangıçta bir kez tanımlanır, çalışma anında
+# stylesheet üretilmez (durum değişimi yalnızca renk/metin takasıdır)
+MODE_STATES = {
+    None: ("NORMAL", "#333"),
+    0: ("ECO", "#00ff44"),
+    1: ("NORMAL", "#00aaff"),
+    2: ("SPORT", "#ff4444"),
+}
+
+GEAR_STATES = {
+    None: ("N", "#444"),
+    0: ("N", "#666"),
+    1: ("D", "#00ff44"),
+    2: ("R", "#ff4444"),
+}
+
+STEERING_BANDS = {
+    'low': "#00ff44",    # |açı| <= 45
+    'mid': "#ffaa00",    # 45 < |açı| <= 90
+    'high': "#ff4444",   # |açı| > 90
+}
+
+
+class LabelStyle:
+    """Önceden derlenmiş etiket stili (font, renk ve kalem bir kez oluşturulur)"""
+    __slots__ = ('text', 'font', 'color', 'background', 'border', 'radius', 'padding')
+    
+    def __init__(self, font_size, color, text=None, background=None, border=None,
+                 bold=False, radius=0, padding=(0, 0)):
+        self.text = text
+        self.font = QFont()
+        self.font.setPixelSize(font_size)
+        self.font.setBold(bold)
+        self.color = QColor(color)
+        self.background = QColor(background) if background else None
+        self.border = QPen(QColor(border), 1) if border else None
+        self.radius = radius
+        self.padding = padding  # (dikey, yatay)
+
+
+class StateLabel(QWidget):
+    """
+    Durum etiketi - QPainter ile çizilir
+    Durum değişimi CSS parse / style re-polish yerine önceden
+    hazırlanmış LabelStyle takasıdır (sabit maliyet)
+    """
+    def __init__(self, styles: dict, state, text="", min_width=0):
+        super().__init__()
+        self._styles = styles
+        self._state = state
+        self._style = styles[state]
+        self._text = self._style.text if self._style.text is not None else text
+        
+        # Boyut ipucu tüm durumlar için bir kez hesaplanır (layout titremesin)
+        width, height = min_width, 0
+        for style in styles.values():
+            metrics = QFontMetrics(style.font)
+            sample = style.text if style.text is not None else text
+            pad_v, pad_h = style.padding
+            width = max(width, metrics.horizontalAdvance(sample) + 2 * pad_h + 2)
+            height = max(height, metrics.height() + 2 * pad_v + 2)
+        self._size_hint = QSize(width, height)
+    
+    def sizeHint(self):
+        return self._size_hint
+    
+    def minimumSizeHint(self):
+        return self._size_hint
+    
+    def set_state(self, state) -> bool:
+        """Görsel durumu değiştir (değişiklik yoksa False)"""
+        if state == self._state:
+            return False
+        self._state = state
+        self._style = self._styles[state]
+        if self._style.text is not None:
+            self._text = self._style.text
+        self.update()
+        return True
+    
+    def set_text(self, text) -> bool:
+        """Metni değiştir (değişiklik yoksa False)"""
+        if text == self._text:
+            return False
+        self._text = text
+        self.update()
+        return True
+    
+    def text(self):
+        return self._text
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        style = self._style
+        rect = self.rect()
+        
+        # Arka plan / çerçeve
+        if style.background or style.border:
+            painter.setPen(style.border if style.border else Qt.NoPen)
+            painter.setBrush(style.background if style.background else Qt.NoBrush)
+            painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), style.radius, style.radius)
+        
+        # Metin
+        painter.setFont(style.font)
+        painter.setPen(style.color)
+        painter.drawText(rect, Qt.AlignCenter, self._text)
 
 
 class LeftPanel(QWidget):
@@ -30,46 +141,34 @@ class LeftPanel(QWidget):
         speed_unit.setStyleSheet("font-size: 18px; color: #888;")
         
         # Mod göstergesi
-        self.mode_label = QLabel("NORMAL")
-        self.mode_label.setAlignment(Qt.AlignCenter)
-        self.mode_label.setStyleSheet("""
-            font-size: 24px; 
-            font-weight: bold; 
-            color: white;
-            background-color: #333;
-            padding: 10px;
-            border-radius: 8px;
-        """)
+        self.mode_label = StateLabel({
+            mode: LabelStyle(24, "white", text=name, background=color,
+                             bold=True, radius=8, padding=(10, 10))
+            for mode, (name, color) in MODE_STATES.items()
+        }, None)
         
         # Vites göstergesi
         gear_container = QHBoxLayout()
         gear_label = QLabel("Vites:")
         gear_label.setStyleSheet("font-size: 16px; color: #aaa;")
         
-        self.gear_label = QLabel("N")
-        self.gear_label.setStyleSheet("""
-            font-size: 32px; 
-            font-weight: bold;
-            color: white;
-            background-color: #444;
-            padding: 5px 20px;
-            border-radius: 5px;
-        """)
+        self.gear_label = StateLabel({
+            vites: LabelStyle(32, "white", text=symbol, background=color,
+                              bold=True, radius=5, padding=(5, 20))
+            for vites, (symbol, color) in GEAR_STATES.items()
+        }, None)
         
         gear_container.addWidget(gear_label)
         gear_container.addWidget(self.gear_label)
         gear_container.addStretch()
         
         # EDS göstergesi (küçük)
-        self.eds_label = QLabel("EDS: KAPALI")
-        self.eds_label.setAlignment(Qt.AlignCenter)
-        self.eds_label.setStyleSheet("""
-            font-size: 10px;
-            color: #666;
-            padding: 3px;
-            border: 1px solid #444;
-            border-radius: 3px;
-        """)
+        self.eds_label = StateLabel({
+            True: LabelStyle(10, "#00ff44", text="EDS: AKTİF ✓", border="#00ff44",
+                             bold=True, radius=3, padding=(3, 3)),
+            False: LabelStyle(10, "#666", text="EDS: KAPALI", border="#444",
+                              radius=3, padding=(3, 3)),
+        }, False)
         
         # Gaz, Sol Motor, Sağ Motor (mini göstergeler)
         stats_container = QHBoxLayout()
@@ -107,8 +206,10 @@ class LeftPanel(QWidget):
         steering_text = QLabel("Direksiyon:")
         steering_text.setStyleSheet("font-size: 14px; color: #aaa;")
         
-        self.steering_label = QLabel("0.0°")
-        self.steering_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.steering_label = StateLabel({
+            None: LabelStyle(18, "white", bold=True),
+            **{band: LabelStyle(18, color, bold=True) for band, color in STEERING_BANDS.items()}
+        }, None, text="0.0°", min_width=80)
         
         steering_container.addWidget(steering_text)
         steering_container.addWidget(self.steering_label)
@@ -158,29 +259,18 @@ class LeftPanel(QWidget):
         # Sinyaller (Sol, Dörtlü, Sağ)
         signals_container = QHBoxLayout()
         
-        self.left_signal_light = QLabel("◄")
-        self.left_signal_light.setAlignment(Qt.AlignCenter)
-        self.left_signal_light.setStyleSheet("""
-            font-size: 32px;
-            color: #444;
-            min-width: 50px;
-        """)
+        signal_styles = {
+            True: LabelStyle(32, "#ffaa00", bold=True),
+            False: LabelStyle(32, "#444"),
+        }
+        hazard_styles = {
+            True: LabelStyle(28, "#ff4444", bold=True),
+            False: LabelStyle(28, "#444"),
+        }
         
-        self.hazard_light = QLabel("◆")
-        self.hazard_light.setAlignment(Qt.AlignCenter)
-        self.hazard_light.setStyleSheet("""
-            font-size: 28px;
-            color: #444;
-            min-width: 50px;
-        """)
-        
-        self.right_signal_light = QLabel("►")
-        self.right_signal_light.setAlignment(Qt.AlignCenter)
-        self.right_signal_light.setStyleSheet("""
-            font-size: 32px;
-            color: #444;
-            min-width: 50px;
-        """)
+        self.left_signal_light = StateLabel(signal_styles, False, text="◄", min_width=50)
+        self.hazard_light = StateLabel(hazard_styles, False, text="◆", min_width=50)
+        self.right_signal_light = StateLabel(signal_styles, False, text="►", min_width=50)
         
         signals_container.addWidget(self.left_signal_light)
         signals_container.addStretch()
@@ -203,168 +293,136 @@ class LeftPanel(QWidget):
         layout.addLayout(signals_container)
         layout.addWidget(self.car_indicator)
         layout.addStretch()
+        
+        # Son uygulanan alan değerleri (değişmeyen widget'lar atlanır)
+        self._applied = {}
+        # Son frame'de güncellenen widget sayısı
+        self.widgets_updated = 0
     
-    def update_data(self, data: dict):
-        """Arduino'dan gelen veriyi güncelle"""
+    def update_data(self, data: Telemetry):
+        """
+        Arduino'dan gelen veriyi güncelle
+        Her alan için son uygulanan değer saklanır, yalnızca girdisi
+        değişen widget'lara dokunulur. Durum etiketleri önceden derlenmiş
+        stiller arasında geçiş yapar (CSS parse / re-polish yok).
+        """
+        updated = 0
+        
         # Hız
-        if 'avg_speed' in data:
-            self.speed_label.setText(f"{int(data['avg_speed'])}")
+        speed_text = f"{int(data.avg_speed)}"
+        if self._changed('speed', speed_text):
+            self.speed_label.setText(speed_text)
+            updated += 1
         
         # Mod (0=Eco, 1=Normal, 2=Sport)
-        if 'mode' in data:
-            mode_names = ["ECO", "NORMAL", "SPORT"]
-            mode_colors = ["#00ff44", "#00aaff", "#ff4444"]
-            mode = data['mode']
-            
-            if 0 <= mode < len(mode_names):
-                self.mode_label.setText(mode_names[mode])
-                self.mode_label.setStyleSheet(f"""
-                    font-size: 24px; 
-                    font-weight: bold; 
-                    color: white;
-                    background-color: {mode_colors[mode]};
-                    padding: 10px;
-                    border-radius: 8px;
-                """)
+        mode = data.mode
+        if mode in MODE_STATES and self._changed('mode', mode):
+            self.mode_label.set_state(mode)
+            updated += 1
         
         # Vites (0=Neutral, 1=İleri, 2=Geri)
-        if 'vites' in data:
-            vites_symbols = ["N", "D", "R"]
-            vites_colors = ["#666", "#00ff44", "#ff4444"]
-            vites = data['vites']
-            
-            if 0 <= vites < len(vites_symbols):
-                self.gear_label.setText(vites_symbols[vites])
-                self.gear_label.setStyleSheet(f"""
-                    font-size: 32px; 
-                    font-weight: bold;
-                    color: white;
-                    background-color: {vites_colors[vites]};
-                    padding: 5px 20px;
-                    border-radius: 5px;
-                """)
+        vites = data.vites
+        if vites in GEAR_STATES and self._changed('vites', vites):
+            self.gear_label.set_state(vites)
+            updated += 1
         
         # EDS durumu
-        if 'EDS_AKTIF' in data:
-            if data['EDS_AKTIF'] == 1:
-                self.eds_label.setText("EDS: AKTİF ✓")
-                self.eds_label.setStyleSheet("""
-                    font-size: 10px;
-                    color: #00ff44;
-                    font-weight: bold;
-                    padding: 3px;
-                    border: 1px solid #00ff44;
-                    border-radius: 3px;
-                """)
-            else:
-                self.eds_label.setText("EDS: KAPALI")
-                self.eds_label.setStyleSheet("""
-                    font-size: 10px;
-                    color: #666;
-                    padding: 3px;
-                    border: 1px solid #444;
-                    border-radius: 3px;
-                """)
+        eds_active = data.EDS_AKTIF == 1
+        if self._changed('eds', eds_active):
+            self.eds_label.set_state(eds_active)
+            updated += 1
         
         # Ortalama gaz yüzdesi (sol + sağ / 2)
-        if 'solGazYuzdesi' in data and 'sagGazYuzdesi' in data:
-            avg_throttle = (data['solGazYuzdesi'] + data['sagGazYuzdesi']) / 2.0
-            self.throttle_value.setText(f"{int(avg_throttle)}%")
-        
-        # Sol motor gaz yüzdesi
-        if 'solGazYuzdesi' in data:
-            self.left_throttle_value.setText(f"{data['solGazYuzdesi']}%")
-        
-        # Sağ motor gaz yüzdesi
-        if 'sagGazYuzdesi' in data:
-            self.right_throttle_value.setText(f"{data['sagGazYuzdesi']}%")
+        left = data.solGazYuzdesi
+        right = data.sagGazYuzdesi
+        throttle_text = f"{int((left + right) / 2.0)}%"
+        if self._changed('throttle', throttle_text):
+            self.throttle_value.setText(throttle_text)
+            updated += 1
+        
+        # Sol motor gaz yüzdesi + güç çubuğu
+        if self._changed('left_throttle', left):
+            self.left_throttle_value.setText(f"{left}%")
+            self.left_motor_value.setText(f"{left}%")
+            self.left_motor_bar.set_value(left)
+            updated += 3
+        
+        # Sağ motor gaz yüzdesi + güç çubuğu
+        if self._changed('right_throttle', right):
+            self.right_throttle_value.setText(f"{right}%")
+            self.right_motor_value.setText(f"{right}%")
+            self.right_motor_bar.set_value(right)
+            updated += 3
         
         # Direksiyon açısı
-        if 'direksiyonaci' in data:
-            angle = data['direksiyonaci']
-            self.steering_label.setText(f"{angle:.1f}°")
-            
-            # Renk değişimi
-            if abs(angle) > 90:
-                color = "#ff4444"
-            elif abs(angle) > 45:
-                color = "#ffaa00"
-            else:
-                color = "#00ff44"
-            
-            self.steering_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {color};")
-        
-        # Motor güçleri
-        if 'solGazYuzdesi' in data:
-            self.left_motor_value.setText(f"{data['solGazYuzdesi']}%")
-            self.left_motor_bar.set_value(data['solGazYuzdesi'])
-        
-        if 'sagGazYuzdesi' in data:
-            self.right_motor_value.setText(f"{data['sagGazYuzdesi']}%")
-            self.right_motor_bar.set_value(data['sagGazYuzdesi'])
+        angle = data.direksiyonaci
+        steering_text = f"{angle:.1f}°"
+        
+        # Renk bandı
+        if abs(angle) > 90:
+            band = 'high'
+        elif abs(angle) > 45:
+            band = 'mid'
+        else:
+            band = 'low'
+        
+        text_changed = self._changed('steering_text', steering_text)
+        band_changed = self._changed('steering_band', band)
+        if text_changed:
+            self.steering_label.set_text(steering_text)
+        if band_changed:
+            self.steering_label.set_state(band)
+        if text_changed or band_changed:
+            updated += 1
         
         # Araç göstergesi güncelle
-        self.car_indicator.update_indicators(
-            left_signal=data.get('sinyalsol', 0),
-            right_signal=data.get('sinyalsag', 0),
-            hazard=data.get('dortlu', 0),
-            headlight=data.get('far', 0),
-            high_beam=data.get('far2', 0)
-        )
+        sinyalsol = data.sinyalsol
+        sinyalsag = data.sinyalsag
+        dortlu = data.dortlu
+        indicators = (sinyalsol, sinyalsag, dortlu, data.far, data.far2)
+        if self._changed('indicators', indicators):
+            self.car_indicator.update_indicators(*indicators)
+            updated += 1
         
         # Sinyalleri güncelle (yanıp sönme)
-        left_active = data.get('sinyalsol', 0) == 1 or data.get('dortlu', 0) == 1
-        right_active = data.get('sinyalsag', 0) == 1 or data.get('dortlu', 0) == 1
-        hazard_active = data.get('dortlu', 0) == 1
+        blink = self.car_indicator.blink_state
+        left_lit = (sinyalsol == 1 or dortlu == 1) and blink
+        right_lit = (sinyalsag == 1 or dortlu == 1) and blink
+        hazard_lit = dortlu == 1 and blink
         
         # Sol sinyal
-        if left_active and self.car_indicator.blink_state:
-            self.left_signal_light.setStyleSheet("""
-                font-size: 32px;
-                color: #ffaa00;
-                font-weight: bold;
-                min-width: 50px;
-            """)
-        else:
-            self.left_signal_light.setStyleSheet("""
-                font-size: 32px;
-                color: #444;
-                min-width: 50px;
-            """)
+        if self._changed('left_signal', left_lit):
+            self.left_signal_light.set_state(left_lit)
+            updated += 1
         
         # Sağ sinyal
-        if right_active and self.car_indicator.blink_state:
-            self.right_signal_light.setStyleSheet("""
-                font-size: 32px;
-                color: #ffaa00;
-                font-weight: bold;
-                min-width: 50px;
-            """)
-        else:
-            self.right_signal_light.setStyleSheet("""
-                font-size: 32px;
-                color: #444;
-                min-width: 50px;
-            """)
+        if self._changed('right_signal', right_lit):
+            self.right_signal_light.set_state(right_lit)
+            updated += 1
         
         # Dörtlü sinyal (hazard)
-        if hazard_active and self.car_indicator.blink_state:
-            self.hazard_light.setStyleSheet("""
-                font-size: 28px;
-                color: #ff4444;
-                font-weight: bold;
-                min-width: 50px;
-            """)
-        else:
-            self.hazard_light.setStyleSheet("""
-                font-size: 28px;
-                color: #444;
-                min-width: 50px;
-            """)
+        if self._changed('hazard', hazard_lit):
+            self.hazard_light.set_state(hazard_lit)
+            updated += 1
+        
+        self.widgets_updated = updated
+    
+    def _changed(self, key, value) -> bool:
+        """Alanın değeri son uygulanandan farklıysa kaydet ve True döndür"""
+        if key in self._applied and self._applied[key] == value:
+            return False
+        self._applied[key] = value
+        return True
 
 
 class PowerBar(QWidget):
     """Motor gücü gösterge çubuğu"""
+    # Renkler bir kez oluşturulur
+    BACKGROUND = QColor("#1a1a1a")
+    LOW = QColor("#00ff44")
+    MID = QColor("#ffaa00")
+    HIGH = QColor("#ff4444")
+    
     def __init__(self):
         super().__init__()
         self.value = 0
@@ -372,7 +430,10 @@ class PowerBar(QWidget):
         self.setMinimumWidth(100)
     
     def set_value(self, value):
-        self.value = max(0, min(100, value))
+        value = max(0, min(100, value))
+        if value == self.value:
+            return
+        self.value = value
         self.update()
     
     def paintEvent(self, event):
@@ -380,24 +441,30 @@ class PowerBar(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Arka plan
-        painter.fillRect(self.rect(), QColor("#1a1a1a"))
+        painter.fillRect(self.rect(), self.BACKGROUND)
         
         # Değer çubuğu
         width = int((self.width() * self.value) / 100)
         
         # Renk gradient (yeşil -> sarı -> kırmızı)
         if self.value < 50:
-            color = QColor("#00ff44")
+            color = self.LOW
         elif self.value < 80:
-            color = QColor("#ffaa00")
+            color = self.MID
         else:
-            color = QColor("#ff4444")
+            color = self.HIGH
         
         painter.fillRect(0, 0, width, self.height(), color)
 
 
 class CarIndicator(QWidget):
     """Araç gösterge paneli (sinyaller, farlar vb.)"""
+    # Renkler bir kez oluşturulur
+    BODY = QColor("#555")
+    SIGNAL = QColor("#ffaa00")
+    HEADLIGHT = QColor("#ffffff")
+    HIGH_BEAM = QColor("#ffff44")
+    
     def __init__(self):
         super().__init__()
         self.setFixedHeight(150)
@@ -419,11 +486,10 @@ class CarIndicator(QWidget):
         self.update()
     
     def update_indicators(self, left_signal, right_signal, hazard, headlight, high_beam):
-        self.left_signal = left_signal == 1
-        self.right_signal = right_signal == 1
-        self.hazard = hazard == 1
-        self.headlight = headlight > 0
-        self.high_beam = high_beam == 1
+        state = (left_signal == 1, right_signal == 1, hazard == 1, headlight > 0, high_beam == 1)
+        if state == (self.left_signal, self.right_signal, self.hazard, self.headlight, self.high_beam):
+            return
+        self.left_signal, self.right_signal, self.hazard, self.headlight, self.high_beam = state
         self.update()
     
     def paintEvent(self, event):
@@ -440,18 +506,18 @@ class CarIndicator(QWidget):
         car_x = center_x - car_width // 2
         car_y = height // 2 - car_height // 2
         
-        painter.fillRect(car_x, car_y, car_width, car_height, QColor("#555"))
+        painter.fillRect(car_x, car_y, car_width, car_height, self.BODY)
         
         # Sol sinyal
         if (self.left_signal or self.hazard) and self.blink_state:
-            painter.fillRect(car_x - 30, car_y + 10, 20, 20, QColor("#ffaa00"))
+            painter.fillRect(car_x - 30, car_y + 10, 20, 20, self.SIGNAL)
         
         # Sağ sinyal
         if (self.right_signal or self.hazard) and self.blink_state:
-            painter.fillRect(car_x + car_width + 10, car_y + 10, 20, 20, QColor("#ffaa00"))
+            painter.fillRect(car_x + car_width + 10, car_y + 10, 20, 20, self.SIGNAL)
         
         # Farlar
         if self.headlight:
-            color = QColor("#ffff44") if self.high_beam else QColor("#ffffff")
+            color = self.HIGH_BEAM if self.high_beam else self.HEADLIGHT
             painter.fillRect(car_x - 5, car_y - 15, 10, 10, color)
             painter.fillRect(car_x + car_width - 5, car_y - 15, 10, 10, color)
@@ -2,10 +2,11 @@ from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
 from PySide6.QtCore import QUrl, Qt, QTimer, QProcess
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
-import subprocess
 import os
 import platform
 
+from ui.adb_client import AdbClient
+
 
 class MapView(QWebEngineView):
     """
@@ -33,10 +34,10 @@ class MapView(QWebEngineView):
         self.phone_overlay = PhoneControlOverlay(self)
         self.phone_overlay.hide()
         
-        # Telefon bağlantı kontrolü
-        self.check_timer = QTimer()
-        self.check_timer.timeout.connect(self.check_phone_connection)
-        self.check_timer.start(5000)  # Her 5 saniyede kontrol
+        # Telefon bağlantı takibi (ortak adb istemcisi, olay tabanlı)
+        self.adb = AdbClient.shared()
+        self.adb.monitor.devices_changed.connect(self.check_phone_connection)
+        self.adb.start_monitor()
     
     def setup_web_engine(self):
         """WebEngine profilini ayarla - cookies, permissions, vs"""
@@ -105,33 +106,17 @@ class MapView(QWebEngineView):
         """Sayfa yüklendikten sonra"""
         pass
     
-    def check_phone_connection(self):
-        """USB ile bağlı telefon kontrolü (ADB)"""
-        try:
-            # ADB devices kontrolü
-            result = subprocess.run(
-                ['adb', 'devices'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            
-            lines = result.stdout.strip().split('\n')
-            
-            # En az 2 satır olmalı (başlık + cihaz)
-            if len(lines) > 1 and 'device' in lines[1]:
-                if not self.phone_connected:
-                    self.phone_connected = True
-                    self.phone_overlay.show_notification("Telefon bağlandı!")
-            else:
-                if self.phone_connected:
-                    self.phone_connected = False
-                    self.stop_screen_mirror()
-                    self.phone_overlay.show_notification("Telefon bağlantısı kesildi!")
-        
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            # ADB yüklü değil veya zaman aşımı
-            pass
+    def check_phone_connection(self, devices):
+        """USB ile bağlı telefon durumu (cihaz listesi değişince çağrılır)"""
+        if any(state == 'device' for state in devices.values()):
+            if not self.phone_connected:
+                self.phone_connected = True
+                self.phone_overlay.show_notification("Telefon bağlandı!")
+        else:
+            if self.phone_connected:
+                self.phone_connected = False
+                self.stop_screen_mirror()
+                self.phone_overlay.show_notification("Telefon bağlantısı kesildi!")
     
     def start_screen_mirror(self):
         """Telefon ekranını yansıtmaya başla (scrcpy)"""
@@ -1,60 +1,483 @@
 import subprocess
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PySide6.QtCore import Qt, QThread, Signal, QPoint, QRect
 from PySide6.QtGui import QPixmap, QImage, QColor, QPainter, QFont
-from PySide6.QtCore import QByteArray, QBuffer, QIODevice
-import io
 import os
+import shlex
+import shutil
+import signal
+import struct
+import tempfile
+import threading
 import time
-import platform as sys_platform
 
+import cv2
+import numpy as np
 
-def get_adb_path():
-    """ADB yolunu bul"""
-    # Yaygın konumları dene
-    if sys_platform.system() == 'Windows':
-        possible_paths = [
-            r"C:\platform-tools\adb.exe",
-            r"C:\Android\sdk\platform-tools\adb.exe",
-            os.path.expanduser(r"~\AppData\Local\Android\Sdk\platform-tools\adb.exe"),
-            "adb"  # PATH'te ara
-        ]
-    else:  # Linux/macOS
-        possible_paths = [
-            "/usr/bin/adb",
-            "/usr/local/bin/adb",
-            os.path.expanduser("~/Android/Sdk/platform-tools/adb"),
-            os.path.expanduser("~/android-sdk/platform-tools/adb"),
-            "/opt/android-sdk/platform-tools/adb",
-            "adb"  # PATH'te ara
-        ]
+from ui.adb_client import AdbClient, get_adb_path
+
+
+class MirrorStats:
+    """Yansıtma modu başına FPS ve frame başına CPU süresi ölçümü"""
+    
+    def __init__(self, mode, interval=1.0):
+        self.mode = mode
+        self.interval = interval
+        self.reset()
+    
+    def reset(self):
+        self._frames = 0
+        self._wall_start = time.perf_counter()
+        # Yalnızca bu thread'in CPU süresi (decode maliyeti)
+        self._cpu_start = time.thread_time()
+    
+    def frame(self):
+        """Bir frame say; ölçüm aralığı dolduysa özet döndür"""
+        self._frames += 1
+        elapsed = time.perf_counter() - self._wall_start
+        if elapsed < self.interval:
+            return None
+        
+        cpu = time.thread_time() - self._cpu_start
+        stats = {
+            'mode': self.mode,
+            'fps': self._frames / elapsed,
+            'cpu_ms': cpu * 1000.0 / self._frames
+        }
+        self.reset()
+        return stats
+
+
+class RawScreencapSession:
+    """
+    Kalıcı adb shell oturumu üzerinden ham (PNG'siz) screencap
+    - Tek bir adb süreci açık kalır, her frame için yalnızca komut yazılır
+    - Başlık çözülür, piksel byte'ları yeniden kullanılan tampona okunur
+      ve PNG decode etmeden QImage olarak sarılır
+    - İsteğe bağlı seyreltme (decimation) ile çözünürlük düşürülür
+    """
+    
+    HEADER = struct.Struct('<III')  # genişlik, yükseklik, piksel formatı
+    
+    # Android PixelFormat -> (byte/piksel, QImage formatı)
+    FORMATS = {
+        1: (4, QImage.Format_RGBA8888),
+        2: (4, QImage.Format_RGBX8888),
+        3: (3, QImage.Format_RGB888),
+        4: (2, QImage.Format_RGB16),
+    }
+    
+    def __init__(self, adb_path, decimation=1):
+        self.adb_path = adb_path
+        self.decimation = max(1, int(decimation))
+        self.process = None
+        self.header_size = None
+        
+        self._buffer = bytearray()
+        self._scaled = None
+    
+    def open(self):
+        """adb shell oturumunu aç ve başlık boyutunu belirle"""
+        # stdin bir pipe olduğu için PTY açılmaz, çıktı binary-safe kalır
+        self.process = subprocess.Popen(
+            [self.adb_path, 'shell', '-T'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        
+        # Başlık 12 (eski) ya da 16 byte (renk uzayı alanı ile) olabilir:
+        # toplam boyutu bir kez ölçüp piksel boyutunu çıkararak buluruz
+        self._send(b"screencap | wc -c\n")
+        total = int(self.process.stdout.readline().strip() or 0)
+        
+        self._send(b"screencap\n")
+        width, height, pixel_format = self.HEADER.unpack(self._read_exact(self.HEADER.size))
+        bpp, _ = self.FORMATS[pixel_format]
+        self.header_size = total - width * height * bpp
+        if self.header_size < self.HEADER.size:
+            raise RuntimeError(f"Beklenmeyen screencap boyutu: {total}")
+        
+        # İlk frame'in kalanını tüket
+        self._read_exact(self.header_size - self.HEADER.size)
+        self._read_exact(width * height * bpp)
+    
+    def capture(self) -> QImage:
+        """
+        Bir frame al
+        Dönen QImage oturumun tamponunu gösterir, bir sonraki capture()
+        çağrısına kadar geçerlidir
+        """
+        self._send(b"screencap\n")
+        header = self._read_exact(self.header_size)
+        width, height, pixel_format = self.HEADER.unpack_from(header)
+        bpp, image_format = self.FORMATS[pixel_format]
+        
+        size = width * height * bpp
+        if len(self._buffer) != size:
+            self._buffer = bytearray(size)
+        self._read_into(memoryview(self._buffer))
+        
+        pixels = np.frombuffer(self._buffer, dtype=np.uint8).reshape(height, width, bpp)
+        
+        if self.decimation > 1:
+            # Cihazdaki screencap ölçekleme desteklemez, seyreltme host'ta
+            # adım (stride) ile yapılır: decode yok, yalnızca kopya
+            view = pixels[::self.decimation, ::self.decimation]
+            if self._scaled is None or self._scaled.shape != view.shape:
+                self._scaled = np.empty(view.shape, dtype=np.uint8)
+            np.copyto(self._scaled, view)
+            pixels = self._scaled
+        
+        h, w = pixels.shape[:2]
+        return QImage(pixels.data, w, h, pixels.strides[0], image_format)
+    
+    def close(self):
+        """Oturumu kapat"""
+        process = self.process
+        self.process = None
+        if process and process.poll() is None:
+            process.kill()
+            process.wait()
+    
+    def _send(self, command):
+        self.process.stdin.write(command)
+        self.process.stdin.flush()
+    
+    def _read_exact(self, size) -> bytes:
+        data = self.process.stdout.read(size)
+        if len(data) != size:
+            raise ConnectionError("adb shell oturumu kapandı")
+        return data
+    
+    def _read_into(self, view):
+        stdout = self.process.stdout
+        while len(view):
+            count = stdout.readinto(view)
+            if not count:
+                raise ConnectionError("adb shell oturumu kapandı")
+            view = view[count:]
+
+
+class FrameChangeDetector:
+    """
+    Karo (tile) checksum'ları ile ucuz frame değişim tespiti
+    - Her karonun tüm satırları ve renk byte'ları toplanır (seyreltme yok;
+      1 piksellik çizgiler de yakalanır), 4 byte'lık formatlarda alfa/dolgu
+      byte'ı atlanır
+    - Toplamlar son gönderilen frame ile karşılaştırılır, değişen karolar
+      kaynak koordinatlarında dikdörtgen olarak döner
+    - Toplamı değiştirmeyen değişikliklere (ör. karo içinde yer değiştiren
+      pikseller) karşı refresh_interval saniyede bir tam frame gönderilir
+    """
+    
+    def __init__(self, rows=16, columns=16, refresh_interval=2.0):
+        self.rows = rows
+        self.columns = columns
+        self.refresh_interval = refresh_interval
+        
+        self._layout = None
+        self._reference = None
+        self._candidate = None
+        
+        # Son tam frame'in gönderildiği zaman ve incelenen frame tam mı
+        self._refreshed_at = 0.0
+        self.forced = False
+    
+    def reset(self):
+        """Referansı unut (sonraki frame tamamen değişmiş sayılır)"""
+        self._reference = None
+    
+    def detect(self, image) -> list:
+        """Son kabul edilen frame'e göre değişen bölgeleri döndür"""
+        width, height = image.width(), image.height()
+        bytes_per_line = image.bytesPerLine()
+        bpp = max(1, image.depth() // 8)
+        
+        pixels = np.frombuffer(image.constBits(), dtype=np.uint8,
+                               count=bytes_per_line * height).reshape(height, bytes_per_line)
+        
+        layout = (width, height, bpp)
+        if layout != self._layout:
+            self._prepare(layout)
+        
+        # Önce her karo satırının satırları sütun bazında toplanır (OpenCV,
+        # görüntü üzerinden tek geçiş); alfa byte'ı bu küçük ara sonuçtan atılır
+        row = pixels[:, :width * bpp]
+        sums = self._row_sums
+        for band, (y0, y1) in enumerate(zip(self._y_edges, self._y_edges[1:])):
+            cv2.reduce(row[y0:y1], 0, cv2.REDUCE_SUM, dst=sums[band:band + 1],
+                       dtype=cv2.CV_32S)
+        sums = sums.reshape(len(sums), width, bpp)
+        if bpp == 4:
+            sums = sums[:, :, :3]
+        sums = np.add.reduceat(sums, self._column_starts, axis=1)
+        self._candidate = sums
+        
+        self.forced = False
+        if self._reference is None:
+            return [QRect(0, 0, width, height)]
+        
+        if self.refresh_interval and \
+                time.monotonic() - self._refreshed_at >= self.refresh_interval:
+            # Güvenlik ağı: checksum'ın kaçırabileceği değişiklikler için tam frame
+            self.forced = True
+            return [QRect(0, 0, width, height)]
+        
+        changed = (sums != self._reference).any(axis=2)
+        if not changed.any():
+            return []
+        
+        rects = []
+        for row in np.flatnonzero(changed.any(axis=1)):
+            flags = changed[row]
+            column = 0
+            while column < len(flags):
+                if not flags[column]:
+                    column += 1
+                    continue
+                # Yan yana değişen karoları tek dikdörtgende birleştir
+                start = column
+                while column < len(flags) and flags[column]:
+                    column += 1
+                x0, x1 = self._x_edges[start], self._x_edges[column]
+                y0, y1 = self._y_edges[row], self._y_edges[row + 1]
+                rects.append(QRect(x0, y0, x1 - x0, y1 - y0))
+        return rects
     
-    for path in possible_paths:
-        if os.path.exists(path) or path == "adb":
-            return path
+    def accept(self):
+        """Son incelenen frame gönderildi, referans olarak kullan"""
+        if self._reference is None or self.forced:
+            self._refreshed_at = time.monotonic()
+        self._reference = self._candidate
     
-    return None
+    def _prepare(self, layout):
+        """Karo sınırlarını yeni görüntü boyutu için hesapla"""
+        width, height, bpp = layout
+        self._layout = layout
+        self._reference = None
+        
+        rows = min(self.rows, height)
+        columns = min(self.columns, width)
+        self._row_starts = (np.arange(rows) * height) // rows
+        self._column_starts = (np.arange(columns) * width) // columns
+        
+        # Karo kenarları (kaynak piksel koordinatları)
+        self._y_edges = [int(r) for r in self._row_starts] + [height]
+        self._x_edges = [int(c) for c in self._column_starts] + [width]
+        
+        # Karo satırı başına sütun toplamları (her frame yeniden kullanılır)
+        self._row_sums = np.empty((rows, width * bpp), dtype=np.int32)
+
+
+class MirrorScreen(QLabel):
+    """
+    Telefon ekranı gösterim alanı
+    Frame'i kalıcı bir QPixmap'te tutar; yeni frame geldiğinde yalnızca
+    değişen dikdörtgenleri günceller ve yeniden çizer.
+    """
+    
+    def __init__(self, text=""):
+        super().__init__(text)
+        self._frame = None
+    
+    def show_frame(self, image, dirty_rects):
+        """Frame'in değişen bölgelerini uygula"""
+        if self._frame is None or self._frame.size() != image.size():
+            # İlk frame / boyut değişti - tamamını çevir
+            QLabel.setText(self, "")
+            self._frame = QPixmap.fromImage(image)
+            self.update()
+            return
+        
+        painter = QPainter(self._frame)
+        for rect in dirty_rects:
+            painter.drawImage(rect, image, rect)
+        painter.end()
+        
+        offset = self._frame_offset()
+        for rect in dirty_rects:
+            self.update(rect.translated(offset))
+    
+    def setText(self, text):
+        """Metin gösterilirken frame bırakılır"""
+        self._frame = None
+        super().setText(text)
+    
+    def _frame_offset(self):
+        return QPoint((self.width() - self._frame.width()) // 2,
+                      (self.height() - self._frame.height()) // 2)
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._frame is None:
+            return
+        
+        # Yalnızca açığa çıkan bölgeyi çiz
+        offset = self._frame_offset()
+        target = event.rect().intersected(QRect(offset, self._frame.size()))
+        if target.isEmpty():
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(target, self._frame, target.translated(-offset))
+        painter.end()
 
 
 class PhoneMirrorThread(QThread):
-    """Telefon ekranını periyodik olarak çeken thread"""
-    image_captured = Signal(QPixmap)
+    """
+    Telefon ekranını çeken thread
+    - h264: tek, uzun ömürlü adb screenrecord akışı (OpenCV/FFmpeg ile decode)
+    - raw: kalıcı adb shell oturumunda ham screencap (PNG decode yok)
+    - png: her frame için adb screencap -p (son yedek mod)
+    Mod açılamazsa sıradaki moda düşülür: h264 -> raw -> png
+    
+    Thread yalnızca QImage üretir (QPixmap GUI thread'ine aittir) ve görüntüyü
+    hedef boyuta kendisi ölçekler. Arayüz önceki frame'i göstermeden gelen
+    frame'ler kuyruğa alınmaz, atılır. Önceki gönderilen frame'den farkı
+    olmayan frame'ler de gönderilmez; gönderilenlerle birlikte değişen
+    bölgeler (hedef koordinatlarında) iletilir.
+    """
+    image_captured = Signal(QImage, list)  # görüntü, değişen QRect listesi
+    stats_updated = Signal(dict)  # {'mode', 'fps', 'cpu_ms', 'dropped', 'skip_ratio'}
+    
+    MODE_H264 = "h264"
+    MODE_RAW = "raw"
+    MODE_PNG = "png"
     
-    def __init__(self, use_demo=False):
+    # Yoklama (raw/png) aralığı: ekran değişmedikçe uzar, değişince sıfırlanır
+    POLL_INTERVAL = 0.062      # 16 FPS
+    MAX_POLL_INTERVAL = 1.0
+    BACKOFF_FACTOR = 1.5
+    
+    def __init__(self, use_demo=False, mode=MODE_H264, raw_decimation=1):
         super().__init__()
         self.running = True
         self.use_demo = use_demo
+        self.mode = mode
+        self.raw_decimation = raw_decimation
+        
+        # Akış süreci okuma thread'ine aittir (başlatma, bekleme, temizlik);
+        # GUI thread'i yalnızca bloklanan okumayı çözmek için süreci öldürür
+        self.stream_process = None
+        self._stream_group = False   # süreç kendi süreç grubunda mı (kabuk + adb)
+        self._stream_lock = threading.Lock()
+        
+        # Gösterim boyutu (GUI thread'i tek atamada değiştirir)
+        self.target_size = None
+        
+        # Arayüz son frame'i henüz göstermedi mi?
+        self.gui_busy = threading.Event()
+        self.frames_dropped = 0
+        
+        # Değişmeyen frame'leri atlama
+        self.change_detector = FrameChangeDetector()
+        self.frames_captured = 0
+        self.frames_unchanged = 0
+        
+        # Olay tabanlı bekleme (durdurma / boyut değişimi / frame gösterildi)
+        self.wake_event = threading.Event()
+        self.poll_interval = self.POLL_INTERVAL
+        
+        # Demo ekranı bir kez çizilir
+        self.demo_frame = None
+    
+    @property
+    def skip_ratio(self) -> float:
+        """Değişmediği için atlanan frame oranı"""
+        if not self.frames_captured:
+            return 0.0
+        return self.frames_unchanged / self.frames_captured
+    
+    def set_target_size(self, width, height):
+        """Gösterim alanının boyutunu bildir (GUI thread'inden)"""
+        self.target_size = (max(1, width), max(1, height))
+        # Yeni boyutta tam frame gönderilsin
+        self.change_detector.reset()
+        self.wake_event.set()
+    
+    def frame_consumed(self):
+        """Arayüz frame'i gösterdi, sıradaki gönderilebilir"""
+        self.gui_busy.clear()
+        self.wake_event.set()
+    
+    def idle_wait(self, timeout=None):
+        """Süre dolana ya da thread uyandırılana kadar bekle"""
+        self.wake_event.wait(timeout)
+        self.wake_event.clear()
+    
+    def deliver(self, image) -> bool:
+        """
+        Frame'i gösterime hazırla ve gönder
+        Arayüz meşgulse ya da ekran değişmediyse frame atılır. Ölçeklenen
+        görüntü kendi belleğine sahiptir, kaynak tampon hemen yeniden
+        kullanılabilir.
+        """
+        self.frames_captured += 1
+        if self.gui_busy.is_set():
+            self.frames_dropped += 1
+            return False
+        
+        dirty = self.change_detector.detect(image)
+        if not dirty:
+            self.frames_unchanged += 1
+            self.poll_interval = min(self.poll_interval * self.BACKOFF_FACTOR,
+                                     self.MAX_POLL_INTERVAL)
+            return False
+        
+        if not self.change_detector.forced:
+            self.poll_interval = self.POLL_INTERVAL
+        
+        target = self.target_size
+        if target:
+            scaled = image.scaled(target[0], target[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        else:
+            scaled = image
+        if scaled.cacheKey() == image.cacheKey():
+            # Boyut değişmediyse Qt aynı tamponu paylaşır - kopyala
+            scaled = image.copy()
+        
+        # Değişen bölgeleri hedef koordinatlarına taşı (filtre taşması için +1 px)
+        sx = scaled.width() / image.width()
+        sy = scaled.height() / image.height()
+        bounds = scaled.rect()
+        dirty = [
+            QRect(int(r.x() * sx) - 1, int(r.y() * sy) - 1,
+                  int(r.width() * sx) + 3, int(r.height() * sy) + 3).intersected(bounds)
+            for r in dirty
+        ]
+        
+        self.change_detector.accept()
+        self.gui_busy.set()
+        self.image_captured.emit(scaled, dirty)
+        return True
     
     def run(self):
-        """Telefon screenshot'ını al ve gönder"""
+        """Telefon ekranını al ve gönder"""
         adb_path = get_adb_path()
         
+        if not self.use_demo and adb_path and self.mode == self.MODE_H264:
+            if not self.run_h264_stream(adb_path):
+                if self.running:
+                    print("H.264 akışı açılamadı - ham screencap moduna geçiliyor")
+                self.mode = self.MODE_RAW
+        
+        if not self.use_demo and adb_path and self.mode == self.MODE_RAW:
+            if not self.run_raw_stream(adb_path):
+                if self.running:
+                    print("Ham screencap açılamadı - PNG moduna geçiliyor")
+                self.mode = self.MODE_PNG
+        
+        stats = MirrorStats(self.mode)
+        
         while self.running:
             try:
                 if self.use_demo:
-                    # Demo ekranı göster
-                    pixmap = self.create_demo_screen()
-                    self.image_captured.emit(pixmap)
+                    # Demo ekranı değişmez: bir kez çiz, boyut değişene ya da
+                    # thread durdurulana kadar uyu
+                    if self.demo_frame is None:
+                        self.demo_frame = self.create_demo_screen()
+                    self.deliver(self.demo_frame)
+                    self.idle_wait()
+                    continue
                 else:
                     # ADB ile telefon ekran görüntüsünü al
                     if not adb_path:
@@ -68,26 +491,170 @@ class PhoneMirrorThread(QThread):
                     )
                     
                     if result.returncode == 0:
-                        # PNG dosyasını QPixmap'e dönüştür
-                        pixmap = QPixmap()
-                        pixmap.loadFromData(result.stdout, "PNG")
+                        # PNG dosyasını QImage'e dönüştür
+                        image = QImage()
+                        image.loadFromData(result.stdout, "PNG")
                         
-                        if not pixmap.isNull():
-                            self.image_captured.emit(pixmap)
+                        if not image.isNull():
+                            self.deliver(image)
+                            self.report_stats(stats)
                 
-                # 62ms bekle (16 FPS)
-                self.msleep(62)
+                self.idle_wait(self.poll_interval)
             
             except Exception as e:
                 print(f"Telefon mirror hatası: {e}")
-                self.msleep(1000)
+                self.idle_wait(1.0)
+    
+    def run_h264_stream(self, adb_path) -> bool:
+        """
+        Uzun ömürlü H.264 akışı
+        screenrecord çıktısı bir FIFO üzerinden OpenCV'ye (FFmpeg) verilir,
+        frame'ler artımlı olarak decode edilir. screenrecord süre sınırına
+        ulaşınca akış yeniden başlatılır.
+        Akış hiç frame üretemezse False döner (PNG moduna düşülür).
+        """
+        if not hasattr(os, 'mkfifo'):
+            # Windows'ta FIFO yok
+            return False
+        
+        fifo_dir = tempfile.mkdtemp(prefix='gotogo_mirror_')
+        fifo_path = os.path.join(fifo_dir, 'screen.h264')
+        os.mkfifo(fifo_path)
+        
+        command = (
+            f"{shlex.quote(adb_path)} exec-out screenrecord "
+            f"--output-format=h264 - > {shlex.quote(fifo_path)}"
+        )
+        stats = MirrorStats(self.MODE_H264)
+        
+        try:
+            while self.running:
+                # Kabuk FIFO'yu yazmak için açar, biz okumak için açarız.
+                # Kabuk ve adb ayrı süreç grubunda: durdururken ikisi birlikte
+                # öldürülür, FIFO'nun yazma ucu kapanır ve read() EOF ile döner
+                self.set_stream_process(subprocess.Popen(
+                    command, shell=True, start_new_session=True,
+                    stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                ), group=True)
+                capture = cv2.VideoCapture(fifo_path, cv2.CAP_FFMPEG)
+                frames = 0
+                
+                while self.running and capture.isOpened():
+                    ret, frame = capture.read()
+                    if not ret:
+                        # Süre sınırı / bağlantı koptu
+                        break
+                    
+                    h, w = frame.shape[:2]
+                    image = QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888)
+                    self.deliver(image)
+                    self.report_stats(stats)
+                    frames += 1
+                
+                capture.release()
+                self.stop_stream_process()
+                
+                if frames == 0:
+                    return False
+            
+            return True
+        
+        finally:
+            self.stop_stream_process()
+            shutil.rmtree(fifo_dir, ignore_errors=True)
+    
+    def run_raw_stream(self, adb_path) -> bool:
+        """
+        Kalıcı adb shell oturumu ile ham screencap döngüsü
+        Oturum hiç frame üretemezse False döner (PNG moduna düşülür)
+        """
+        stats = MirrorStats(self.MODE_RAW)
+        frames = 0
+        
+        while self.running:
+            session = RawScreencapSession(adb_path, self.raw_decimation)
+            try:
+                session.open()
+                self.set_stream_process(session.process)
+                
+                while self.running:
+                    image = session.capture()
+                    self.deliver(image)
+                    self.report_stats(stats)
+                    frames += 1
+                    
+                    self.idle_wait(self.poll_interval)
+            
+            except Exception as e:
+                if frames == 0:
+                    if self.running:
+                        print(f"Ham screencap hatası: {e}")
+                    return False
+                # Oturum koptu - yeniden bağlan
+                if self.running:
+                    print(f"adb shell oturumu koptu, yeniden bağlanılıyor: {e}")
+                    self.idle_wait(1.0)
+            
+            finally:
+                # Oturum aşağıda kapatılır; GUI thread'i artık süreci görmez
+                self.set_stream_process(None)
+                session.close()
+        
+        return True
+    
+    def set_stream_process(self, process, group=False):
+        """Okuma thread'inin kullandığı akış sürecini kaydet (None: bırak)"""
+        with self._stream_lock:
+            self.stream_process = process
+            self._stream_group = group
+            if process and not self.running:
+                # stop() süreç kaydedilmeden önce çağrıldı
+                self.kill_stream(process, group)
+    
+    def stop_stream_process(self):
+        """
+        screenrecord sürecini sonlandır ve bekle (yalnızca okuma thread'inden)
+        Süreç bekleme öncesi bırakılır; GUI thread'i beklenmiş bir sürecin
+        (yeniden kullanılmış olabilecek) pid'ine sinyal göndermez.
+        """
+        with self._stream_lock:
+            process, group = self.stream_process, self._stream_group
+            self.stream_process = None
+        if process:
+            self.kill_stream(process, group)
+            process.wait()
+    
+    def interrupt_stream(self):
+        """Bloklanan okumayı çöz: akış sürecini öldür (beklemez, temizlemez)"""
+        with self._stream_lock:
+            if self.stream_process:
+                self.kill_stream(self.stream_process, self._stream_group)
+    
+    @staticmethod
+    def kill_stream(process, group):
+        try:
+            if group:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            # Süreç zaten sonlanmış
+            pass
+    
+    def report_stats(self, stats):
+        """Frame'i say, ölçüm aralığı dolduysa yayınla"""
+        summary = stats.frame()
+        if summary:
+            summary['dropped'] = self.frames_dropped
+            summary['skip_ratio'] = self.skip_ratio
+            self.stats_updated.emit(summary)
     
     def create_demo_screen(self):
         """Demo telefon ekranı oluştur"""
-        pixmap = QPixmap(1080, 1920)
-        pixmap.fill(QColor("#1a1a1a"))
+        image = QImage(1080, 1920, QImage.Format_RGB32)
+        image.fill(QColor("#1a1a1a"))
         
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Status bar
@@ -114,11 +681,15 @@ class PhoneMirrorThread(QThread):
         painter.drawText(50, 790, "4. USB Debug'u aç")
         
         painter.end()
-        return pixmap
+        return image
     
     def stop(self):
         """Thread'i durdur"""
         self.running = False
+        self.wake_event.set()
+        # Statik ekranda screenrecord frame üretmez, read() bloklanmasın;
+        # süreç okuma thread'inde beklenir ve temizlenir
+        self.interrupt_stream()
         self.wait()
 
 
@@ -161,13 +732,18 @@ class PhoneMirrorDialog(QDialog):
         title.setStyleSheet("font-size: 16px; font-weight: bold;")
         layout.addWidget(title)
         
-        # Ekran görüntüsü label'ı
-        self.screen_label = QLabel("Telefon bağlanıyor...")
+        # Ekran görüntüsü alanı (yalnızca değişen bölgeler yeniden çizilir)
+        self.screen_label = MirrorScreen("Telefon bağlanıyor...")
         self.screen_label.setAlignment(Qt.AlignCenter)
         self.screen_label.setStyleSheet("background-color: #2a2a2a; border-radius: 5px; min-height: 400px;")
         self.screen_label.setScaledContents(False)
         layout.addWidget(self.screen_label)
         
+        # Yansıtma performansı (mod, FPS, frame başına CPU)
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet("font-size: 11px; color: #888;")
+        layout.addWidget(self.stats_label)
+        
         # Butonlar
         btn_layout = QHBoxLayout()
         
@@ -188,82 +764,101 @@ class PhoneMirrorDialog(QDialog):
         
         # Mirror thread
         self.mirror_thread = None
+        
+        # Ortak asenkron adb istemcisi (arayüz thread'i bloklanmaz)
+        self.adb = AdbClient.shared()
+        self.closing = False
+        self.rotated = False
     
     def start_mirror(self):
-        """Telefon yansıtmasını başlat"""
-        adb_path = get_adb_path()
+        """Telefon yansıtmasını başlat (adb sorgusu arka planda yapılır)"""
+        self.start_btn.setEnabled(False)
+        self.screen_label.setText("Telefon bağlanıyor...")
+        self.closing = False
+        
+        # ADB kontrolü (sunucu kapalıysa istemci başlatır)
+        self.adb.devices(callback=self.on_devices_checked)
+    
+    def on_devices_checked(self, future):
+        """Cihaz listesi geldi - yansıtmayı başlat"""
+        if self.closing:
+            return
         
-        # ADB kontrolü
         adb_available = False
         try:
-            if adb_path:
-                # ADB daemon'u başlat
-                subprocess.run(
-                    [adb_path, 'start-server'],
-                    capture_output=True,
-                    timeout=5
-                )
-                
-                # Biraz bekle daemon başlansın
-                time.sleep(1)
-                
-                # Devices kontrol et
-                result = subprocess.run(
-                    [adb_path, 'devices'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                lines = result.stdout.strip().split('\n')
-                # En az bir device olup, "offline" olmadığını kontrol et
-                if len(lines) > 1:
-                    for line in lines[1:]:
-                        if 'device' in line and 'offline' not in line:
-                            adb_available = True
-                            break
-                
-                # Telefon ekranını yatay yap (landscape)
-                if adb_available:
-                    try:
-                        subprocess.run(
-                            [adb_path, 'shell', 'settings', 'put', 'system', 'user_rotation', '1'],
-                            capture_output=True,
-                            timeout=3
-                        )
-                        print("Telefon ekranı landscape'e döndürüldü")
-                    except Exception as e:
-                        print(f"Ekran rotate hatası: {e}")
-        
-        except subprocess.TimeoutExpired:
-            print("ADB timeout - DEMO MODE'a geçiliyor")
-            adb_available = False
+            devices = future.result()
+            # En az bir device olup, "offline" olmadığını kontrol et
+            adb_available = any(state == 'device' for state in devices.values())
         except Exception as e:
             print(f"ADB kontrol hatası: {e}")
-            adb_available = False
         
-        # Mirror thread'i başlat
-        self.mirror_thread = PhoneMirrorThread(use_demo=not adb_available)
-        self.mirror_thread.image_captured.connect(self.display_image)
-        self.mirror_thread.start()
+        # Telefon ekranını yatay yap (landscape)
+        if adb_available:
+            self.set_rotation(1)
         
         if adb_available:
             status_text = "📱 Telefon ekranı yansıtılıyor... (Landscape Modu)"
         else:
             status_text = "📱 DEMO MODE (ADB yüklü değil veya telefon bağlı değil)"
         
+        # Metin ilk frame gelene kadar görünür
         self.screen_label.setText(status_text)
-        self.start_btn.setEnabled(False)
+        
+        # Mirror thread'i başlat
+        self.mirror_thread = PhoneMirrorThread(use_demo=not adb_available)
+        self.update_target_size()
+        self.mirror_thread.image_captured.connect(self.display_image)
+        self.mirror_thread.stats_updated.connect(self.display_stats)
+        self.mirror_thread.start()
+        
         self.stop_btn.setEnabled(True)
     
-    def display_image(self, pixmap):
-        """Telefon ekran görüntüsünü göster"""
-        # Ekrana sığdır
-        scaled_pixmap = pixmap.scaledToWidth(
-            self.screen_label.width() - 20,
-            Qt.SmoothTransformation
+    def set_rotation(self, rotation):
+        """Telefon ekran yönünü ayarla (0: portrait, 1: landscape)"""
+        self.rotated = rotation != 0
+        self.adb.shell(
+            f"settings put system user_rotation {rotation}",
+            callback=lambda future: self.on_rotation_done(future, rotation)
+        )
+    
+    def on_rotation_done(self, future, rotation):
+        """Ekran yönü komutu tamamlandı"""
+        try:
+            future.result()
+            if rotation:
+                print("Telefon ekranı landscape'e döndürüldü")
+            else:
+                print("Telefon ekranı portrait'e döndürüldü")
+        except Exception as e:
+            print(f"Ekran rotate hatası: {e}")
+    
+    def display_image(self, image, dirty_rects):
+        """Telefon ekran görüntüsünü göster (ölçekleme thread'de yapıldı)"""
+        if not self.mirror_thread:
+            return
+        self.screen_label.show_frame(image, dirty_rects)
+        self.mirror_thread.frame_consumed()
+    
+    def update_target_size(self):
+        """Gösterim alanı boyutunu thread'e bildir"""
+        if self.mirror_thread:
+            self.mirror_thread.set_target_size(
+                self.screen_label.width() - 20,
+                self.screen_label.height() - 20
+            )
+    
+    def resizeEvent(self, event):
+        """Pencere boyutu değişince hedef boyutu güncelle"""
+        super().resizeEvent(event)
+        self.update_target_size()
+    
+    def display_stats(self, stats):
+        """Yansıtma performansını göster"""
+        self.stats_label.setText(
+            f"Mod: {stats['mode'].upper()} | {stats['fps']:.1f} FPS | "
+            f"{stats['cpu_ms']:.1f} ms CPU/frame | {stats['dropped']} frame atlandı | "
+            f"değişmeyen: %{stats['skip_ratio'] * 100:.0f}"
         )
-        self.screen_label.setPixmap(scaled_pixmap)
     
     def stop_mirror(self):
         """Telefon yansıtmasını durdur"""
@@ -272,17 +867,8 @@ class PhoneMirrorDialog(QDialog):
             self.mirror_thread = None
         
         # Telefon ekranını normal moda geri döndür (portrait)
-        adb_path = get_adb_path()
-        try:
-            if adb_path:
-                subprocess.run(
-                    [adb_path, 'shell', 'settings', 'put', 'system', 'user_rotation', '0'],
-                    capture_output=True,
-                    timeout=3
-                )
-                print("Telefon ekranı portrait'e döndürüldü")
-        except Exception as e:
-            print(f"Ekran rotate hatası: {e}")
+        if self.rotated:
+            self.set_rotation(0)
         
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -290,6 +876,8 @@ class PhoneMirrorDialog(QDialog):
     
     def closeEvent(self, event):
         """Dialog kapatılırken"""
+        # Yanıtı beklenen adb sorgusu yansıtmayı başlatmasın
+        self.closing = True
         if self.mirror_thread:
             self.mirror_thread.stop()
         event.accept()
@@ -0,0 +1,96 @@
+"""
+Görünüm durum makinesi
+Vites bilgisine göre harita / geri görüş kamerası geçişlerini yönetir.
+Yalnızca durum değiştiğinde işlem yapar. Geri vitese geçiş hemen uygulanır,
+geri vitesten çıkış ise kısa vites titreşimlerini (ör. R -> D -> R) filtrelemek
+için bekleme süresinden sonra uygulanır.
+"""
+
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class ViewState:
+    """Görünüm durumları"""
+    NORMAL = "normal"     # İleri vites: harita, kamera kapalı
+    STANDBY = "standby"   # Boş vites: harita, kamera arka planda hazır
+    REVERSE = "reverse"   # Geri vites: geri görüş kamerası
+
+
+class ViewStateMachine(QObject):
+    """
+    Histerezisli görünüm durum makinesi
+    - request() her telemetri frame'inde çağrılabilir, durum aynıysa maliyetsizdir
+    - REVERSE'e geçiş beklemeden yapılır (geri görüş gecikmemeli)
+    - REVERSE'ten çıkış, yeni durum hold_ms boyunca kesintisiz istenirse yapılır
+    - Her geçiş için karar ve uygulama süreleri ölçülür; requested_at son
+      uygulanan geçişin ilk istendiği an (vites değişimi) olarak saklanır
+    """
+
+    state_changed = Signal(str, str)  # eski durum, yeni durum
+
+    def __init__(self, hold_ms=150, parent=None):
+        super().__init__(parent)
+        self.hold_ms = hold_ms
+        self.state = None
+
+        self._pending = None
+        self._requested_at = 0.0
+        # Son uygulanan geçişin istendiği an (perf_counter)
+        self.requested_at = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._commit)
+
+        # Son geçişlerin ölçümleri
+        self.transitions = deque(maxlen=50)
+
+    def request(self, state):
+        """İstenen görünüm durumunu bildir"""
+        if state == self.state:
+            # Titreşim: mevcut duruma geri dönüldü, bekleyen geçişi iptal et
+            if self._pending is not None:
+                self._pending = None
+                self._timer.stop()
+            return
+
+        if state == self._pending:
+            return
+
+        self._pending = state
+        self._requested_at = time.perf_counter()
+
+        # Bekleme yalnızca geri vitesten çıkarken titreşimi filtreler;
+        # geri vitese (ve diğer durumlar arası) geçiş hemen uygulanır
+        if self.state == ViewState.REVERSE and self.hold_ms > 0:
+            self._timer.start(self.hold_ms)
+        else:
+            self._timer.stop()
+            self._commit()
+
+    def _commit(self):
+        """Bekleyen geçişi uygula ve ölç"""
+        if self._pending is None:
+            return
+
+        old_state, new_state = self.state, self._pending
+        self.state = new_state
+        self._pending = None
+        self.requested_at = self._requested_at
+
+        decided_at = time.perf_counter()
+        self.state_changed.emit(old_state or "", new_state)
+        applied_at = time.perf_counter()
+
+        metrics = {
+            'from': old_state,
+            'to': new_state,
+            'hold_ms': (decided_at - self._requested_at) * 1000.0,
+            'apply_ms': (applied_at - decided_at) * 1000.0
+        }
+        self.transitions.append(metrics)
+        print(f"Görünüm geçişi: {old_state} -> {new_state} "
+              f"(bekleme {metrics['hold_ms']:.0f} ms, uygulama {metrics['apply_ms']:.1f} ms)")
@@ -0,0 +1,552 @@
+"""
+WiFi arka uçları (NetworkManager)
+- DbusNetworkManagerBackend: D-Bus üzerinden, özellik değişikliği olaylarıyla
+- NmcliBackend: nmcli süreçleriyle (yedek)
+İkisi de aynı arayüzü sunar; sorgular arka plan thread'inde çalışır, sonuçlar
+sinyallerle arayüze iletilir. Arayüz thread'i hiçbir zaman NetworkManager'ı
+beklemez. Uygun arka uç create_wifi_backend() ile seçilir.
+"""
+
+import re
+import socket
+import struct
+import subprocess
+import time
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, SLOT
+
+try:
+    from PySide6.QtDBus import QDBus, QDBusConnection, QDBusMessage
+except ImportError:
+    # QtDBus olmayan platformlar: yalnızca nmcli
+    QDBus = QDBusConnection = QDBusMessage = None
+
+
+# nmcli -t çıktısında değer içindeki ':' karakteri '\:' olarak kaçırılır
+_TERSE_SEPARATOR = re.compile(r'(?<!\\):')
+
+
+def split_terse(line: str) -> list:
+    """nmcli -t satırını alanlara böl ve kaçışları kaldır"""
+    return [field.replace('\\:', ':').replace('\\\\', '\\')
+            for field in _TERSE_SEPARATOR.split(line)]
+
+
+def network_entry(ssid, signal, security, bssid) -> dict:
+    """Tarama sonucu kaydı"""
+    return {'ssid': ssid, 'signal': signal, 'security': security, 'bssid': bssid}
+
+
+def empty_status() -> dict:
+    """Bağlı değil durumu"""
+    return {
+        'connected': False,
+        'device': None,
+        'ssid': None,
+        'ip': None,
+        'signal': None,
+        'rate': None,
+        'error': None
+    }
+
+
+def interface_ipv4(name):
+    """Ağ arayüzünün IPv4 adresi (Linux SIOCGIFADDR), yoksa None"""
+    try:
+        import fcntl
+    except ImportError:
+        return None
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            data = fcntl.ioctl(sock.fileno(), 0x8915, struct.pack('256s', name[:15].encode()))
+        except OSError:
+            return None
+    return socket.inet_ntoa(data[20:24])
+
+
+class NmcliError(Exception):
+    """nmcli sıfırdan farklı çıkış kodu döndürdü"""
+
+
+class NetworkManagerError(Exception):
+    """NetworkManager D-Bus çağrısı hata döndürdü"""
+
+
+class WifiBackend(QObject):
+    """
+    WiFi arka uçlarının ortak arayüzü
+    - refresh_status(): durum + IP + sinyal; sonuç önbelleğe alınır ve
+      min_refresh_interval dolmadan yeniden sorgulanmaz
+    - scan(): erişim noktalarını listeler; radyo taraması en fazla
+      MIN_SCAN_INTERVAL'de bir yapılır, arada son sonuçlar döner
+    - connect_network(): ağa bağlanır
+    Aynı anda bekleyen ikinci bir durum sorgusu ya da tarama kuyruğa eklenmez.
+    Alt sınıflar _query_status, _scan ve _connect'i sağlar; temel sınıfın
+    kendisi WiFi yönetimi olmayan sistemler için boş bir arka uçtur.
+    """
+
+    status_updated = Signal(dict)          # empty_status() yapısında
+    networks_found = Signal(list)          # network_entry() listesi
+    connect_finished = Signal(bool, str)   # başarılı mı, mesaj
+
+    MIN_REFRESH_INTERVAL = 2.0
+    MIN_SCAN_INTERVAL = 10.0
+
+    # Durum değişiklikleri kendiliğinden bildiriliyorsa periyodik yenileme gerekmez
+    event_driven = False
+
+    def __init__(self, min_refresh_interval=MIN_REFRESH_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.min_refresh_interval = min_refresh_interval
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='wifi')
+        # shutdown() sonrası gelen istekler (zamanlayıcı, D-Bus olayı) yok sayılır
+        self._closed = False
+
+        # Durum önbelleği
+        self.status = None
+        self._status_time = 0.0
+        self._status_pending = False
+
+        # Tarama sınırlama
+        self._scan_pending = False
+        self._last_rescan = -self.MIN_SCAN_INTERVAL
+
+    # --- Genel arayüz (arayüz thread'inden çağrılır, bloklamaz) ---
+
+    def refresh_status(self, force=False):
+        """Bağlantı durumunu güncelle"""
+        if self._closed:
+            return
+        fresh = time.monotonic() - self._status_time < self.min_refresh_interval
+        if self.status is not None and fresh and not force:
+            # Önbellekteki sonuç yeterince yeni
+            self.status_updated.emit(self.status)
+            return
+
+        if self._status_pending:
+            return
+        self._status_pending = True
+        self._submit(self._refresh_status)
+
+    def scan(self):
+        """WiFi ağlarını tara (sonuç networks_found ile gelir)"""
+        if self._closed or self._scan_pending:
+            return
+        self._scan_pending = True
+
+        now = time.monotonic()
+        rescan = now - self._last_rescan >= self.MIN_SCAN_INTERVAL
+        if rescan:
+            self._last_rescan = now
+        self._start_scan(rescan)
+
+    def _start_scan(self, rescan):
+        self._submit(self._scan, rescan)
+
+    def connect_network(self, ssid: str, password: str):
+        """Ağa bağlan"""
+        self._submit(self._connect, ssid, password)
+
+    def shutdown(self):
+        """Bekleyen işleri iptal et (sonraki çağrılar etkisizdir)"""
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, function, *args):
+        """İşi arka plan thread'ine gönder (kapatıldıysa hiçbir şey yapma)"""
+        if not self._closed:
+            self._executor.submit(function, *args)
+
+    # --- Arka plan thread'inde çalışır ---
+
+    def _refresh_status(self):
+        try:
+            status = self._query_status()
+        except Exception as e:
+            print("Durum hatası:", e)
+            status = empty_status()
+            status['error'] = str(e)
+
+        self.status = status
+        self._status_time = time.monotonic()
+        self._status_pending = False
+        self.status_updated.emit(status)
+
+    # Varsayılanlar WiFi yönetimi olmayan bir sistemi tanımlar: bağlı değil,
+    # ağ yok, bağlanılamaz. Alt sınıflar gerçek sorguyla değiştirir.
+
+    def _query_status(self) -> dict:
+        return empty_status()
+
+    def _scan(self, rescan):
+        self._finish_scan([])
+
+    def _finish_scan(self, networks):
+        self._scan_pending = False
+        self.networks_found.emit(networks)
+
+    def _connect(self, ssid, password):
+        self.connect_finished.emit(False, "WiFi yönetimi desteklenmiyor")
+
+
+class NmcliBackend(WifiBackend):
+    """nmcli süreçleri ile çalışan arka uç (D-Bus yoksa yedek)"""
+
+    def __init__(self, nmcli_path='nmcli', min_refresh_interval=WifiBackend.MIN_REFRESH_INTERVAL,
+                 parent=None):
+        super().__init__(min_refresh_interval, parent)
+        # Testlerde sahte bir nmcli gösterilebilir (tools/fake_nmcli.py)
+        self.nmcli_path = nmcli_path
+
+    def _run(self, *args, timeout=5) -> str:
+        result = subprocess.run(
+            [self.nmcli_path, *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        if result.returncode != 0:
+            raise NmcliError(result.stderr.strip() or f"nmcli çıkış kodu {result.returncode}")
+        return result.stdout
+
+    def _query_status(self) -> dict:
+        """
+        Tek nmcli sorgusu: kullanımdaki erişim noktasının cihazı, SSID'si,
+        sinyal gücü ve hızı (yeniden tarama yapılmaz). IP adresi süreç
+        başlatmadan doğrudan ağ arayüzünden okunur.
+        """
+        output = self._run(
+            '-t', '-f', 'IN-USE,DEVICE,SSID,SIGNAL,RATE', 'device', 'wifi', 'list',
+            '--rescan', 'no'
+        )
+
+        status = empty_status()
+        for line in output.splitlines():
+            fields = split_terse(line)
+            if len(fields) >= 5 and fields[0] == '*':
+                status['connected'] = True
+                status['device'] = fields[1]
+                status['ssid'] = fields[2] or None
+                status['signal'] = int(fields[3]) if fields[3].isdigit() else None
+                status['rate'] = fields[4]
+                status['ip'] = interface_ipv4(fields[1])
+                break
+
+        return status
+
+    def _scan(self, rescan):
+        networks = []
+        try:
+            output = self._run(
+                '-t', '-f', 'SSID,BSSID,SIGNAL,SECURITY', 'device', 'wifi', 'list',
+                '--rescan', 'yes' if rescan else 'no', timeout=15
+            )
+
+            for line in output.splitlines():
+                fields = split_terse(line)
+                if len(fields) < 4:
+                    continue
+                ssid, bssid, signal, security = fields[:4]
+                ssid = ssid.strip()
+                if ssid and ssid != '--':
+                    networks.append(network_entry(
+                        ssid, int(signal) if signal.isdigit() else 0,
+                        '' if security == '--' else security, bssid
+                    ))
+
+        except Exception as e:
+            print("WiFi tarama hatası:", e)
+
+        self._finish_scan(networks)
+
+    def _connect(self, ssid, password):
+        try:
+            self._run('device', 'wifi', 'connect', ssid, 'password', password, timeout=20)
+        except subprocess.TimeoutExpired:
+            self.connect_finished.emit(False, "Bağlantı zaman aşımı")
+            return
+        except Exception as e:
+            self.connect_finished.emit(False, str(e))
+            return
+
+        self.connect_finished.emit(True, f"{ssid} ağına bağlanıldı")
+        # Yeni durumu önbelleği atlayarak al
+        self._status_pending = True
+        self._refresh_status()
+
+
+# ==================================================
+# D-Bus
+# ==================================================
+NM_SERVICE = 'org.freedesktop.NetworkManager'
+NM_PATH = '/org/freedesktop/NetworkManager'
+NM_DEVICE = NM_SERVICE + '.Device'
+NM_WIRELESS = NM_DEVICE + '.Wireless'
+NM_ACCESS_POINT = NM_SERVICE + '.AccessPoint'
+NM_ACTIVE_CONNECTION = NM_SERVICE + '.Connection.Active'
+DBUS_PROPERTIES = 'org.freedesktop.DBus.Properties'
+DBUS_INTROSPECTABLE = 'org.freedesktop.DBus.Introspectable'
+
+NM_DEVICE_TYPE_WIFI = 2
+NM_DEVICE_STATE_ACTIVATED = 100
+
+
+def format_bitrate(kbit):
+    """NetworkManager bit hızı (kbit/s) -> nmcli biçimi"""
+    return f"{kbit // 1000} Mbit/s" if kbit else None
+
+
+class DbusNetworkManagerBackend(WifiBackend):
+    """
+    NetworkManager D-Bus arka ucu
+    - Süreç başlatılmaz, özellikler doğrudan D-Bus'tan okunur
+    - PropertiesChanged sinyallerine abone olur: sinyal gücü, bit hızı ve
+      durum değişiklikleri anında status_updated ile bildirilir
+    - Cihaz ve erişim noktası listeleri introspection ile alınır (PySide'ın
+      QtDBus'ı 'ao' dizilerini çözemiyor)
+    - Bağlanma nmcli'ye devredilir (bağlantı ayarları iç içe sözlük ister)
+    Testlerde bus olarak sahte NetworkManager çalıştıran oturum veri yolu
+    verilebilir (tools/mock_networkmanager.py).
+    """
+
+    event_driven = True
+
+    DBUS_TIMEOUT_MS = 2000
+    SCAN_TIMEOUT_MS = 10000
+
+    @staticmethod
+    def available(bus=None) -> bool:
+        """NetworkManager D-Bus üzerinden erişilebilir mi?"""
+        if QDBusConnection is None:
+            return False
+        bus = bus if bus is not None else QDBusConnection.systemBus()
+        if not bus.isConnected():
+            return False
+        reply = bus.interface().isServiceRegistered(NM_SERVICE)
+        return reply.isValid() and bool(reply.value())
+
+    def __init__(self, bus=None, nmcli_path='nmcli',
+                 min_refresh_interval=WifiBackend.MIN_REFRESH_INTERVAL, parent=None):
+        super().__init__(min_refresh_interval, parent)
+        self.bus = bus if bus is not None else QDBusConnection.systemBus()
+
+        # Bağlanma işlemi için
+        self._nmcli = NmcliBackend(nmcli_path, parent=self)
+        self._nmcli.connect_finished.connect(self._on_connect_finished)
+
+        # Arka plan thread'inde bulunur, arayüz thread'inde yalnızca okunur
+        self._device_path = None
+        self._active_ap = None
+
+        # Tarama: LastScan değişince ya da zaman aşımında liste alınır
+        self._awaiting_scan = False
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setSingleShot(True)
+        self._scan_timer.timeout.connect(self._list_networks)
+
+        # Erişim noktası nesnesi yolu -> (ssid, bssid, güvenlik); bunlar
+        # nesne ömrü boyunca değişmez, her taramada yalnızca güç okunur
+        self._access_points = {}
+
+        self.bus.connect(
+            NM_SERVICE, '', DBUS_PROPERTIES, 'PropertiesChanged', self,
+            SLOT('_on_properties_changed(QString,QVariantMap,QStringList,QDBusMessage)')
+        )
+
+    # --- Genel arayüz ---
+
+    def _start_scan(self, rescan):
+        """Yeniden tarama iste; sonuçlar tarama bitince gelir"""
+        if not rescan:
+            self._submit(self._emit_networks)
+            return
+        self._awaiting_scan = True
+        self._scan_timer.start(self.SCAN_TIMEOUT_MS)
+        self._submit(self._scan, rescan)
+
+    def connect_network(self, ssid: str, password: str):
+        self._nmcli.connect_network(ssid, password)
+
+    def shutdown(self):
+        self.bus.disconnect(
+            NM_SERVICE, '', DBUS_PROPERTIES, 'PropertiesChanged', self,
+            SLOT('_on_properties_changed(QString,QVariantMap,QStringList,QDBusMessage)')
+        )
+        self._scan_timer.stop()
+        self._nmcli.shutdown()
+        super().shutdown()
+
+    # --- Olaylar (arayüz thread'i) ---
+
+    @Slot(str, 'QVariantMap', 'QStringList', 'QDBusMessage')
+    def _on_properties_changed(self, interface, changed, invalidated, message):
+        """NetworkManager nesnesinin özellikleri değişti"""
+        path = message.path()
+
+        if interface == NM_ACCESS_POINT and path == self._active_ap:
+            if 'Strength' in changed:
+                self._update_status(signal=int(changed['Strength']))
+
+        elif interface == NM_WIRELESS and path == self._device_path:
+            if 'Bitrate' in changed:
+                self._update_status(rate=format_bitrate(int(changed['Bitrate'])))
+            if 'ActiveAccessPoint' in changed:
+                self.refresh_status(force=True)
+            if 'LastScan' in changed and self._awaiting_scan:
+                self._scan_timer.stop()
+                self._list_networks()
+
+        elif interface == NM_DEVICE and path == self._device_path:
+            if {'State', 'Ip4Config', 'ActiveConnection'} & set(changed):
+                self.refresh_status(force=True)
+
+    def _update_status(self, **fields):
+        """Önbellekteki durumu sorgusuz güncelle ve yayınla"""
+        if not self.status or not self.status['connected']:
+            return
+        status = dict(self.status)
+        status.update(fields)
+        self.status = status
+        self.status_updated.emit(status)
+
+    def _list_networks(self):
+        self._awaiting_scan = False
+        self._submit(self._emit_networks)
+
+    def _on_connect_finished(self, success, message):
+        self.connect_finished.emit(success, message)
+        if success:
+            self.refresh_status(force=True)
+
+    # --- D-Bus (arka plan thread'inde çalışır) ---
+
+    def _call(self, path, interface, method, *args):
+        message = QDBusMessage.createMethodCall(NM_SERVICE, path, interface, method)
+        if args:
+            message.setArguments(list(args))
+        reply = self.bus.call(message, QDBus.Block, self.DBUS_TIMEOUT_MS)
+        if reply.type() == QDBusMessage.ErrorMessage:
+            raise NetworkManagerError(reply.errorMessage())
+        return reply.arguments()
+
+    def _get(self, path, interface, name):
+        """Özellik değeri (nesne yolu -> str, byte dizisi -> bytes)"""
+        value = self._call(path, DBUS_PROPERTIES, 'Get', interface, name)[0]
+        if hasattr(value, 'variant'):
+            value = value.variant()
+        if hasattr(value, 'path'):
+            value = value.path()
+        elif hasattr(value, 'data'):
+            value = bytes(value.data())
+        return value
+
+    def _children(self, path) -> list:
+        """Yolun altındaki nesneler"""
+        xml = self._call(path, DBUS_INTROSPECTABLE, 'Introspect')[0]
+        root = ElementTree.fromstring(xml)
+        return [f"{path}/{node.get('name')}" for node in root.findall('node')]
+
+    def _find_device(self):
+        if self._device_path is None:
+            for path in self._children(NM_PATH + '/Devices'):
+                if self._get(path, NM_DEVICE, 'DeviceType') == NM_DEVICE_TYPE_WIFI:
+                    self._device_path = path
+                    break
+        return self._device_path
+
+    def _query_status(self) -> dict:
+        status = empty_status()
+        device = self._find_device()
+        if not device:
+            return status
+
+        self._active_ap = None
+        if self._get(device, NM_DEVICE, 'State') != NM_DEVICE_STATE_ACTIVATED:
+            return status
+
+        status['connected'] = True
+        status['device'] = self._get(device, NM_DEVICE, 'Interface')
+
+        connection = self._get(device, NM_DEVICE, 'ActiveConnection')
+        if connection and connection != '/':
+            status['ssid'] = self._get(connection, NM_ACTIVE_CONNECTION, 'Id')
+
+        access_point = self._get(device, NM_WIRELESS, 'ActiveAccessPoint')
+        if access_point and access_point != '/':
+            self._active_ap = access_point
+            status['signal'] = int(self._get(access_point, NM_ACCESS_POINT, 'Strength'))
+
+        status['rate'] = format_bitrate(self._get(device, NM_WIRELESS, 'Bitrate'))
+        status['ip'] = interface_ipv4(status['device'])
+        return status
+
+    def _scan(self, rescan):
+        try:
+            device = self._find_device()
+            if not device:
+                raise NetworkManagerError("WiFi cihazı bulunamadı")
+            self._call(device, NM_WIRELESS, 'RequestScan', {})
+        except Exception as e:
+            # Ör. yeni bitmiş taramanın hemen ardından reddedilir:
+            # mevcut sonuçları gönder
+            print("WiFi tarama isteği:", e)
+            self._emit_networks()
+
+    def _emit_networks(self):
+        networks = []
+        try:
+            paths = self._children(NM_PATH + '/AccessPoint')
+
+            # Kaybolan erişim noktalarını unut
+            for path in set(self._access_points) - set(paths):
+                del self._access_points[path]
+
+            for path in paths:
+                info = self._access_points.get(path)
+                if info is None:
+                    info = self._access_point_info(path)
+                    self._access_points[path] = info
+                ssid, bssid, security = info
+                if ssid:
+                    strength = int(self._get(path, NM_ACCESS_POINT, 'Strength'))
+                    networks.append(network_entry(ssid, strength, security, bssid))
+
+        except Exception as e:
+            print("WiFi tarama hatası:", e)
+
+        self._finish_scan(networks)
+
+    def _access_point_info(self, path):
+        """Erişim noktasının değişmeyen bilgileri"""
+        ssid = self._get(path, NM_ACCESS_POINT, 'Ssid').decode('utf-8', errors='replace')
+        bssid = self._get(path, NM_ACCESS_POINT, 'HwAddress')
+
+        # NM_802_11_AP_SEC_* bayrakları
+        rsn = self._get(path, NM_ACCESS_POINT, 'RsnFlags')
+        wpa = self._get(path, NM_ACCESS_POINT, 'WpaFlags')
+        privacy = self._get(path, NM_ACCESS_POINT, 'Flags') & 0x1
+
+        security = []
+        if wpa:
+            security.append("WPA1")
+        if rsn & 0x400:
+            security.append("WPA3")
+        elif rsn:
+            security.append("WPA2")
+        if not security and privacy:
+            security.append("WEP")
+        return ssid, bssid, " ".join(security)
+
+
+def create_wifi_backend(bus=None, parent=None) -> WifiBackend:
+    """NetworkManager D-Bus'ta varsa olay tabanlı arka uç, yoksa nmcli"""
+    try:
+        if DbusNetworkManagerBackend.available(bus):
+            return DbusNetworkManagerBackend(bus=bus, parent=parent)
+    except Exception as e:
+        print("D-Bus arka ucu kullanılamıyor:", e)
+    return NmcliBackend(parent=parent)
@@ -1,40 +1,148 @@
-import subprocess
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QLineEdit, QMessageBox
+    QListView, QLineEdit, QMessageBox
 )
-from PySide6.QtCore import QTimer, Signal, QThread
+from PySide6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex
+from bisect import bisect_left
+
+from ui.wifi_backend import create_wifi_backend
 
 
 # ==================================================
-# WiFi Tarama Thread
+# WiFi Ağ Listesi Modeli
 # ==================================================
-class WiFiScannerThread(QThread):
-    networks_found = Signal(list)
-
-    def run(self):
-        try:
-            result = subprocess.run(
-                ['nmcli', '-t', '-f', 'IN-USE,SSID', 'device', 'wifi', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            networks = []
-            for line in result.stdout.splitlines():
-                if not line:
-                    continue
-                _, ssid = line.split(':', 1)
-                ssid = ssid.strip()
-                if ssid and ssid != '--':
-                    networks.append(ssid)
+class WiFiNetworkModel(QAbstractListModel):
+    """
+    Sinyal gücüne göre sıralı ağ listesi
+    Her taramada liste baştan kurulmaz; yalnızca kaybolan satırlar silinir,
+    yeni satırlar eklenir, yeri değişenler taşınır ve değeri değişenler
+    güncellenir. Seçim ve kaydırma konumu korunur.
+    Sıralamayı koruyan en uzun satır dizisi (LIS) yerinde kalır, yalnızca
+    geri kalan satırlar taşınır.
+    Aynı SSID'yi yayınlayan erişim noktalarından en güçlüsü gösterilir.
+    """
+
+    SsidRole = Qt.UserRole + 1
+    SignalRole = Qt.UserRole + 2
+    SecurityRole = Qt.UserRole + 3
+    BssidRole = Qt.UserRole + 4
+
+    # Sıralamada aynı sayılan sinyal aralığı (%)
+    SIGNAL_BAND = 10
+
+    _ROLES = {Qt.DisplayRole, SsidRole, SignalRole, SecurityRole, BssidRole}
 
-            self.networks_found.emit(sorted(set(networks)))
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._networks = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._networks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Görünüm her satır için birçok rol sorar; kullanılmayanları hemen geç
+        if role not in self._ROLES or not index.isValid():
+            return None
+        network = self._networks[index.row()]
+
+        if role == Qt.DisplayRole:
+            lock = "🔒" if network['security'] else "🔓"
+            return f"📶 {network['ssid']}   {network['signal']}%  {lock}"
+        if role == self.SsidRole:
+            return network['ssid']
+        if role == self.SignalRole:
+            return network['signal']
+        if role == self.SecurityRole:
+            return network['security']
+        if role == self.BssidRole:
+            return network['bssid']
+        return None
+
+    def update_networks(self, networks):
+        """Yeni tarama sonucunu farkları ile uygula"""
+        strongest = {}
+        for network in networks:
+            current = strongest.get(network['ssid'])
+            if current is None or network['signal'] > current['signal']:
+                strongest[network['ssid']] = network
+        target = sorted(strongest.values(), key=self._sort_key)
+
+        # Artık görünmeyen ağları sil (indeksler kaymasın diye sondan başa)
+        for row in range(len(self._networks) - 1, -1, -1):
+            if self._networks[row]['ssid'] not in strongest:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._networks[row]
+                self.endRemoveRows()
+
+        # Yerinde kalacak satırlar: hedef sıralarının en uzun artan alt dizisi
+        position = {network['ssid']: row for row, network in enumerate(target)}
+        stable = self._longest_increasing(
+            [position[network['ssid']] for network in self._networks])
+        movers = {network['ssid'] for row, network in enumerate(self._networks)
+                  if row not in stable}
+
+        for row, network in enumerate(target):
+            ssid = network['ssid']
+
+            while row >= len(self._networks) or self._networks[row]['ssid'] != ssid:
+                source = self._find(ssid, row + 1)
+                if source is None:
+                    # Yeni ağ
+                    self.beginInsertRows(QModelIndex(), row, row)
+                    self._networks.insert(row, network)
+                    self.endInsertRows()
+                elif ssid in movers:
+                    # Yeri değişen ağı buraya çek
+                    self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+                    self._networks.insert(row, self._networks.pop(source))
+                    self.endMoveRows()
+                else:
+                    # Sabit satırın önündeki taşınacak satırı sona it
+                    # (kendi sırası gelince yerine çekilir)
+                    end = len(self._networks)
+                    self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), end)
+                    self._networks.append(self._networks.pop(row))
+                    self.endMoveRows()
+
+            if self._networks[row] != network:
+                self._networks[row] = network
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def _sort_key(self, network):
+        # Sinyal bantlara bölünür: ölçüm titreşimi satırları sürekli oynatmasın
+        return (-(network['signal'] // self.SIGNAL_BAND), network['ssid'])
+
+    def _find(self, ssid, start):
+        for row in range(start, len(self._networks)):
+            if self._networks[row]['ssid'] == ssid:
+                return row
+        return None
+
+    @staticmethod
+    def _longest_increasing(values):
+        """En uzun artan alt dizinin indeksleri (O(n log n))"""
+        tails = []          # uzunluk k+1 olan dizilerin en küçük son değeri
+        tail_rows = []      # bu değerlerin indeksleri
+        previous = [-1] * len(values)
+
+        for row, value in enumerate(values):
+            k = bisect_left(tails, value)
+            if k:
+                previous[row] = tail_rows[k - 1]
+            if k == len(tails):
+                tails.append(value)
+                tail_rows.append(row)
+            else:
+                tails[k] = value
+                tail_rows[k] = row
 
-        except Exception as e:
-            print("WiFi tarama hatası:", e)
-            self.networks_found.emit([])
+        rows = set()
+        row = tail_rows[-1] if tail_rows else -1
+        while row >= 0:
+            rows.add(row)
+            row = previous[row]
+        return rows
 
 
 # ==================================================
@@ -58,7 +166,7 @@ class WiFiManagerDialog(QDialog):
                 font-weight: bold;
             }
             QPushButton:hover { background-color: #0088cc; }
-            QListWidget {
+            QListView {
                 background-color: #2a2a2a;
                 color: white;
                 border: 1px solid #00aaff;
@@ -91,8 +199,12 @@ class WiFiManagerDialog(QDialog):
         layout.addLayout(status_layout)
 
         # ---------- WiFi List ----------
-        layout.addWidget(QLabel("Mevcut WiFi Ağları:"))
-        self.networks_list = QListWidget()
+        self.networks_title = QLabel("Mevcut WiFi Ağları:")
+        layout.addWidget(self.networks_title)
+        self.networks_model = WiFiNetworkModel(self)
+        self.networks_list = QListView()
+        self.networks_list.setModel(self.networks_model)
+        self.networks_list.setUniformItemSizes(True)
         layout.addWidget(self.networks_list)
 
         # ---------- Connect ----------
@@ -123,11 +235,25 @@ class WiFiManagerDialog(QDialog):
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
 
+        # ---------- Backend ----------
+        # NetworkManager D-Bus (olay tabanlı) ya da nmcli (yedek);
+        # sorgular arka planda çalışır, sonuçlar sinyallerle gelir
+        self.backend = create_wifi_backend(parent=self)
+        self.backend.status_updated.connect(self.show_status)
+        self.backend.networks_found.connect(self.display_networks)
+        self.backend.connect_finished.connect(self.on_connect_finished)
+
         # ---------- Timer ----------
-        self.scanner_thread = None
+        # İlk taramadan sonra liste arka planda güncel tutulur
+        # (radyo taraması backend tarafından sınırlandırılır)
+        self.scan_timer = QTimer(self)
+        self.scan_timer.timeout.connect(self.backend.scan)
+
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.refresh_status)
-        self.update_timer.start(5000)
+        if not self.backend.event_driven:
+            # D-Bus değişiklikleri kendisi bildirir, yalnızca nmcli'de yokla
+            self.update_timer.start(5000)
 
         self.refresh_status()
 
@@ -136,139 +262,87 @@ class WiFiManagerDialog(QDialog):
     # ==================================================
     def scan_networks(self):
         self.scan_btn.setEnabled(False)
-        self.networks_list.clear()
-        self.networks_list.addItem("⏳ Ağlar taranıyor...")
+        self.networks_title.setText("Mevcut WiFi Ağları: ⏳ taranıyor...")
 
-        self.scanner_thread = WiFiScannerThread()
-        self.scanner_thread.networks_found.connect(self.display_networks)
-        self.scanner_thread.start()
+        self.backend.scan()
+        self.scan_timer.start(15000)
 
     def display_networks(self, networks):
-        self.networks_list.clear()
+        self.networks_model.update_networks(networks)
         if not networks:
-            self.networks_list.addItem("❌ Ağ bulunamadı")
+            self.networks_title.setText("Mevcut WiFi Ağları: ❌ Ağ bulunamadı")
         else:
-            for ssid in networks:
-                self.networks_list.addItem(QListWidgetItem(f"📶 {ssid}"))
+            self.networks_title.setText(f"Mevcut WiFi Ağları: {self.networks_model.rowCount()}")
         self.scan_btn.setEnabled(True)
 
     # ==================================================
     # Connect
     # ==================================================
     def connect_to_network(self):
-        item = self.networks_list.currentItem()
-        if not item:
+        index = self.networks_list.currentIndex()
+        if not index.isValid():
             QMessageBox.warning(self, "Hata", "Bir ağ seçin")
             return
 
-        ssid = item.text().replace("📶", "").strip()
+        ssid = index.data(WiFiNetworkModel.SsidRole)
         password = self.password_input.text()
 
         if not password:
             QMessageBox.warning(self, "Hata", "Parola girin")
             return
 
-        try:
-            self.connect_btn.setEnabled(False)
-            self.connect_btn.setText("Bağlanıyor...")
+        self.connect_btn.setEnabled(False)
+        self.connect_btn.setText("Bağlanıyor...")
+        self.backend.connect_network(ssid, password)
 
-            result = subprocess.run(
-                ['nmcli', 'device', 'wifi', 'connect', ssid, 'password', password],
-                capture_output=True,
-                text=True,
-                timeout=20
-            )
-
-            if result.returncode == 0:
-                QMessageBox.information(self, "Başarılı", f"{ssid} ağına bağlanıldı")
-                self.refresh_status()
-            else:
-                QMessageBox.critical(self, "Bağlantı Hatası", result.stderr)
-
-        except subprocess.TimeoutExpired:
-            QMessageBox.critical(self, "Hata", "Bağlantı zaman aşımı")
+    def on_connect_finished(self, success, message):
+        if success:
+            QMessageBox.information(self, "Başarılı", message)
+        else:
+            QMessageBox.critical(self, "Bağlantı Hatası", message)
 
-        finally:
-            self.connect_btn.setEnabled(True)
-            self.connect_btn.setText("Bağlan")
+        self.connect_btn.setEnabled(True)
+        self.connect_btn.setText("Bağlan")
 
     # ==================================================
     # Status (GERÇEK BAĞLANTI KONTROLÜ)
     # ==================================================
     def refresh_status(self):
-        try:
-            result = subprocess.run(
-                ['nmcli', '-t', '-f', 'DEVICE,TYPE,STATE,CONNECTION', 'device'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            wifi_name = None
-
-            for line in result.stdout.splitlines():
-                if not line:
-                    continue
-
-                device, dtype, state, connection = line.split(':', 3)
+        # Bloklamaz; sonuç show_status'a gelir
+        self.backend.refresh_status()
 
-                if dtype == 'wifi' and state == 'connected':
-                    wifi_name = connection
-                    break
-
-            if wifi_name:
-                self.status_label.setText(f"🟢 Bağlı: {wifi_name}")
-                self.status_label.setStyleSheet("color: #00ff88;")
-                self.update_stats()
-            else:
-                self.status_label.setText("🔴 Bağlı değil")
-                self.status_label.setStyleSheet("color: #ff4444;")
-                self.stats_label.setText(
-                    "IP Adresi: -\nSignal Gücü: -\nBağlantı Hızı: -"
-                )
-
-        except Exception as e:
-            print("Durum hatası:", e)
+    def show_status(self, status):
+        if status['error']:
             self.status_label.setText("❓ Durum okunamadı")
+            return
 
-    # ==================================================
-    # Stats
-    # ==================================================
-    def update_stats(self):
-        try:
-            result = subprocess.run(
-                ['nmcli', '-t', '-f', 'DEVICE,TYPE,IP4.ADDRESS,SIGNAL', 'device'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            ip = "-"
-            signal = "-"
-
-            for line in result.stdout.splitlines():
-                if not line:
-                    continue
-
-                device, dtype, ip_addr, sig = line.split(':', 3)
-
-                if dtype == 'wifi' and ip_addr:
-                    ip = ip_addr
-                    signal = sig + "%"
-                    break
-
+        if status['connected']:
+            self.status_label.setText(f"🟢 Bağlı: {status['ssid']}")
+            self.status_label.setStyleSheet("color: #00ff88;")
+            self.update_stats(status)
+        else:
+            self.status_label.setText("🔴 Bağlı değil")
+            self.status_label.setStyleSheet("color: #ff4444;")
             self.stats_label.setText(
-                f"IP Adresi: {ip}\n"
-                f"Signal Gücü: {signal}\n"
-                f"Bağlantı Hızı: WiFi"
+                "IP Adresi: -\nSignal Gücü: -\nBağlantı Hızı: -"
             )
 
-        except Exception as e:
-            print("Stats hatası:", e)
+    # ==================================================
+    # Stats
+    # ==================================================
+    def update_stats(self, status):
+        ip = status['ip'] or "-"
+        signal = f"{status['signal']}%" if status['signal'] is not None else "-"
+        rate = status['rate'] or "-"
+
+        self.stats_label.setText(
+            f"IP Adresi: {ip}\n"
+            f"Signal Gücü: {signal}\n"
+            f"Bağlantı Hızı: {rate}"
+        )
 
     def closeEvent(self, event):
         self.update_timer.stop()
-        if self.scanner_thread and self.scanner_thread.isRunning():
-            self.scanner_thread.quit()
-            self.scanner_thread.wait()
+        self.scan_timer.stop()
+        self.backend.shutdown()
         event.accept()